@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+benchmarks/bench_serve.py
+
+Local load test for `civic-usa serve`.
+
+Starts the data server in-process on an ephemeral port, then runs
+concurrent keep-alive clients that:
+- GET files listed in data-out/index.json (full and ranged requests)
+- optionally GET /query?bbox=... for random bboxes inside the data extent
+
+Reports requests/s, MB/s, and latency percentiles, and writes them to
+data-reports/bench-serve.json.
+
+Usage:
+    python benchmarks/bench_serve.py --concurrency 32 --requests 200
+    python benchmarks/bench_serve.py --root /path/to/data-out --queries 20
+
+MIT License — maintained by Civic Interconnect
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+from civic_data_boundaries_us_forests.serve import DataServer
+from civic_data_boundaries_us_forests.utils.get_paths import get_data_out_dir, get_reports_dir
+
+
+async def read_response(reader: asyncio.StreamReader) -> tuple[int, int]:
+    """
+    Read one HTTP/1.1 response and return (status, body bytes).
+    """
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split(" ", 2)[1])
+    headers = {
+        name.strip().lower(): value.strip()
+        for name, _, value in (line.partition(":") for line in lines[1:] if line)
+    }
+
+    if headers.get("transfer-encoding") == "chunked":
+        total = 0
+        while True:
+            size = int((await reader.readuntil(b"\r\n")).strip(), 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                return status, total
+            total += size
+
+    length = int(headers.get("content-length", 0))
+    await reader.readexactly(length)
+    return status, length
+
+
+async def client(
+    port: int,
+    targets: list[tuple[str, dict[str, str]]],
+    latencies: list[float],
+    counters: dict[str, int],
+) -> None:
+    """
+    Send each target over one keep-alive connection.
+    """
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        for path, extra in targets:
+            header_lines = "".join(f"{k}: {v}\r\n" for k, v in extra.items())
+            request = f"GET {path} HTTP/1.1\r\nHost: localhost\r\n{header_lines}\r\n"
+            start = time.perf_counter()
+            writer.write(request.encode("latin-1"))
+            await writer.drain()
+            status, nbytes = await read_response(reader)
+            latencies.append(time.perf_counter() - start)
+            counters["bytes"] += nbytes
+            counters[f"status_{status}"] = counters.get(f"status_{status}", 0) + 1
+    finally:
+        writer.close()
+
+
+def build_targets(
+    index: list[dict],
+    requests: int,
+    queries: int,
+    rng: random.Random,
+) -> list[tuple[str, dict[str, str]]]:
+    """
+    Pick a random mix of full, ranged, and bbox query requests.
+    """
+    files = [
+        "/" + e["path"].removeprefix("data-out/")
+        for e in index
+        if e["path"].startswith("data-out/")
+    ]
+    boxes = [e["bbox"] for e in index if e.get("bbox")]
+
+    targets: list[tuple[str, dict[str, str]]] = []
+    for i in range(requests):
+        headers = {"Range": "bytes=0-65535"} if i % 4 == 3 else {}
+        targets.append((rng.choice(files), headers))
+    for _ in range(queries):
+        minx, miny, maxx, maxy = rng.choice(boxes)
+        targets.append((f"/query?bbox={minx},{miny},{maxx},{maxy}", {}))
+    rng.shuffle(targets)
+    return targets
+
+
+async def run(root: Path, concurrency: int, requests: int, queries: int, seed: int) -> dict:
+    """
+    Start the server, run all clients, and return the measurements.
+    """
+    server = DataServer(root)
+    index = json.loads((server.root / "index.json").read_text(encoding="utf-8"))
+    rng = random.Random(seed)
+
+    tcp_server = await asyncio.start_server(server.handle, "127.0.0.1", 0)
+    port = tcp_server.sockets[0].getsockname()[1]
+
+    per_client = [build_targets(index, requests, queries, rng) for _ in range(concurrency)]
+    latencies: list[float] = []
+    counters = {"bytes": 0}
+
+    async with tcp_server:
+        start = time.perf_counter()
+        await asyncio.gather(*(client(port, t, latencies, counters) for t in per_client))
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    total = len(latencies)
+    return {
+        "generated_at": datetime.now(UTC).isoformat(),
+        "root": str(server.root),
+        "concurrency": concurrency,
+        "requests": total,
+        "seconds": round(elapsed, 3),
+        "requests_per_s": round(total / elapsed, 1),
+        "mb_per_s": round(counters.pop("bytes") / 1_048_576 / elapsed, 1),
+        "latency_ms": {
+            "p50": round(statistics.median(latencies) * 1000, 2),
+            "p99": round(latencies[min(total - 1, int(total * 0.99))] * 1000, 2),
+            "max": round(latencies[-1] * 1000, 2),
+        },
+        "statuses": counters,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--root", type=Path, help="Folder to serve (default: data-out/).")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent connections.")
+    parser.add_argument("--requests", type=int, default=200, help="File GETs per connection.")
+    parser.add_argument("--queries", type=int, default=0, help="bbox queries per connection.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the request mix.")
+    parser.add_argument(
+        "--out",
+        type=Path,
+        help="Results file (default: data-reports/bench-serve.json).",
+    )
+    args = parser.parse_args(argv)
+
+    root = args.root or get_data_out_dir()
+    results = asyncio.run(run(root, args.concurrency, args.requests, args.queries, args.seed))
+
+    out = args.out or get_reports_dir() / "bench-serve.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    print(
+        f"{results['requests']} requests in {results['seconds']}s: "
+        f"{results['requests_per_s']} req/s, {results['mb_per_s']} MB/s, "
+        f"p50 {results['latency_ms']['p50']} ms, p99 {results['latency_ms']['p99']} ms"
+    )
+    print(f"Wrote {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
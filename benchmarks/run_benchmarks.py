@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+benchmarks/run_benchmarks.py
+
+Reproducible, offline benchmark suite for the US Forest boundaries pipeline.
+
+For each scale (1x, 10x, 100x today's national feature counts):
+- generates synthetic RangerDistrict and AdministrativeForest shapefiles
+  in a scratch repository root
+- runs export, chunk, and index end to end
+- records wall/CPU time per stage and per instrumented function
+  (read, simplify, split, write, count, chunk, copy, bundle, bbox, hash,
+  hierarchy)
+
+Results are written as JSON and checked against benchmarks/thresholds.json
+(absolute ceilings) and, optionally, a previous results file (relative
+regressions). Exits non-zero when a threshold is exceeded.
+
+Usage:
+    python benchmarks/run_benchmarks.py --scale 1 --scale 10
+    python benchmarks/run_benchmarks.py --scale 1 --baseline data-reports/benchmarks.json
+
+MIT License — maintained by Civic Interconnect
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+from synthetic import write_synthetic_inputs
+
+from civic_data_boundaries_us_forests import chunk, export, index
+from civic_data_boundaries_us_forests.utils.config_utils import clear_config_cache
+from civic_data_boundaries_us_forests.utils.get_paths import (
+    REPO_ROOT_ENV_VAR,
+    get_repo_root,
+    get_reports_dir,
+)
+from civic_data_boundaries_us_forests.utils.profile_utils import enable_profiling
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+DEFAULT_THRESHOLDS = BENCHMARK_DIR / "thresholds.json"
+
+PIPELINE_STAGES = (
+    ("export", export.main),
+    ("chunk", chunk.main),
+    ("index", index.main),
+)
+
+
+def run_scale(scale: int, workdir: Path, repo_root: Path, vertices: int) -> dict:
+    """
+    Generate inputs for one scale and time each pipeline stage.
+
+    Args:
+        scale (int): Multiplier over today's feature counts.
+        workdir (Path): Parent folder for scratch repository roots.
+        repo_root (Path): Real repository root (source of data-config/ and config.yaml).
+        vertices (int): Vertices per synthetic district ring.
+
+    Returns:
+        dict: Timings for this scale.
+    """
+    root = workdir / f"scale-{scale}"
+    if root.exists():
+        shutil.rmtree(root)
+    (root / "data-config").mkdir(parents=True)
+
+    for yaml_file in (repo_root / "data-config").glob("*.yaml"):
+        shutil.copy2(yaml_file, root / "data-config" / yaml_file.name)
+    if (repo_root / "config.yaml").exists():
+        shutil.copy2(repo_root / "config.yaml", root / "config.yaml")
+
+    print(f"[scale {scale}x] generating synthetic inputs in {root}")
+    generate_start = time.perf_counter()
+    features = write_synthetic_inputs(
+        root,
+        scale,
+        district_vertices=vertices,
+        forest_vertices=vertices * 2,
+    )
+    generate_s = time.perf_counter() - generate_start
+
+    os.environ[REPO_ROOT_ENV_VAR] = str(root)
+    clear_config_cache()
+
+    stages = {}
+    functions = {}
+    try:
+        for stage_name, stage_main in PIPELINE_STAGES:
+            profiler = enable_profiling()
+            wall_start = time.perf_counter()
+            cpu_start = time.process_time()
+            exit_code = stage_main()
+            wall_s = time.perf_counter() - wall_start
+            cpu_s = time.process_time() - cpu_start
+
+            if exit_code != 0:
+                raise RuntimeError(f"{stage_name} failed at scale {scale}x (exit {exit_code})")
+
+            stages[stage_name] = {"wall_s": round(wall_s, 4), "cpu_s": round(cpu_s, 4)}
+            print(f"[scale {scale}x] {stage_name}: {wall_s:.2f}s wall, {cpu_s:.2f}s cpu")
+
+            for record in profiler.sorted_records():
+                key = f"{stage_name}.{record.stage}"
+                totals = functions.setdefault(
+                    key,
+                    {"calls": 0, "wall_s": 0.0, "cpu_s": 0.0, "features": 0},
+                )
+                totals["calls"] += record.calls
+                totals["wall_s"] += record.wall_s
+                totals["cpu_s"] += record.cpu_s
+                totals["features"] += record.features
+    finally:
+        os.environ.pop(REPO_ROOT_ENV_VAR, None)
+        clear_config_cache()
+
+    for totals in functions.values():
+        totals["wall_s"] = round(totals["wall_s"], 4)
+        totals["cpu_s"] = round(totals["cpu_s"], 4)
+
+    return {
+        "scale": scale,
+        "features": features,
+        "generate_s": round(generate_s, 4),
+        "stages": stages,
+        "functions": dict(sorted(functions.items())),
+    }
+
+
+def check_thresholds(results: list[dict], thresholds: dict, baseline: dict | None) -> list[str]:
+    """
+    Compare results against absolute ceilings and an optional baseline.
+
+    Args:
+        results (list[dict]): Per-scale results from run_scale().
+        thresholds (dict): Parsed thresholds.json.
+        baseline (dict, optional): Previous results file to compare against.
+
+    Returns:
+        list[str]: Human-readable threshold violations (empty if none).
+    """
+    violations = []
+    ceilings = thresholds.get("ceilings_seconds", {})
+    max_regression = thresholds.get("max_regression", 0.25)
+    min_seconds = thresholds.get("min_baseline_seconds", 0.5)
+
+    baseline_by_scale = {r["scale"]: r for r in (baseline or {}).get("results", [])}
+
+    for result in results:
+        scale = result["scale"]
+        for stage, limit in ceilings.get(str(scale), {}).items():
+            actual = result["stages"].get(stage, {}).get("wall_s")
+            if actual is not None and actual > limit:
+                violations.append(f"{scale}x {stage}: {actual:.2f}s exceeds ceiling {limit:.2f}s")
+
+        previous = baseline_by_scale.get(scale)
+        if previous is None:
+            continue
+
+        timings = {**result["stages"], **result["functions"]}
+        previous_timings = {**previous.get("stages", {}), **previous.get("functions", {})}
+        for key, current in timings.items():
+            before = previous_timings.get(key, {}).get("wall_s")
+            if before is None or before < min_seconds:
+                continue
+            allowed = before * (1 + max_regression)
+            if current["wall_s"] > allowed:
+                violations.append(
+                    f"{scale}x {key}: {current['wall_s']:.2f}s vs baseline {before:.2f}s "
+                    f"(> {max_regression:.0%} regression)"
+                )
+
+    return violations
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark export, chunk and index offline.")
+    parser.add_argument(
+        "--scale",
+        type=int,
+        action="append",
+        help="Scale factor over today's feature counts (repeatable; default: 1 10 100).",
+    )
+    parser.add_argument("--vertices", type=int, default=400, help="Vertices per district ring.")
+    parser.add_argument("--workdir", type=Path, help="Scratch folder (default: a temp dir).")
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch folder afterwards.")
+    parser.add_argument("--output", type=Path, help="Results JSON path.")
+    parser.add_argument("--thresholds", type=Path, default=DEFAULT_THRESHOLDS)
+    parser.add_argument("--baseline", type=Path, help="Previous results JSON to compare against.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    scales = args.scale or [1, 10, 100]
+
+    repo_root = get_repo_root()
+    output = args.output or get_reports_dir() / "benchmarks.json"
+    thresholds = json.loads(args.thresholds.read_text(encoding="utf-8"))
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8")) if args.baseline else None
+
+    workdir = args.workdir or Path(tempfile.mkdtemp(prefix="civic-usa-bench-"))
+    workdir.mkdir(parents=True, exist_ok=True)
+
+    try:
+        results = [run_scale(scale, workdir, repo_root, args.vertices) for scale in scales]
+    finally:
+        if not args.keep and args.workdir is None:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    violations = check_thresholds(results, thresholds, baseline)
+    report = {
+        "suite": "civic-usa-pipeline",
+        "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": sys.platform,
+        "vertices": args.vertices,
+        "results": results,
+        "violations": violations,
+    }
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(f"Benchmark results written to {output}")
+
+    for violation in violations:
+        print(f"THRESHOLD EXCEEDED: {violation}")
+
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
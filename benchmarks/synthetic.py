@@ -0,0 +1,201 @@
+"""
+benchmarks/synthetic.py
+
+Generate synthetic Forest Service shapefiles for offline benchmarking.
+
+Produces layers that mimic the USFS schemas used by this pipeline:
+- S_USA.RangerDistrict      (split by DISTRICTNA)
+- S_USA.AdministrativeForest (split by FORESTNAME)
+
+Feature counts scale from today's national counts (scale=1)
+to 10x and 100x. Geometry is deterministic for a given seed,
+so runs are reproducible across machines.
+
+MIT License — maintained by Civic Interconnect
+"""
+
+from pathlib import Path
+
+import geopandas as gpd
+import numpy as np
+import shapely
+
+__all__ = [
+    "BASE_DISTRICT_COUNT",
+    "BASE_FOREST_COUNT",
+    "make_districts",
+    "make_forests",
+    "write_synthetic_inputs",
+]
+
+# Approximate national feature counts in the current USFS layers.
+BASE_DISTRICT_COUNT = 500
+BASE_FOREST_COUNT = 110
+
+# Lower-48 extent in EPSG:4269 degrees, matching the real source CRS.
+_EXTENT = (-124.5, 25.0, -67.0, 49.0)
+_CRS = "EPSG:4269"
+
+
+def make_districts(
+    count: int,
+    vertices: int = 400,
+    seed: int = 42,
+) -> gpd.GeoDataFrame:
+    """
+    Build a GeoDataFrame resembling S_USA.RangerDistrict.
+
+    Args:
+        count (int): Number of district features.
+        vertices (int): Vertices per polygon ring.
+        seed (int): Random seed for reproducible output.
+
+    Returns:
+        gpd.GeoDataFrame: Synthetic districts in EPSG:4269.
+    """
+    rng = np.random.default_rng(seed)
+    forest_count = max(1, round(count * BASE_FOREST_COUNT / BASE_DISTRICT_COUNT))
+    centers, radius = _grid_centers(count)
+    geoms = _wobbly_polygons(centers, radius * 0.45, vertices, rng)
+    forest_ids = np.minimum(np.arange(count) * forest_count // count, forest_count - 1)
+    regions = forest_ids % 10 + 1
+
+    acres = shapely.area(geoms) * 247_000.0
+    return gpd.GeoDataFrame(
+        {
+            "RANGERDIST": [
+                f"99{r:02d}{f:04d}{i:08d}"
+                for i, (r, f) in enumerate(zip(regions, forest_ids, strict=True))
+            ],
+            "REGION": [f"{r:02d}" for r in regions],
+            "FORESTNUMB": [f"{f % 100:02d}" for f in forest_ids],
+            "DISTRICTNU": [f"{i % 100:02d}" for i in range(count)],
+            "DISTRICTOR": [
+                f"{r:02d}{f % 100:02d}{i % 100:02d}"
+                for i, (r, f) in enumerate(zip(regions, forest_ids, strict=True))
+            ],
+            "FORESTNAME": [f"Synthetic {f:04d} National Forest" for f in forest_ids],
+            "DISTRICTNA": [f"Synthetic {i:06d} Ranger District" for i in range(count)],
+            "GIS_ACRES": np.round(acres, 2),
+            "SHAPE_AREA": shapely.area(geoms),
+            "SHAPE_LEN": shapely.length(geoms),
+        },
+        geometry=geoms,
+        crs=_CRS,
+    )
+
+
+def make_forests(
+    count: int,
+    vertices: int = 800,
+    seed: int = 7,
+) -> gpd.GeoDataFrame:
+    """
+    Build a GeoDataFrame resembling S_USA.AdministrativeForest.
+
+    Args:
+        count (int): Number of forest features.
+        vertices (int): Vertices per polygon ring.
+        seed (int): Random seed for reproducible output.
+
+    Returns:
+        gpd.GeoDataFrame: Synthetic forests in EPSG:4269.
+    """
+    rng = np.random.default_rng(seed)
+    centers, radius = _grid_centers(count)
+    geoms = _wobbly_polygons(centers, radius * 0.48, vertices, rng)
+    regions = np.arange(count) % 10 + 1
+
+    acres = shapely.area(geoms) * 247_000.0
+    return gpd.GeoDataFrame(
+        {
+            "ADMINFORES": [f"99{r:02d}{i:06d}010343" for i, r in enumerate(regions)],
+            "REGION": [f"{r:02d}" for r in regions],
+            "FORESTNUMB": [f"{i % 100:02d}" for i in range(count)],
+            "FORESTORGC": [f"{r:02d}{i % 100:02d}" for i, r in enumerate(regions)],
+            "FORESTNAME": [f"Synthetic {i:04d} National Forest" for i in range(count)],
+            "GIS_ACRES": np.round(acres, 2),
+            "SHAPE_AREA": shapely.area(geoms),
+            "SHAPE_LEN": shapely.length(geoms),
+        },
+        geometry=geoms,
+        crs=_CRS,
+    )
+
+
+def write_synthetic_inputs(
+    root: Path,
+    scale: int,
+    district_vertices: int = 400,
+    forest_vertices: int = 800,
+) -> dict[str, int]:
+    """
+    Write synthetic shapefiles under root/data-in/ at the given scale.
+
+    Folder layout matches what `civic-usa fetch` produces for the
+    layers in data-config/.
+
+    Args:
+        root (Path): Scratch repository root.
+        scale (int): Multiplier over today's feature counts (1, 10, 100).
+        district_vertices (int): Vertices per district ring.
+        forest_vertices (int): Vertices per forest ring.
+
+    Returns:
+        dict[str, int]: Feature count per generated layer.
+    """
+    districts = make_districts(BASE_DISTRICT_COUNT * scale, vertices=district_vertices)
+    forests = make_forests(BASE_FOREST_COUNT * scale, vertices=forest_vertices)
+
+    outputs = {
+        root / "data-in" / "forests" / "districts" / "S_USA.RangerDistrict": districts,
+        root / "data-in" / "forests" / "S_USA.AdministrativeForest": forests,
+    }
+    for folder, gdf in outputs.items():
+        folder.mkdir(parents=True, exist_ok=True)
+        gdf.to_file(folder / f"{folder.name}.shp", driver="ESRI Shapefile", index=False)
+
+    return {
+        "us-forest-districts": len(districts),
+        "us-forests": len(forests),
+    }
+
+
+def _grid_centers(count: int) -> tuple[np.ndarray, float]:
+    """
+    Lay out count cell centers on a near-square grid over the extent.
+    """
+    minx, miny, maxx, maxy = _EXTENT
+    cols = int(np.ceil(np.sqrt(count * (maxx - minx) / (maxy - miny))))
+    rows = int(np.ceil(count / cols))
+    cell = min((maxx - minx) / cols, (maxy - miny) / rows)
+
+    idx = np.arange(count)
+    xs = minx + (idx % cols + 0.5) * cell
+    ys = miny + (idx // cols + 0.5) * cell
+    return np.column_stack([xs, ys]), cell
+
+
+def _wobbly_polygons(
+    centers: np.ndarray,
+    radius: float,
+    vertices: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """
+    Build one irregular, valid, star-shaped polygon per center.
+    """
+    angles = np.linspace(0.0, 2.0 * np.pi, vertices, endpoint=False)
+    # Low-frequency lobes plus high-frequency noise, like a real boundary.
+    phase = rng.uniform(0, 2 * np.pi, size=(len(centers), 1))
+    lobes = 0.15 * np.sin(3 * angles + phase)
+    noise = rng.uniform(-0.05, 0.05, size=(len(centers), vertices))
+    radii = radius * (0.8 + lobes + noise)
+
+    xs = centers[:, [0]] + radii * np.cos(angles)
+    ys = centers[:, [1]] + radii * np.sin(angles)
+    coords = np.stack([xs, ys], axis=-1)
+    coords = np.concatenate([coords, coords[:, :1]], axis=1)
+
+    rings = shapely.linearrings(coords)
+    return shapely.polygons(rings)
@@ -6,37 +6,82 @@ Chunk US Forest boundaries and districts GeoJSON files
 from data-in-geojson as needed, placing the final output
 into data-out.
 
+Files are chunked over a process pool (`civic-usa chunk --workers`),
+largest first; per-file timing goes to data-reports/chunk.json.
+Finished files are journaled in data-cache/checkpoints/chunk.jsonl;
+`chunk --resume` after an interrupted run only chunks the rest.
+
+Also writes region and nationwide GeoJSONSeq bundles
+into data-out/bundles/, and (if web_mercator.enabled)
+the pre-projected EPSG:3857 variant into data-out-3857/.
+
 MIT License — maintained by Civic Interconnect
 """
 
+import os
 import sys
+import time
+from pathlib import Path
 
+import geopandas as gpd
 from civic_lib_core import log_utils
 
+from civic_data_boundaries_us_forests.utils.bundle_utils import (
+    read_exported_layer,
+    write_layer_bundles,
+)
+from civic_data_boundaries_us_forests.utils.checkpoint import open_checkpoint
 from civic_data_boundaries_us_forests.utils.chunk_utils import (
-    chunk_geojson_folder,
-    chunk_or_copy_file,
+    CHUNK_REPORT,
+    ChunkTask,
     get_chunking_params,
+    run_chunk_task,
+    run_chunk_tasks,
+    should_skip_file,
+    write_chunk_report,
+)
+from civic_data_boundaries_us_forests.utils.config_utils import (
+    LayerConfig,
     load_all_layer_configs,
+    load_pipeline_config,
 )
 from civic_data_boundaries_us_forests.utils.export_utils import export_split_geojson
+from civic_data_boundaries_us_forests.utils.geometry_pool import GeometryPool, open_geometry_pool
 from civic_data_boundaries_us_forests.utils.get_paths import (
     get_data_out_dir,
     get_layer_in_dir,
     get_layer_in_geojson_dir,
     get_layer_out_dir,
+    get_mercator_out_dir,
+    get_repo_root,
+    get_reports_dir,
 )
+from civic_data_boundaries_us_forests.utils.mercator_utils import (
+    MercatorSettings,
+    load_mercator_settings,
+    to_web_mercator,
+    write_mercator_group,
+)
+from civic_data_boundaries_us_forests.utils.output_store import (
+    get_output_store,
+    remove_temp_files,
+)
+from civic_data_boundaries_us_forests.utils.profile_utils import path_size, profile_layer
 
 __all__ = [
+    "bundle_layer",
+    "chunk_layer",
     "chunk_layers",
     "export_forest_layer",
+    "layer_chunk_tasks",
     "main",
+    "project_layer",
 ]
 
 logger = log_utils.logger
 
 
-def export_forest_layer(layer: dict) -> None:
+def export_forest_layer(layer: LayerConfig) -> None:
     """
     Export GeoJSONs from a single forest or district layer.
 
@@ -44,13 +89,13 @@ def export_forest_layer(layer: dict) -> None:
     or split GeoJSONs into data-out/.
 
     Args:
-        layer (dict): Configuration dictionary for the layer.
+        layer (LayerConfig): Configuration for the layer.
     """
-    name = layer["name"]
-    output_dir = get_layer_out_dir(layer["output_dir"])
+    name = layer.name
+    output_dir = get_layer_out_dir(layer.published_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    input_dir = get_layer_in_dir(layer["output_dir"])
+    input_dir = get_layer_in_dir(layer.output_dir)
     candidates = list(input_dir.glob("*.shp")) or list(input_dir.glob("*/*.shp"))
 
     if not candidates:
@@ -63,80 +108,177 @@ def export_forest_layer(layer: dict) -> None:
         export_split_geojson(
             shapefile_path,
             output_dir,
-            split_by=layer.get("split_by"),
-            simplify_tolerance=layer.get("simplify_tolerance", 0.01),
+            split_by=layer.split_by,
+            simplify_tolerance=layer.simplify_tolerance,
+            simplify_mode=layer.simplify_mode,
+            target_vertices=layer.simplify_target_vertices,
+            min_tolerance=layer.simplify_min_tolerance,
+            max_tolerance=layer.simplify_max_tolerance,
         )
 
     logger.info(f"Finished exporting layer: {name}")
 
 
-def chunk_layers() -> None:
+def chunk_layers(workers: int | None = None, resume: bool = False) -> None:
     """
     Chunk all exported GeoJSONs from data-in-geojson, based on YAML configs.
 
+    Each layer is chunked with its own effective parameters. Files of all
+    layers are chunked together over a process pool, largest first;
+    per-file timing goes to data-reports/chunk.json.
     Writes all final chunked (or copied) GeoJSONs into data-out/.
-    """
-    chunk_params = get_chunking_params()
-    max_features = chunk_params["chunk_max_features"]
+    With geometry_pool.enabled, geometries go to data-out/geometry-pool/.
 
+    Args:
+        workers (int, optional): Worker processes (default: chunk.workers
+            in config.yaml; 0 = one per CPU, 1 = serial).
+        resume (bool): Skip files an interrupted run already chunked.
+    """
     geojson_out_root = get_data_out_dir()
     geojson_out_root.mkdir(parents=True, exist_ok=True)
-
+    remove_temp_files(geojson_out_root)
+    remove_temp_files(get_mercator_out_dir())
+    mercator = load_mercator_settings()
+    pool = open_geometry_pool()
     layers = load_all_layer_configs()
+    if workers is None:
+        settings = load_pipeline_config().get("chunk") or {}
+        workers = int(settings.get("workers", 0))
+    workers = workers or os.cpu_count() or 1
 
+    tasks = []
     for layer in layers:
-        layer_input_dir = get_layer_in_geojson_dir(layer["output_dir"])
-        layer_output_dir = get_layer_out_dir(layer["output_dir"])
-        layer_output_dir.mkdir(parents=True, exist_ok=True)
-
-        if not layer_input_dir.exists():
-            logger.warning(f"Layer input dir does not exist: {layer_input_dir}")
-            continue
-
-        split_by = layer.get("split_by")
-
-        if split_by:
-            # Process subfolders created by the split
-            subfolders = [p for p in layer_input_dir.iterdir() if p.is_dir()]
-            if not subfolders:
-                logger.info(f"No subfolders found in {layer_input_dir}")
-                continue
-
-            for subfolder in subfolders:
-                logger.info(f"Searching for GeoJSONs in {subfolder}")
-                geojson_files = list(subfolder.glob("*.geojson"))
-
-                if not geojson_files:
-                    logger.info(f"No GeoJSONs found in {subfolder}")
-                    continue
-
-                for geojson_file in geojson_files:
-                    chunked_subfolder = layer_output_dir / geojson_file.stem
-                    chunked_subfolder.mkdir(parents=True, exist_ok=True)
-
-                    logger.info(f"Chunking {geojson_file} into {chunked_subfolder}")
-
-                    chunk_or_copy_file(
-                        geojson_file,
-                        max_features,
-                        chunked_subfolder,
-                    )
-        else:
-            logger.info(f"Checking all files in {layer_input_dir} for chunking or copying...")
-            chunk_geojson_folder(
-                layer_input_dir,
-                max_features,
-                layer_output_dir,
-            )
-
-
-def main() -> int:
+        tasks += layer_chunk_tasks(layer)
+
+    with open_checkpoint("chunk", resume=resume) as checkpoint:
+        start = time.perf_counter()
+        rows = run_chunk_tasks(tasks, workers=workers, pool=pool, checkpoint=checkpoint)
+        seconds = time.perf_counter() - start
+        repo_root = get_repo_root()
+        for row in rows:
+            row["path"] = Path(row["path"]).relative_to(repo_root).as_posix()
+        write_chunk_report(rows, get_reports_dir() / CHUNK_REPORT, workers, seconds)
+
+        for layer in layers:
+            with profile_layer(layer.name):
+                bundle_layer(layer)
+                if mercator is not None:
+                    project_layer(layer, mercator)
+
+    if pool is not None:
+        pool.prune()
+        pool.write_report()
+
+
+def bundle_layer(layer: LayerConfig) -> None:
+    """
+    Write region and nationwide bundles for a layer from its exported GeoJSONs.
+
+    Args:
+        layer (LayerConfig): Configuration for the layer.
+    """
+    if not (layer.bundle_by or layer.nationwide):
+        return
+
+    gdf = read_exported_layer(layer)
+    if gdf is None:
+        logger.info(f"No exported GeoJSONs to bundle for layer: {layer.name}")
+        return
+
+    write_layer_bundles(gdf, layer)
+
+
+def chunk_layer(layer: LayerConfig, pool: GeometryPool | None = None) -> None:
+    """
+    Chunk or copy the exported GeoJSONs of a single layer into data-out/, serially.
+
+    Args:
+        layer (LayerConfig): Configuration for the layer.
+        pool (GeometryPool, optional): Move geometries into the shared pool.
+    """
+    tasks = layer_chunk_tasks(layer)
+    if tasks:
+        logger.info(
+            f"Chunking layer: {layer.name} (max {layer.chunk_max_features} features per file)"
+        )
+    for task in tasks:
+        run_chunk_task(task, pool)
+
+
+def layer_chunk_tasks(layer: LayerConfig) -> list[ChunkTask]:
+    """
+    List the chunk tasks for one layer's exported GeoJSONs.
+
+    Split layers get one subfolder per exported file:
+        data-out/{layer.published_dir}/{stem}/
+
+    Args:
+        layer (LayerConfig): Configuration for the layer.
+
+    Returns:
+        list[ChunkTask]: One task per file, in path order.
+    """
+    max_features = get_chunking_params(layer)["chunk_max_features"]
+    layer_input_dir = get_layer_in_geojson_dir(layer.output_dir)
+    layer_output_dir = get_layer_out_dir(layer.published_dir)
+
+    if not layer_input_dir.exists():
+        logger.warning(f"Layer input dir does not exist: {layer_input_dir}")
+        return []
+
+    # Only this layer's own files; nested folders belong to other layers.
+    geojson_files = [
+        f for f in sorted(layer_input_dir.glob("*.geojson")) if not should_skip_file(f)
+    ]
+    if not geojson_files:
+        logger.info(f"No GeoJSONs found in {layer_input_dir}")
+        return []
+
+    return [
+        ChunkTask(
+            layer=layer.name,
+            source=geojson_file,
+            output_dir=layer_output_dir / geojson_file.stem if layer.split_by else layer_output_dir,
+            max_features=max_features,
+            size=path_size(geojson_file),
+        )
+        for geojson_file in geojson_files
+    ]
+
+
+def project_layer(layer: LayerConfig, settings: MercatorSettings) -> None:
+    """
+    Write the EPSG:3857 variant of a layer's exported GeoJSONs into data-out-3857/.
+
+    Args:
+        layer (LayerConfig): Configuration for the layer.
+        settings (MercatorSettings): Simplification and precision in meters.
+    """
+    layer_input_dir = get_layer_in_geojson_dir(layer.output_dir)
+    geojson_files = sorted(layer_input_dir.glob("*.geojson"))
+    if not geojson_files:
+        return
+
+    logger.info(f"Projecting layer to EPSG:3857: {layer.name}")
+    for geojson_file in geojson_files:
+        projected = to_web_mercator(gpd.read_file(geojson_file), settings)
+        write_mercator_group(projected, geojson_file.stem, layer)
+
+
+def main(workers: int | None = None, resume: bool = False) -> int:
     """
     CLI entry point for chunking all GeoJSON files as needed.
+
+    Args:
+        workers (int, optional): Worker processes (default: chunk.workers).
+        resume (bool): Continue an interrupted run, skipping files it chunked.
     """
     try:
         logger.info("Starting chunking process...")
-        chunk_layers()
+        store = get_output_store()
+        store.reset()
+        chunk_layers(workers=workers, resume=resume)
+        store.log_summary("Chunk outputs")
         logger.info("Export and chunking complete.")
         return 0
 
@@ -5,90 +5,354 @@ src/civic_data_boundaries_us_forests/cleanup.py
 Cleanup routines for the US Forest boundaries pipeline.
 
 Removes:
-- downloaded zip files and extracted shapefiles from data-in/
+- extracted shapefiles and partial downloads from data-in/
+- downloaded zip files beyond the archive retention budget
 - intermediate exported GeoJSONs from data-in-geojson/
 
 Keeps:
 - final chunked GeoJSONs safe in data-out/.
+- the most recently used source zips, with their HTTP validators
+  (<zip>.http.json), up to ``cleanup.archive_budget_mb`` in config.yaml,
+  so the next fetch can be a conditional GET that downloads nothing.
+- reusable build caches in data-cache/ (unless explicitly requested).
+
+data-in/ is scanned once (os.walk, pruned below every extracted
+shapefile folder); the resulting plan is logged and, unless dry_run is
+set, deleted in parallel.
 
 MIT License — maintained by Civic Interconnect
 """
 
+import contextlib
+import os
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from civic_lib_core import log_utils
 
+from civic_data_boundaries_us_forests.utils.config_utils import load_pipeline_config
 from civic_data_boundaries_us_forests.utils.get_paths import (
+    get_cache_dir,
     get_data_in_dir,
     get_data_in_geojson_dir,
 )
+from civic_data_boundaries_us_forests.utils.http_validators import (
+    VALIDATORS_SUFFIX,
+    validators_path,
+)
 
 __all__ = [
+    "DEFAULT_ARCHIVE_BUDGET_MB",
+    "CleanupItem",
+    "CleanupPlan",
+    "clean_cache_dir",
     "clean_data_in_dir",
     "clean_data_in_geojson_dir",
+    "execute_plan",
     "main",
+    "plan_data_in",
 ]
 
 logger = log_utils.logger
 
+DEFAULT_ARCHIVE_BUDGET_MB = 2048
+
+# Parallel deletions; removal is I/O bound, so threads are enough.
+_DELETE_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class CleanupItem:
+    """
+    One file or folder considered by cleanup.
+    """
+
+    path: Path
+    kind: str  # "archive", "extracted", "partial", "validators", "folder"
+    size: int
+    last_used: float = 0.0
+
 
-def clean_data_in_dir(data_in_dir: Path) -> None:
+@dataclass
+class CleanupPlan:
     """
-    Delete all .zip files and extracted shapefiles from data-in/.
+    What cleanup deletes and what it keeps.
+    """
+
+    delete: list[CleanupItem] = field(default_factory=list)
+    keep: list[CleanupItem] = field(default_factory=list)
+
+    @property
+    def bytes_freed(self) -> int:
+        """
+        Total size of the items to delete.
+        """
+        return sum(item.size for item in self.delete)
+
+    @property
+    def bytes_kept(self) -> int:
+        """
+        Total size of the retained archives and validators.
+        """
+        return sum(item.size for item in self.keep)
+
+    def log(self, dry_run: bool = False) -> None:
+        """
+        Log every planned deletion and retained archive, then totals.
+        """
+        verb = "Would delete" if dry_run else "Deleting"
+        for item in self.delete:
+            logger.info(f"{verb} {item.kind}: {item.path} ({_mb(item.size)} MB)")
+        for item in self.keep:
+            logger.info(f"Keeping {item.kind}: {item.path} ({_mb(item.size)} MB)")
+        logger.info(
+            f"{'Dry run: would free' if dry_run else 'Freeing'} {_mb(self.bytes_freed)} MB "
+            f"in {len(self.delete)} item(s); keeping {len(self.keep)} item(s), "
+            f"{_mb(self.bytes_kept)} MB"
+        )
+
+
+def clean_cache_dir(cache_dir: Path, dry_run: bool = False) -> CleanupPlan:
+    """
+    Delete the data-cache/ folder (e.g. the simplify cache).
+
+    Only called when explicitly requested, since the cache makes
+    repeated exports cheap.
+    """
+    return _clean_folder(cache_dir, dry_run)
+
+
+def clean_data_in_dir(
+    data_in_dir: Path,
+    archive_budget_mb: float = 0,
+    dry_run: bool = False,
+) -> CleanupPlan:
+    """
+    Delete extracted shapefiles, partial downloads, and zips over budget from data-in/.
 
     Leaves the folder structure intact if empty folders remain.
+
+    Args:
+        data_in_dir (Path): data-in/ folder.
+        archive_budget_mb (float): Disk budget for retained zips (0 deletes all).
+        dry_run (bool): Only log what would be deleted.
     """
+    plan = plan_data_in(data_in_dir, archive_budget_mb)
+    plan.log(dry_run)
+    if not dry_run:
+        execute_plan(plan)
+    return plan
+
+
+def clean_data_in_geojson_dir(data_in_geojson_dir: Path, dry_run: bool = False) -> CleanupPlan:
+    """
+    Delete all files under data-in-geojson/.
+
+    Removes intermediate GeoJSON exports but leaves data-out/ untouched.
+    """
+    return _clean_folder(data_in_geojson_dir, dry_run)
+
+
+def execute_plan(plan: CleanupPlan, workers: int = _DELETE_WORKERS) -> int:
+    """
+    Delete every planned item in parallel.
+
+    Args:
+        plan (CleanupPlan): Items to delete.
+        workers (int): Deletion threads.
+
+    Returns:
+        int: Number of items that could not be deleted.
+    """
+    if not plan.delete:
+        return 0
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cleanup") as pool:
+        failures = sum(not ok for ok in pool.map(_delete, plan.delete))
+    if failures:
+        logger.warning(f"{failures} item(s) could not be deleted")
+    return failures
+
+
+def plan_data_in(data_in_dir: Path, archive_budget_mb: float = 0) -> CleanupPlan:
+    """
+    Scan data-in/ once and decide what to delete.
+
+    Folders that directly contain a .shp file are extracted shapefiles;
+    *.part files and folders are interrupted downloads. Zips are kept,
+    most recently used first, while they fit in archive_budget_mb; each
+    kept zip keeps its validators, and validators without a zip go.
+
+    Args:
+        data_in_dir (Path): data-in/ folder.
+        archive_budget_mb (float): Disk budget for retained zips (0 deletes all).
+
+    Returns:
+        CleanupPlan: Items to delete and archives to keep.
+    """
+    plan = CleanupPlan()
     if not data_in_dir.exists():
         logger.info(f"No cleanup needed. Folder does not exist: {data_in_dir}")
-        return
+        return plan
 
-    deleted_files = 0
-    deleted_dirs = 0
+    archives: list[CleanupItem] = []
+    validators: dict[Path, CleanupItem] = {}
 
-    for path in data_in_dir.rglob("*"):
-        if path.is_file() and path.suffix == ".zip":
-            path.unlink()
-            logger.info(f"Deleted zip file: {path}")
-            deleted_files += 1
-        elif path.is_dir():
-            if any(p.suffix == ".shp" for p in path.rglob("*.shp")):
-                shutil.rmtree(path)
-                logger.info(f"Deleted extracted shapefiles folder: {path}")
-                deleted_dirs += 1
+    for dirpath, dirnames, filenames in os.walk(data_in_dir):
+        folder = Path(dirpath)
+        if folder != data_in_dir and (
+            folder.name.endswith(".part") or any(f.endswith(".shp") for f in filenames)
+        ):
+            kind = "partial" if folder.name.endswith(".part") else "extracted"
+            plan.delete.append(CleanupItem(folder, kind, _tree_size(folder)))
+            dirnames[:] = []
+            continue
 
-    logger.info(
-        f"Cleanup complete in data-in/. Deleted {deleted_files} zip(s) "
-        f"and {deleted_dirs} shapefile folder(s)."
-    )
+        for name in filenames:
+            kind = _data_in_file_kind(name)
+            if kind is None:
+                continue
+            path = folder / name
+            stat = path.stat()
+            item = CleanupItem(path, kind, stat.st_size, stat.st_mtime)
+            if kind == "archive":
+                archives.append(item)
+            elif kind == "validators":
+                validators[path] = item
+            else:
+                plan.delete.append(item)
 
+    _apply_retention(plan, archives, validators, archive_budget_mb)
+    return plan
 
-def clean_data_in_geojson_dir(data_in_geojson_dir: Path) -> None:
+
+def _apply_retention(
+    plan: CleanupPlan,
+    archives: list[CleanupItem],
+    validators: dict[Path, CleanupItem],
+    archive_budget_mb: float,
+) -> None:
+    """
+    Keep the most recently used zips (and their validators) within budget.
     """
-    Delete all files under data-in-geojson/.
 
-    Removes intermediate GeoJSON exports but leaves data-out/ untouched.
+    # Most recently used first: a validators touch (304) counts as a use.
+    def last_used(archive: CleanupItem) -> float:
+        sidecar = validators.get(validators_path(archive.path))
+        return max(archive.last_used, sidecar.last_used if sidecar else 0.0)
+
+    budget = archive_budget_mb * 1024 * 1024
+    used = 0
+    for archive in sorted(archives, key=lambda a: (-last_used(a), str(a.path))):
+        sidecar = validators.pop(validators_path(archive.path), None)
+        group = [archive, sidecar] if sidecar else [archive]
+        size = sum(item.size for item in group)
+        if used + size <= budget:
+            used += size
+            plan.keep += group
+        else:
+            plan.delete += group
+
+    plan.delete += validators.values()
+
+
+def _clean_folder(folder: Path, dry_run: bool) -> CleanupPlan:
     """
-    if not data_in_geojson_dir.exists():
-        logger.info(f"No cleanup needed. Folder does not exist: {data_in_geojson_dir}")
-        return
+    Plan (and unless dry_run, perform) deletion of a whole folder.
+    """
+    plan = CleanupPlan()
+    if not folder.exists():
+        logger.info(f"No cleanup needed. Folder does not exist: {folder}")
+        return plan
+    plan.delete.append(CleanupItem(folder, "folder", _tree_size(folder)))
+    plan.log(dry_run)
+    if not dry_run:
+        execute_plan(plan)
+    return plan
 
-    shutil.rmtree(data_in_geojson_dir)
-    logger.info(f"Deleted entire data-in-geojson folder: {data_in_geojson_dir}")
 
+def _data_in_file_kind(name: str) -> str | None:
+    """
+    Classify a data-in/ file name (None for files cleanup leaves alone).
+    """
+    if name.endswith(".zip"):
+        return "archive"
+    if name.endswith(VALIDATORS_SUFFIX):
+        return "validators"
+    if name.endswith(".part"):
+        return "partial"
+    return None
 
-def main() -> int:
+
+def _delete(item: CleanupItem) -> bool:
+    """
+    Delete one file or folder; return False (and log) on failure.
+    """
+    try:
+        if item.path.is_dir():
+            shutil.rmtree(item.path)
+        else:
+            item.path.unlink(missing_ok=True)
+        return True
+    except OSError as e:
+        logger.error(f"Could not delete {item.path}: {e}")
+        return False
+
+
+def _mb(size: int) -> float:
+    return round(size / (1024 * 1024), 2)
+
+
+def _tree_size(folder: Path) -> int:
+    """
+    Return the total size in bytes of all files below a folder.
+    """
+    total = 0
+    for dirpath, _, filenames in os.walk(folder):
+        for name in filenames:
+            with contextlib.suppress(OSError):
+                total += os.stat(os.path.join(dirpath, name)).st_size
+    return total
+
+
+def main(
+    include_cache: bool = False,
+    dry_run: bool = False,
+    archive_budget_mb: float | None = None,
+) -> int:
     """
     CLI entry point for cleanup of all intermediate files.
+
+    Args:
+        include_cache (bool): Also delete data-cache/.
+        dry_run (bool): Only report what would be deleted.
+        archive_budget_mb (float, optional): Disk budget for retained source
+            zips. Defaults to ``cleanup.archive_budget_mb`` in config.yaml.
     """
     try:
-        data_in = get_data_in_dir()
-        data_in_geojson = get_data_in_geojson_dir()
+        if archive_budget_mb is None:
+            settings = load_pipeline_config().get("cleanup") or {}
+            archive_budget_mb = float(settings.get("archive_budget_mb", DEFAULT_ARCHIVE_BUDGET_MB))
+        if archive_budget_mb < 0:
+            raise ValueError("archive_budget_mb must not be negative")
+
+        plan = plan_data_in(get_data_in_dir(), archive_budget_mb)
+        for folder in (get_data_in_geojson_dir(), get_cache_dir() if include_cache else None):
+            if folder is not None and folder.exists():
+                plan.delete.append(CleanupItem(folder, "folder", _tree_size(folder)))
+        if not include_cache:
+            logger.info(f"Keeping cache folder: {get_cache_dir()}")
 
-        clean_data_in_dir(data_in)
-        clean_data_in_geojson_dir(data_in_geojson)
+        plan.log(dry_run)
+        if dry_run:
+            logger.info("Dry run: nothing was deleted.")
+            return 0
 
+        failures = execute_plan(plan)
+        if failures:
+            return 1
         logger.info("Cleanup completed successfully.")
         return 0
 
@@ -7,17 +7,26 @@ Command-line interface (CLI) for civic-data-boundaries-us-forests.
 Provides commands for:
 - Fetching TIGER/Line shapefiles
 - Exporting and chunking all GeoJSON files
+- Building data-out/ in one pass (fused export + chunk)
 - Generating spatial indexes and summaries
+- Serving data-out/ over HTTP
 
 Run `civic-usa --help` for usage.
+
+Command modules (and geopandas, pyogrio, shapely, requests, ...) are
+imported inside each command, so `--help` and light commands start
+fast; tests/test_cli_import_time.py guards this.
 """
 
 import sys
+from pathlib import Path
+from typing import Annotated
 
 import typer
 from civic_lib_core import log_utils
 
-from civic_data_boundaries_us_forests import chunk, cleanup, export, fetch, index
+from civic_data_boundaries_us_forests.utils.get_paths import get_reports_dir
+from civic_data_boundaries_us_forests.utils.profile_utils import enable_profiling
 
 log_utils.init_logger()
 logger = log_utils.logger
@@ -25,49 +34,198 @@ logger = log_utils.logger
 app = typer.Typer(help="Civic USA CLI — boundary export and indexing.")
 
 
+@app.callback()
+def main_callback(
+    ctx: typer.Context,
+    profile: Annotated[
+        bool,
+        typer.Option(
+            "--profile",
+            help="Record per-stage timing and resource use; print a summary and write a JSON trace.",
+        ),
+    ] = False,
+    profile_out: Annotated[
+        Path | None,
+        typer.Option(
+            "--profile-out",
+            help="Where to write the JSON trace (default: data-reports/profile-<command>.json).",
+        ),
+    ] = None,
+):
+    """
+    Civic USA CLI — boundary export and indexing.
+    """
+    if not profile:
+        return
+
+    profiler = enable_profiling()
+    command = ctx.invoked_subcommand or "civic-usa"
+    trace_path = profile_out or get_reports_dir() / f"profile-{command}.json"
+
+    def report() -> None:
+        profiler.print_summary()
+        profiler.write_trace(trace_path, command=command)
+
+    ctx.call_on_close(report)
+
+
 @app.command("fetch")
 def fetch_command():
     """
     Download required shapefiles into data-in/.
     Skips download if files already exist.
     """
+    from civic_data_boundaries_us_forests import fetch
+
     fetch.main()
 
 
 @app.command("export")
-def export_command():
+def export_command(
+    resume: Annotated[
+        bool,
+        typer.Option("--resume", help="Continue an interrupted run, skipping finished files."),
+    ] = False,
+):
     """
     Export all data into data-in-geojson/.
     """
-    export.main()
+    from civic_data_boundaries_us_forests import export
+
+    export.main(resume=resume)
+
+
+@app.command("validate")
+def validate_command(
+    repair: Annotated[
+        bool | None,
+        typer.Option(
+            "--repair/--check-only",
+            help="Repair flagged features in place (default: validate.repair in config.yaml).",
+        ),
+    ] = None,
+    workers: Annotated[
+        int | None,
+        typer.Option("--workers", help="Worker processes (0 = one per CPU)."),
+    ] = None,
+):
+    """
+    Validate and repair GeoJSONs in data-in-geojson/ (run between export and chunk).
+
+    Writes a machine-readable report to data-reports/validate.json.
+    """
+    from civic_data_boundaries_us_forests import validate
+
+    validate.main(repair=repair, workers=workers)
 
 
 @app.command("chunk")
-def chunk_command():
+def chunk_command(
+    workers: Annotated[
+        int | None,
+        typer.Option(
+            "--workers",
+            help="Worker processes (default: chunk.workers in config.yaml; 0 = one per CPU).",
+        ),
+    ] = None,
+    resume: Annotated[
+        bool,
+        typer.Option("--resume", help="Continue an interrupted run, skipping finished files."),
+    ] = False,
+):
     """
     Chunk all data from data-in-geojson/ to data-out/.
+
+    Files are chunked in parallel, largest first; per-file timing is
+    written to data-reports/chunk.json.
     """
-    chunk.main()
+    from civic_data_boundaries_us_forests import chunk
+
+    chunk.main(workers=workers, resume=resume)
+
+
+@app.command("build")
+def build_command(
+    resume: Annotated[
+        bool,
+        typer.Option("--resume", help="Continue an interrupted run, skipping finished files."),
+    ] = False,
+):
+    """
+    Export and chunk straight into data-out/ without data-in-geojson/.
+    """
+    from civic_data_boundaries_us_forests import pipeline
+
+    pipeline.main(resume=resume)
 
 
 @app.command("index")
-def index_command():
+def index_command(
+    patches: Annotated[
+        bool | None,
+        typer.Option(
+            "--patches/--no-patches",
+            help="Write feature-level patch files (default: delta.patches in config.yaml).",
+        ),
+    ] = None,
+):
     """
     Generate index.json and other summary metadata files in data-out/.
+
+    Also writes changes.json listing files added, removed, or modified
+    since the previous index.json.
     """
-    index.main()
+    from civic_data_boundaries_us_forests import index
+
+    index.main(patches=patches)
 
 
 @app.command("cleanup")
-def cleanup_command():
+def cleanup_command(
+    cache: Annotated[
+        bool,
+        typer.Option("--cache", help="Also delete reusable caches in data-cache/."),
+    ] = False,
+    dry_run: Annotated[
+        bool,
+        typer.Option("--dry-run", help="Only report what would be deleted."),
+    ] = False,
+    archive_budget_mb: Annotated[
+        float | None,
+        typer.Option(
+            "--archive-budget-mb",
+            help="Disk budget for kept source zips (default: cleanup.archive_budget_mb; 0 = none).",
+        ),
+    ] = None,
+):
     """
     Cleanup temporary files and directories created during export.
 
-    Deletes all .zip files and extracted shapefiles from data-in/,
-    and all intermediate content in data-in-geojson/.
-    Keeps chunked GeoJSONs safe in data-out/.
+    Deletes extracted shapefiles and partial downloads from data-in/,
+    and all intermediate content in data-in-geojson/. Keeps the most
+    recently used source zips (with their HTTP validators) within the
+    archive budget, so the next fetch can skip unchanged downloads.
+    Keeps chunked GeoJSONs safe in data-out/ and caches in data-cache/.
     """
-    cleanup.main()
+    from civic_data_boundaries_us_forests import cleanup
+
+    cleanup.main(include_cache=cache, dry_run=dry_run, archive_budget_mb=archive_budget_mb)
+
+
+@app.command("serve")
+def serve_command(
+    host: Annotated[str, typer.Option("--host", help="Interface to bind.")] = "127.0.0.1",
+    port: Annotated[int, typer.Option("--port", help="TCP port to listen on.")] = 8000,
+):
+    """
+    Serve data-out/ over HTTP with Range requests, ETags, and sidecar compression.
+
+    GET /query?bbox=minx,miny,maxx,maxy streams only the features
+    intersecting the bbox as a GeoJSON Text Sequence.
+    """
+    from civic_data_boundaries_us_forests import serve
+
+    serve.main(host=host, port=port)
 
 
 def main() -> int:
@@ -7,8 +7,18 @@ Export US Forest boundaries and districts from downloaded shapefiles into GeoJSO
 This step:
 - reads shapefiles
 - optionally splits features by attribute (e.g. one file per forest or district)
-- optionally simplifies geometries
+- optionally simplifies geometries (reusing data-cache/ results when unchanged)
 - writes .geojson files into data-in-geojson/
+- writes one label-point layer per layer into data-out/labels/
+- records per-layer simplification ratios in data-cache/simplify-stats.json
+
+Layers with memory_budget_mb set are read and written in windows of
+features (see utils/batch_export.py), so peak memory stays bounded
+no matter how large the source layer is.
+
+Written files are journaled in data-cache/checkpoints/export.jsonl;
+`export --resume` after an interrupted run skips writing the groups
+that run already finished (see utils/checkpoint.py).
 
 It does NOT chunk files.
 
@@ -17,9 +27,14 @@ MIT License — maintained by Civic Interconnect
 
 import sys
 
-import yaml
 from civic_lib_core import log_utils
 
+from civic_data_boundaries_us_forests.utils.batch_export import export_split_geojson_batched
+from civic_data_boundaries_us_forests.utils.checkpoint import Checkpoint, open_checkpoint
+from civic_data_boundaries_us_forests.utils.config_utils import (
+    LayerConfig,
+    load_all_layer_configs,
+)
 from civic_data_boundaries_us_forests.utils.export_utils import (
     export_split_geojson,
     should_skip_file,
@@ -28,8 +43,18 @@ from civic_data_boundaries_us_forests.utils.get_paths import (
     get_data_in_geojson_dir,
     get_layer_in_dir,
     get_layer_in_geojson_dir,
-    get_repo_root,
 )
+from civic_data_boundaries_us_forests.utils.label_utils import LabelCollector
+from civic_data_boundaries_us_forests.utils.output_store import (
+    get_output_store,
+    remove_temp_files,
+)
+from civic_data_boundaries_us_forests.utils.profile_utils import profile_layer
+from civic_data_boundaries_us_forests.utils.simplify_cache import (
+    SimplifyCache,
+    open_simplify_cache,
+)
+from civic_data_boundaries_us_forests.utils.summary_utils import write_simplify_stats
 
 __all__ = [
     "load_all_layer_configs",
@@ -40,46 +65,35 @@ __all__ = [
 logger = log_utils.logger
 
 
-def load_all_layer_configs() -> list[dict]:
-    """
-    Loads and merges all YAML layer configs into a list of layers.
-
-    Returns:
-        list[dict]: List of layer configuration dictionaries.
-    """
-    yaml_dir = get_repo_root() / "data-config"
-    yaml_files = sorted(yaml_dir.glob("*.yaml"))
-
-    all_layers = []
-    for yaml_file in yaml_files:
-        logger.info(f"Processing YAML config: {yaml_file.name}")
-        with open(yaml_file, encoding="utf-8") as f:
-            config = yaml.safe_load(f) or {}
-            all_layers.extend(config.get("layers", []))
-
-    return all_layers
-
-
-def export_forest_layer(layer: dict) -> None:
+def export_forest_layer(
+    layer: LayerConfig,
+    cache: SimplifyCache | None = None,
+    checkpoint: Checkpoint | None = None,
+) -> None:
     """
     Export GeoJSONs from a single forest or district layer.
 
     Depending on the config:
     - may split by attribute (e.g. FORESTNAME)
     - may simplify geometries
+    - may read in memory-bounded windows (memory_budget_mb)
 
     Outputs:
         GeoJSON files into:
             data-in-geojson/{layer.output_dir}/
+        Label points into:
+            data-out/labels/{layer.name}.geojson
 
     Args:
-        layer (dict): Layer configuration dictionary.
+        layer (LayerConfig): Effective configuration for the layer.
+        cache (SimplifyCache, optional): Simplify cache shared across layers.
+        checkpoint (Checkpoint, optional): Journal of completed files.
     """
-    name = layer["name"]
-    output_dir = get_layer_in_geojson_dir(layer["output_dir"])
+    name = layer.name
+    output_dir = get_layer_in_geojson_dir(layer.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    input_dir = get_layer_in_dir(layer["output_dir"])
+    input_dir = get_layer_in_dir(layer.output_dir)
     logger.debug(f"Looking for shapefiles in {input_dir}")
 
     if not input_dir.exists():
@@ -92,6 +106,7 @@ def export_forest_layer(layer: dict) -> None:
         logger.warning(f"No shapefile found for layer: {name} in {input_dir}")
         return
 
+    labels = LabelCollector(layer)
     for shapefile_path in candidates:
         if should_skip_file(shapefile_path):
             continue
@@ -99,20 +114,35 @@ def export_forest_layer(layer: dict) -> None:
         logger.info(f"Exporting layer: {name}")
         logger.info(f"  Reading shapefile: {shapefile_path}")
 
-        export_split_geojson(
-            shapefile_path,
-            output_dir,
-            split_by=layer.get("split_by"),
-            simplify_tolerance=layer.get("simplify_tolerance", 0.01),
-        )
-
+        options = {
+            "split_by": layer.split_by,
+            "simplify_tolerance": layer.simplify_tolerance,
+            "simplify_mode": layer.simplify_mode,
+            "target_vertices": layer.simplify_target_vertices,
+            "min_tolerance": layer.simplify_min_tolerance,
+            "max_tolerance": layer.simplify_max_tolerance,
+            "cache": cache,
+            "labels": labels,
+            "checkpoint": checkpoint,
+        }
+        if layer.memory_budget_mb:
+            export_split_geojson_batched(
+                shapefile_path, output_dir, layer.memory_budget_mb, **options
+            )
+        else:
+            export_split_geojson(shapefile_path, output_dir, **options)
+
+    labels.write()
     logger.info(f"Finished exporting layer: {name}")
 
 
-def main() -> int:
+def main(resume: bool = False) -> int:
     """
     CLI entry point to export forest-related layers to GeoJSON.
 
+    Args:
+        resume (bool): Continue an interrupted run, skipping files it finished.
+
     Returns:
         int: Exit code (0 if successful, 1 if failed).
     """
@@ -121,12 +151,25 @@ def main() -> int:
 
         geojson_dir = get_data_in_geojson_dir()
         geojson_dir.mkdir(parents=True, exist_ok=True)
+        remove_temp_files(geojson_dir)
 
         layers = load_all_layer_configs()
-
-        for layer in layers:
-            export_forest_layer(layer)
-
+        cache = open_simplify_cache()
+        store = get_output_store()
+        store.reset()
+
+        try:
+            with open_checkpoint("export", resume=resume) as checkpoint:
+                for layer in layers:
+                    with profile_layer(layer.name):
+                        export_forest_layer(layer, cache=cache, checkpoint=checkpoint)
+        finally:
+            if cache is not None:
+                logger.info(f"Simplify cache: {cache.hits} hit(s), {cache.misses} miss(es)")
+                cache.close()
+
+        store.log_summary("Export outputs")
+        write_simplify_stats()
         logger.info("=== EXPORT complete ===")
         return 0
 
@@ -10,22 +10,52 @@ Supports:
 - Future nationwide Forest Service layers
 
 Reads layer definitions from YAML files under data-config/.
+
+By default, shapefile members are extracted while the zip is still
+downloading (see utils/zip_stream.py), so fetch takes about as long as
+the download itself. Only .shp/.shx/.dbf/.prj/.cpg members are written.
+Set fetch.stream_extract: false in config.yaml to download first and
+extract afterwards.
+
+Downloaded zips are kept with their HTTP validators (ETag,
+Last-Modified; see utils/http_validators.py), and re-fetching a kept
+zip is a conditional GET: 304 Not Modified leaves it and its extracted
+shapefiles in place, so an unchanged source costs one round trip.
 """
 
+import queue
+import shutil
 import sys
+import threading
 import zipfile
+from collections.abc import Callable
 from pathlib import Path
 
 import requests
-import yaml
 from civic_lib_core import log_utils
 
-from civic_data_boundaries_us_forests.utils.get_paths import (
-    get_data_in_dir,
-    get_repo_root,
+from civic_data_boundaries_us_forests.utils.config_utils import (
+    LayerConfig,
+    load_all_layer_configs,
+    load_pipeline_config,
+)
+from civic_data_boundaries_us_forests.utils.get_paths import get_data_in_dir
+from civic_data_boundaries_us_forests.utils.http_validators import (
+    conditional_headers,
+    read_validators,
+    touch_validators,
+    write_validators,
+)
+from civic_data_boundaries_us_forests.utils.profile_utils import path_size, profile_stage
+from civic_data_boundaries_us_forests.utils.zip_stream import (
+    StreamingZipExtractor,
+    ZipStreamError,
+    is_wanted_member,
+    verify_against_central_directory,
 )
 
 __all__ = [
+    "download_and_extract",
     "download_file",
     "extract_zip",
     "process_layer",
@@ -34,37 +64,146 @@ __all__ = [
 
 logger = log_utils.logger
 
+_CHUNK_SIZE = 1 << 16
+
+# Downloaded chunks waiting for the extractor thread (bounded to cap memory).
+_QUEUE_CHUNKS = 256
+
+
+def download_and_extract(url: str, zip_path: Path, extract_to: Path) -> bool:
+    """
+    Download a zip and extract its shapefile members while it downloads.
+
+    Members are written into a temporary folder that is renamed to
+    extract_to once every member has passed its CRC check and matches
+    the central directory. If streaming fails for any reason, falls back
+    to extracting from the downloaded zip.
+
+    Args:
+        url (str): Zip URL.
+        zip_path (Path): Where to keep the downloaded zip.
+        extract_to (Path): Folder for the extracted shapefile members.
+
+    Returns:
+        bool: True if the zip was downloaded and extracted.
+    """
+    part_dir = extract_to.with_name(extract_to.name + ".part")
+    shutil.rmtree(part_dir, ignore_errors=True)
+
+    extractor = StreamingZipExtractor(part_dir)
+    chunks: queue.Queue[bytes | None] = queue.Queue(maxsize=_QUEUE_CHUNKS)
+    errors: list[Exception] = []
+
+    worker = threading.Thread(
+        target=_run_extractor,
+        args=(extractor, chunks, errors),
+        name="zip-extract",
+        daemon=True,
+    )
+    worker.start()
+    try:
+        downloaded = download_file(url, zip_path, on_chunk=chunks.put)
+    finally:
+        chunks.put(None)
+        worker.join()
+
+    if not downloaded:
+        shutil.rmtree(part_dir, ignore_errors=True)
+        return False
 
-def download_file(url: str, dest_path: Path) -> bool:
+    if not errors:
+        try:
+            verify_against_central_directory(zip_path, extractor.extracted)
+        except (ZipStreamError, zipfile.BadZipFile) as e:
+            errors.append(e)
+
+    if errors:
+        logger.warning(f"Streaming extraction failed ({errors[0]}); extracting from {zip_path}")
+        shutil.rmtree(part_dir, ignore_errors=True)
+        return extract_zip(zip_path, extract_to)
+
+    part_dir.replace(extract_to)
+    logger.info(
+        f"Extracted {len(extractor.extracted)} member(s) while downloading "
+        f"(skipped {len(extractor.skipped)}): {extract_to}"
+    )
+    return True
+
+
+def download_file(
+    url: str,
+    dest_path: Path,
+    on_chunk: Callable[[bytes], None] | None = None,
+) -> bool:
+    """
+    Download a URL to dest_path via a .part file.
+
+    If dest_path already exists it is revalidated with a conditional GET
+    when validators were saved for it (kept on 304 Not Modified, replaced
+    on 200), and left as is otherwise.
+
+    Args:
+        url (str): URL to download.
+        dest_path (Path): Destination file.
+        on_chunk (Callable, optional): Called with every downloaded chunk, in order.
+
+    Returns:
+        bool: True if the file exists afterwards.
+    """
     logger.debug(f"Preparing to download file from URL: {url}")
     logger.debug(f"Destination path: {dest_path}")
 
-    if dest_path.exists():
+    validators = read_validators(dest_path) if dest_path.exists() else None
+    if dest_path.exists() and not conditional_headers(validators):
         logger.info(f"Skipping download. File already exists: {dest_path}")
         return True
 
-    logger.info(f"Downloading: {url}")
+    logger.info(f"{'Revalidating' if validators else 'Downloading'}: {url}")
 
+    part_path = dest_path.with_name(dest_path.name + ".part")
     try:
-        response = requests.get(url, stream=True, timeout=60)
+        response = requests.get(
+            url, stream=True, timeout=60, headers=conditional_headers(validators)
+        )
+        if validators and response.status_code == 304:
+            response.close()
+            touch_validators(dest_path)
+            logger.info(f"Not modified since last fetch. Keeping: {dest_path}")
+            return True
         response.raise_for_status()
 
         dest_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(dest_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
+        with profile_stage("download") as rec, open(part_path, "wb") as f:
+            for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
                 if chunk:
                     f.write(chunk)
+                    if on_chunk is not None:
+                        on_chunk(chunk)
+            rec.bytes_written += f.tell()
 
+        part_path.replace(dest_path)
+        write_validators(dest_path, url, response.headers)
         logger.info(f"Downloaded file saved to: {dest_path}")
         return True
 
     except Exception as e:
+        part_path.unlink(missing_ok=True)
         logger.error(f"Failed to download {url}. Error: {e}")
         return False
 
 
 def extract_zip(zip_path: Path, extract_to: Path) -> bool:
+    """
+    Extract the shapefile members (.shp/.shx/.dbf/.prj/.cpg) of a downloaded zip.
+
+    Args:
+        zip_path (Path): Downloaded zip file.
+        extract_to (Path): Destination folder.
+
+    Returns:
+        bool: True if the members were extracted (or already were).
+    """
     logger.debug(f"Preparing to extract zip: {zip_path}")
     logger.debug(f"Extraction target: {extract_to}")
 
@@ -79,8 +218,11 @@ def extract_zip(zip_path: Path, extract_to: Path) -> bool:
     logger.info(f"Extracting {zip_path} to {extract_to}")
 
     try:
-        with zipfile.ZipFile(zip_path, "r") as zip_ref:
-            zip_ref.extractall(extract_to)
+        with profile_stage("extract") as rec, zipfile.ZipFile(zip_path, "r") as zip_ref:
+            members = [m for m in zip_ref.infolist() if is_wanted_member(m.filename)]
+            zip_ref.extractall(extract_to, members=members)
+            rec.bytes_read += path_size(zip_path)
+            rec.bytes_written += sum(m.file_size for m in members)
         logger.info(f"Extraction complete: {extract_to}")
         return True
 
@@ -89,67 +231,94 @@ def extract_zip(zip_path: Path, extract_to: Path) -> bool:
         return False
 
 
-def process_layer(layer: dict) -> bool:
+def process_layer(layer: LayerConfig) -> bool:
     logger.debug(f"Processing layer config: {layer}")
 
-    required_keys = ["output_dir"]
-    for key in required_keys:
-        if key not in layer:
-            logger.error(f"Missing required key '{key}' in layer config: {layer}")
-            return False
-
     data_in_root = get_data_in_dir()
-    output_dir = data_in_root / layer["output_dir"]
+    output_dir = data_in_root / layer.output_dir
     output_dir.mkdir(parents=True, exist_ok=True)
     logger.info(f"Output directory ensured: {output_dir}")
 
-    if "url" not in layer:
-        logger.error(f"Missing 'url' for layer: {layer}")
+    if not layer.url:
+        logger.error(f"Missing 'url' for layer: {layer.name}")
         return False
 
-    url = layer["url"]
+    url = layer.url
     filename = Path(url).name
     zip_path = output_dir / filename
     extract_path = output_dir / filename.replace(".zip", "")
 
+    stream = (load_pipeline_config().get("fetch") or {}).get("stream_extract", True)
+    if layer.extract and stream and not zip_path.exists() and not extract_path.exists():
+        return download_and_extract(url, zip_path, extract_path)
+
+    before = _mtime_ns(zip_path)
     if not download_file(url, zip_path):
         return False
 
+    if not layer.extract:
+        logger.info(f"Extraction disabled for layer: {layer.name}")
+        return True
+
+    if before is not None and _mtime_ns(zip_path) != before and extract_path.exists():
+        logger.info(f"Source changed upstream; re-extracting {extract_path}")
+        shutil.rmtree(extract_path)
+
     return extract_zip(zip_path, extract_path)
 
 
+def _mtime_ns(path: Path) -> int | None:
+    """
+    Return a file's mtime in nanoseconds, or None if it does not exist.
+    """
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _run_extractor(
+    extractor: StreamingZipExtractor,
+    chunks: queue.Queue,
+    errors: list[Exception],
+) -> None:
+    """
+    Feed queued chunks to the extractor until the None sentinel arrives.
+
+    After an error, keeps draining the queue so the download never blocks.
+    """
+    while (chunk := chunks.get()) is not None:
+        if errors:
+            continue
+        try:
+            extractor.feed(chunk)
+        except Exception as e:
+            extractor.abort()
+            errors.append(e)
+    if not errors:
+        try:
+            extractor.close()
+        except Exception as e:
+            errors.append(e)
+
+
 def main() -> int:
     try:
         logger.info("Starting data download process for Forest layers...")
-        logger.info("Searching for YAML configs in data-config folder...")
+        logger.info("Loading layer configs from data-config folder...")
 
-        yaml_dir = get_repo_root() / "data-config"
-        yaml_files = list(yaml_dir.glob("*.yaml"))
+        layers = load_all_layer_configs()
 
-        if not yaml_files:
-            logger.error(f"No YAML configs found in: {yaml_dir}")
+        if not layers:
+            logger.error("No layers configured in data-config/")
             return 1
 
-        logger.info(f"Found {len(yaml_files)} YAML config file(s) in: {yaml_dir}")
-
-        for yaml_file in yaml_files:
-            logger.info(f"Processing config file: {yaml_file.name}")
-
-            with yaml_file.open("r", encoding="utf-8") as f:
-                try:
-                    config = yaml.safe_load(f)
-                except Exception as e:
-                    logger.error(f"Error parsing YAML file {yaml_file}: {e}")
-                    return 1
-
-                if not config or "layers" not in config:
-                    logger.error(f"YAML config file is empty or missing 'layers': {yaml_file}")
-                    return 1
+        logger.info(f"Found {len(layers)} configured layer(s).")
 
-                for layer in config["layers"]:
-                    if not process_layer(layer):
-                        logger.error(f"Failed processing layer: {layer.get('name', 'Unknown')}")
-                        return 1
+        for layer in layers:
+            if not process_layer(layer):
+                logger.error(f"Failed processing layer: {layer.name}")
+                return 1
 
         logger.info("All forest layers fetched and extracted successfully.")
         return 0
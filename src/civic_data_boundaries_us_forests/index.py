@@ -8,50 +8,142 @@ Used by civic-usa CLI:
     civic-usa index
 
 Currently builds:
-- index.json with bounding boxes
-- Optional: summary manifest
+- index/root.json, a small manifest of per-layer, per-region shards
+  (with shard bboxes), and one compact index per shard, so clients
+  load only the shards their viewport touches. Shard entries carry
+  bounding boxes, feature counts, file sha256, format, crs, layer,
+  kind, and region (GeoJSON files, GeoJSONSeq region/nationwide bundles,
+  label points in data-out/labels/, and the EPSG:3857 variant in data-out-3857/)
+- index.json, compact and limited to the original path, bbox, and
+  size_mb fields, for existing clients
+- index-features.json with per-feature geometry/attribute hashes
+- changes.json listing what changed since the previous index
+- hierarchy.json linking each layer to its parent_layer (districts → forests)
+- summary.json with per-layer feature/vertex counts, raw and gzip sizes,
+  geodesic areas, attribute distributions, and simplification ratios
+- Optional: feature-level patch files in data-out/patches/
 
 MIT License — maintained by Civic Interconnect
 """
 
 import json
 import sys
+from datetime import UTC, datetime
 from pathlib import Path
 
 import geopandas as gpd
 from civic_lib_core import log_utils
 
+from civic_data_boundaries_us_forests.utils.bundle_utils import BUNDLE_SUFFIX, output_format
+from civic_data_boundaries_us_forests.utils.config_utils import (
+    LayerConfig,
+    layer_for_path,
+    load_all_layer_configs,
+    load_pipeline_config,
+)
+from civic_data_boundaries_us_forests.utils.delta_utils import (
+    diff_releases,
+    feature_hashes,
+    write_patches,
+)
+from civic_data_boundaries_us_forests.utils.geometry_pool import read_geojson
 from civic_data_boundaries_us_forests.utils.get_paths import (
+    BUNDLES_DIR_NAME,
+    MERCATOR_DIR_NAME,
     get_data_out_dir,
+    get_mercator_out_dir,
     get_repo_root,
 )
+from civic_data_boundaries_us_forests.utils.hierarchy_utils import (
+    DEFAULT_MIN_OVERLAP,
+    write_hierarchy,
+)
+from civic_data_boundaries_us_forests.utils.label_utils import LABELS_DIR_NAME
+from civic_data_boundaries_us_forests.utils.mercator_utils import WEB_MERCATOR
+from civic_data_boundaries_us_forests.utils.output_store import file_sha256
+from civic_data_boundaries_us_forests.utils.profile_utils import path_size, profile_stage
+from civic_data_boundaries_us_forests.utils.shard_utils import (
+    ROOT_MANIFEST,
+    SHARDS_DIR_NAME,
+    write_index_shards,
+)
+from civic_data_boundaries_us_forests.utils.summary_utils import DEFAULT_TOP_VALUES, write_summary
 
 __all__ = [
     "build_index_main",
     "compute_bbox",
+    "describe_geojson",
     "index_geojsons_in_folder",
     "main",
+    "write_changes",
 ]
 
 logger = log_utils.logger
 
+FEATURES_SIDECAR = "index-features.json"
+CHANGES_FILE = "changes.json"
+PATCH_DIR = "patches"
+# Fields of index.json entries; the shards hold the full entries.
+INDEX_FIELDS = ("path", "bbox", "size_mb")
 
-def build_index_main() -> int:
+
+def build_index_main(patches: bool | None = None) -> int:
     """
     Build index.json summarizing exported GeoJSONs from data-out and data-out-chunked.
     Adds file size in MB (2 decimal places) to each index entry.
+
+    index.json holds only the INDEX_FIELDS of each entry; the full entries
+    go to the index shards (see utils/shard_utils.py).
+
+    Also writes hierarchy.json and summary.json, compares the new build
+    with the previous index shards, and writes changes.json (and, if enabled,
+    feature-level patches).
+
+    Args:
+        patches (bool, optional): Write patch files. Defaults to
+            ``delta.patches`` in config.yaml.
     """
     out_dir = get_data_out_dir()
     chunked_dir = get_repo_root() / "data-out-chunked"
+    index_output_path = out_dir / "index.json"
+
+    previous_index = _read_previous_index(out_dir)
+    previous_features = _read_json(out_dir / FEATURES_SIDECAR, default={})
 
     index = []
+    features: dict[str, dict[str, str]] = {}
+    layers = load_all_layer_configs()
 
     # Index data-out
-    index += index_geojsons_in_folder(out_dir, "data-out")
+    index += index_geojsons_in_folder(out_dir, "data-out", features=features, layers=layers)
+
+    # Index region and nationwide bundles
+    bundles_dir = out_dir / BUNDLES_DIR_NAME
+    if bundles_dir.exists():
+        index += index_geojsons_in_folder(
+            bundles_dir,
+            f"data-out/{BUNDLES_DIR_NAME}",
+            features=features,
+            layers=layers,
+            pattern=f"*{BUNDLE_SUFFIX}",
+        )
+
+    # Index the pre-projected EPSG:3857 variant
+    mercator_dir = get_mercator_out_dir()
+    if mercator_dir.exists():
+        index += index_geojsons_in_folder(
+            mercator_dir,
+            MERCATOR_DIR_NAME,
+            features=features,
+            layers=layers,
+            crs=WEB_MERCATOR,
+        )
 
     # Index data-out-chunked
     if chunked_dir.exists():
-        index += index_geojsons_in_folder(chunked_dir, "data-out-chunked")
+        index += index_geojsons_in_folder(
+            chunked_dir, "data-out-chunked", features=features, layers=layers
+        )
     else:
         logger.info(f"No chunked data found at {chunked_dir}")
 
@@ -67,11 +159,10 @@ def build_index_main() -> int:
             entry["size_mb"] = None
 
     # Write combined index
-    index_output_path = out_dir / "index.json"
     out_dir.mkdir(parents=True, exist_ok=True)
 
     with open(index_output_path, "w", encoding="utf-8") as f:
-        json.dump(index, f, indent=2)
+        json.dump(_legacy_entries(index), f, separators=(",", ":"))
 
     logger.info(f"index.json written to {index_output_path}")
     logger.info(f"Indexed {len(index)} GeoJSON files.")
@@ -81,9 +172,44 @@ def build_index_main() -> int:
     if chunked_index:
         chunked_index_path = chunked_dir / "index.json"
         with open(chunked_index_path, "w", encoding="utf-8") as f:
-            json.dump(chunked_index, f, indent=2)
+            json.dump(_legacy_entries(chunked_index), f, separators=(",", ":"))
         logger.info(f"Chunked-only index.json written to {chunked_index_path}")
 
+    with open(out_dir / FEATURES_SIDECAR, "w", encoding="utf-8") as f:
+        json.dump(features, f, indent=2, sort_keys=True)
+
+    write_index_shards(index, out_dir)
+
+    hierarchy_config = load_pipeline_config().get("hierarchy") or {}
+    write_hierarchy(
+        index,
+        layers,
+        out_dir,
+        min_overlap=float(hierarchy_config.get("min_overlap", DEFAULT_MIN_OVERLAP)),
+    )
+
+    summary_config = load_pipeline_config().get("summary") or {}
+    if summary_config.get("enabled", True):
+        write_summary(
+            index,
+            layers,
+            out_dir,
+            workers=int(summary_config.get("workers", 0)),
+            top_values=int(summary_config.get("top_values", DEFAULT_TOP_VALUES)),
+        )
+
+    if patches is None:
+        patches = bool((load_pipeline_config().get("delta") or {}).get("patches", False))
+
+    write_changes(
+        previous_index,
+        index,
+        previous_features,
+        features,
+        out_dir,
+        patches=patches,
+        id_fields={e["path"]: e.get("id_field") for e in index},
+    )
     return 0
 
 
@@ -97,31 +223,82 @@ def compute_bbox(geojson_path: Path) -> list[float] | None:
     Returns:
         list[float] | None: Bounding box, or None if read fails.
     """
+    info = describe_geojson(geojson_path)
+    return None if info is None else info["bbox"]
+
+
+def describe_geojson(
+    geojson_path: Path,
+    id_field: str | None = None,
+    region_field: str | None = None,
+) -> dict | None:
+    """
+    Read a GeoJSON file once and return its bbox, counts, region, and hashes.
+
+    Args:
+        geojson_path (Path): Path to the GeoJSON file.
+        id_field (str, optional): Attribute holding a stable feature id.
+        region_field (str, optional): Attribute naming the region (e.g. REGION).
+
+    Returns:
+        dict | None: "bbox", "features", "region", "sha256", and
+            "feature_hashes", or None if the file cannot be read. "region"
+            is None unless every feature shares one region value.
+    """
     try:
-        gdf = gpd.read_file(geojson_path)
-        bounds = gdf.total_bounds
-        bbox = [round(float(x), 6) for x in bounds]
-        logger.debug(f"Computed bounds for {geojson_path.name}: {bbox}")
-        return bbox
+        with profile_stage("bbox") as rec:
+            gdf = read_geojson(geojson_path)
+            bbox = [round(float(x), 6) for x in gdf.total_bounds]
+            region = _single_value(gdf, region_field)
+            rec.bytes_read += path_size(geojson_path)
+            rec.features += len(gdf)
+        with profile_stage("hash") as rec:
+            sha256 = file_sha256(geojson_path).hex()
+            hashes = feature_hashes(gdf, id_field)
+            rec.bytes_read += path_size(geojson_path)
+            rec.features += len(gdf)
     except Exception as e:
         logger.warning(f"Could not read {geojson_path}: {e}")
         return None
 
-
-def index_geojsons_in_folder(base_dir: Path, relative_prefix: str) -> list[dict]:
+    return {
+        "bbox": bbox,
+        "features": len(gdf),
+        "region": region,
+        "sha256": sha256,
+        "feature_hashes": hashes,
+    }
+
+
+def index_geojsons_in_folder(
+    base_dir: Path,
+    relative_prefix: str,
+    features: dict[str, dict[str, str]] | None = None,
+    layers: list[LayerConfig] | None = None,
+    pattern: str = "*.geojson",
+    crs: str = "EPSG:4326",
+) -> list[dict]:
     """
     Scan a folder recursively for GeoJSON files and return index entries.
 
+    Each entry's "kind" is "labels" for the label-point files in
+    data-out/labels/ (attributed to the layer they label) and
+    "boundaries" for everything else.
+
     Args:
         base_dir (Path): Folder to scan.
         relative_prefix (str): e.g. "data-out" or "data-out-chunked"
+        features (dict, optional): Filled with {path: {feature id: hash}}.
+        layers (list[LayerConfig], optional): Layers used to look up id fields.
+        pattern (str): File pattern to match, e.g. "*.geojsons" for bundles.
+        crs (str): CRS of the files' coordinates (and of their bbox).
 
     Returns:
         list[dict]: Index entries for each GeoJSON found.
     """
     index_entries = []
 
-    geojson_files = list(base_dir.rglob("*.geojson"))
+    geojson_files = list(base_dir.rglob(pattern))
     if not geojson_files:
         logger.info(f"No geojson files found in {base_dir}")
         return []
@@ -130,25 +307,162 @@ def index_geojsons_in_folder(base_dir: Path, relative_prefix: str) -> list[dict]
 
     for geojson in geojson_files:
         logger.debug(f"Indexing: {geojson}")
-        bbox = compute_bbox(geojson)
-        if bbox is not None:
-            relative_path = geojson.relative_to(base_dir)
+        relative_path = geojson.relative_to(base_dir).as_posix()
+        layer, kind = _owning_layer(relative_prefix, relative_path, layers)
+        id_field = layer.id_field if layer else None
+        region_field = layer.bundle_by if layer else None
+
+        info = describe_geojson(geojson, id_field, region_field)
+        if info is not None:
+            path = f"{relative_prefix}/{relative_path}"
             index_entries.append({
-                "path": f"{relative_prefix}/{str(relative_path).replace('\\', '/')}",
-                "bbox": bbox,
+                "path": path,
+                "format": output_format(geojson),
+                "crs": crs,
+                "layer": layer.name if layer else None,
+                "kind": kind,
+                "region": info["region"],
+                "bbox": info["bbox"],
+                "features": info["features"],
+                "sha256": info["sha256"],
+                "id_field": id_field,
             })
+            if features is not None:
+                features[path] = info["feature_hashes"]
         else:
             logger.warning(f"Skipping {geojson} because bounding box could not be computed.")
 
     return index_entries
 
 
-def main() -> int:
+def write_changes(
+    previous_index: list[dict],
+    index: list[dict],
+    previous_features: dict[str, dict[str, str]],
+    features: dict[str, dict[str, str]],
+    out_dir: Path,
+    patches: bool = False,
+    id_fields: dict[str, str | None] | None = None,
+) -> dict:
+    """
+    Write changes.json (and optional patch files) comparing two releases.
+
+    Args:
+        previous_index (list[dict]): Entries of the previous index.json (empty on first run).
+        index (list[dict]): Entries of the new index.json.
+        previous_features (dict): Previous per-feature hash sidecar.
+        features (dict): New per-feature hash sidecar.
+        out_dir (Path): data-out/ folder.
+        patches (bool): Also write feature-level patches to data-out/patches/.
+        id_fields (dict, optional): Index path → id_field, used for patch feature ids.
+
+    Returns:
+        dict: The change manifest that was written.
+    """
+    changes = diff_releases(previous_index, index, previous_features, features)
+    changes = {
+        "generated_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "has_previous": bool(previous_index),
+        **changes,
+    }
+
+    if patches:
+        changes["patch_dir"] = f"data-out/{PATCH_DIR}"
+        changes["patches"] = write_patches(
+            changes,
+            get_repo_root(),
+            out_dir / PATCH_DIR,
+            previous_index,
+            index,
+            id_fields or {},
+        )
+
+    with open(out_dir / CHANGES_FILE, "w", encoding="utf-8") as f:
+        json.dump(changes, f, indent=2)
+
+    summary = changes["summary"]
+    logger.info(
+        f"changes.json: {summary['files_added']} added, {summary['files_removed']} removed, "
+        f"{summary['files_modified']} modified, {summary['files_unchanged']} unchanged file(s)"
+    )
+    return changes
+
+
+def _legacy_entries(index: list[dict]) -> list[dict]:
+    """
+    Return index entries trimmed to the INDEX_FIELDS of index.json.
+    """
+    return [{field: entry.get(field) for field in INDEX_FIELDS} for entry in index]
+
+
+def _owning_layer(
+    relative_prefix: str,
+    relative_path: str,
+    layers: list[LayerConfig] | None,
+) -> tuple[LayerConfig | None, str]:
+    """
+    Return the layer an indexed file belongs to, and whether it holds labels.
+
+    Label files live outside every published_dir, at data-out/labels/{layer.name}.geojson.
+    """
+    label_dir = f"{LABELS_DIR_NAME}/"
+    if relative_prefix == "data-out" and relative_path.startswith(label_dir):
+        name = relative_path.removeprefix(label_dir).removesuffix(".geojson")
+        layers = layers if layers is not None else load_all_layer_configs()
+        return next((layer for layer in layers if layer.name == name), None), "labels"
+    return layer_for_path(relative_path, layers), "boundaries"
+
+
+def _single_value(gdf: gpd.GeoDataFrame, column: str | None) -> str | None:
+    """
+    Return the one value a column holds across all rows, or None.
+    """
+    if not column or column not in gdf.columns:
+        return None
+    values = gdf[column].dropna().unique()
+    return str(values[0]) if len(values) == 1 else None
+
+
+def _read_previous_index(out_dir: Path) -> list[dict]:
+    """
+    Return the full entries of the previous build, read from its index shards.
+
+    Falls back to index.json for builds from before the shards.
+    """
+    shards_dir = out_dir / SHARDS_DIR_NAME
+    manifest = _read_json(shards_dir / ROOT_MANIFEST, default=None)
+    if manifest is None:
+        return _read_json(out_dir / "index.json", default=[])
+    return [
+        entry
+        for row in manifest.get("shards", [])
+        for entry in _read_json(shards_dir / row["path"], default=[])
+    ]
+
+
+def _read_json(path: Path, default):
+    """
+    Return parsed JSON from path, or default if it is missing or unreadable.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable {path.name}: {e}")
+        return default
+
+
+def main(patches: bool | None = None) -> int:
     """
     CLI entry point for index generation.
+
+    Args:
+        patches (bool, optional): Write feature-level patch files.
     """
     try:
-        return build_index_main()
+        return build_index_main(patches=patches)
     except Exception as e:
         logger.error(f"Index build failed: {e}")
         return 1
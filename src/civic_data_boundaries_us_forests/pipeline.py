@@ -0,0 +1,483 @@
+#!/usr/bin/env python3
+"""
+src/civic_data_boundaries_us_forests/pipeline.py
+
+Fused export + chunk for US Forest boundaries and districts.
+
+This step:
+- reads and simplifies shapefiles from data-in/
+- validates and repairs geometries in memory (validate.enabled), with a
+  report in data-reports/validate.json
+- splits features by attribute in memory
+- decides chunk-or-write per group in memory
+- writes final GeoJSONs once, directly into data-out/
+- writes region and nationwide GeoJSONSeq bundles into data-out/bundles/
+- writes one label-point layer per layer into data-out/labels/
+- records per-layer simplification ratios in data-cache/simplify-stats.json
+- optionally writes the pre-projected EPSG:3857 variant into data-out-3857/
+
+Layers with memory_budget_mb set are read, validated, and bundled in
+windows of features (see utils/batch_export.py); each group is spooled
+to a temporary file and published in the chunk layout once its size is
+known, so peak memory stays within the budget. The output is the same.
+
+Written files are journaled in data-cache/checkpoints/build.jsonl;
+`civic-usa build --resume` after an interrupted run skips the groups
+whose files that run already wrote (see utils/checkpoint.py).
+
+It skips the data-in-geojson/ intermediate tier entirely, so each
+output byte is written once and never re-read. The two-stage
+`civic-usa export` + `civic-usa chunk` remains available as a fallback.
+
+Used by civic-usa CLI:
+    civic-usa build
+
+MIT License — maintained by Civic Interconnect
+"""
+
+import json
+import sys
+from functools import partial
+from pathlib import Path
+
+import geopandas as gpd
+from civic_lib_core import log_utils
+
+from civic_data_boundaries_us_forests.utils.batch_export import (
+    GroupSpool,
+    iter_simplified_batches,
+)
+from civic_data_boundaries_us_forests.utils.bundle_utils import BundleWriter
+from civic_data_boundaries_us_forests.utils.checkpoint import (
+    Checkpoint,
+    open_checkpoint,
+    source_fingerprint,
+)
+from civic_data_boundaries_us_forests.utils.chunk_utils import chunk_or_write_gdf
+from civic_data_boundaries_us_forests.utils.config_utils import (
+    LayerConfig,
+    load_all_layer_configs,
+)
+from civic_data_boundaries_us_forests.utils.export_utils import (
+    geojson_bytes,
+    iter_split_groups,
+    read_simplified,
+    should_skip_file,
+)
+from civic_data_boundaries_us_forests.utils.geometry_pool import GeometryPool, open_geometry_pool
+from civic_data_boundaries_us_forests.utils.get_paths import (
+    chunk_output_paths,
+    get_data_in_dir,
+    get_data_out_dir,
+    get_layer_in_dir,
+    get_layer_mercator_dir,
+    get_layer_out_dir,
+    get_mercator_out_dir,
+    get_reports_dir,
+)
+from civic_data_boundaries_us_forests.utils.label_utils import LabelCollector
+from civic_data_boundaries_us_forests.utils.mercator_utils import (
+    MercatorSettings,
+    load_mercator_settings,
+    to_web_mercator,
+    write_mercator_group,
+)
+from civic_data_boundaries_us_forests.utils.output_store import (
+    get_output_store,
+    remove_temp_files,
+)
+from civic_data_boundaries_us_forests.utils.profile_utils import profile_layer, profile_stage
+from civic_data_boundaries_us_forests.utils.simplify_cache import (
+    SimplifyCache,
+    open_simplify_cache,
+)
+from civic_data_boundaries_us_forests.utils.summary_utils import write_simplify_stats
+from civic_data_boundaries_us_forests.utils.validate_utils import (
+    VALIDATE_REPORT,
+    load_validate_settings,
+    merge_validate_rows,
+    validate_gdf,
+    write_validate_report,
+)
+from civic_data_boundaries_us_forests.utils.write_pipeline import WritePipeline
+
+__all__ = [
+    "build_layer",
+    "main",
+]
+
+logger = log_utils.logger
+
+
+def build_layer(
+    layer: LayerConfig,
+    cache: SimplifyCache | None = None,
+    mercator: MercatorSettings | None = None,
+    validation: dict | None = None,
+    report: list[dict] | None = None,
+    pool: GeometryPool | None = None,
+    checkpoint: Checkpoint | None = None,
+) -> None:
+    """
+    Export and chunk a single layer straight into data-out/.
+
+    Output layout matches `civic-usa export` followed by `civic-usa chunk`:
+    split layers get one subfolder per group under data-out/{layer.published_dir}/.
+    With layer.memory_budget_mb set, sources are read in windows sized to
+    the budget instead of whole.
+
+    Args:
+        layer (LayerConfig): Effective configuration for the layer.
+        cache (SimplifyCache, optional): Simplify cache shared across layers.
+        mercator (MercatorSettings, optional): Also write the EPSG:3857 variant.
+        validation (dict, optional): Validate geometries before writing
+            (settings from load_validate_settings()).
+        report (list[dict], optional): Receives one validation row per shapefile.
+        pool (GeometryPool, optional): Move data-out/ geometries into the shared pool.
+        checkpoint (Checkpoint, optional): Journal written files, and skip
+            groups whose files an interrupted run already wrote. Skipped
+            groups still feed bundles and labels.
+    """
+    input_dir = get_layer_in_dir(layer.output_dir)
+
+    if not input_dir.exists():
+        logger.error(f"Input directory does not exist: {input_dir}")
+        return
+
+    candidates = list(input_dir.glob("*.shp")) or list(input_dir.glob("*/*.shp"))
+    if not candidates:
+        logger.warning(f"No shapefile found for layer: {layer.name} in {input_dir}")
+        return
+
+    # One fingerprint for the layer: any changed source redoes every group.
+    source = ",".join(source_fingerprint(path) for path in sorted(candidates))
+    on_written = partial(checkpoint.mark_written, source=source) if checkpoint is not None else None
+
+    labels = LabelCollector(layer)
+    bundles = BundleWriter(layer) if layer.bundle_by or layer.nationwide else None
+    build_source = _build_source_batched if layer.memory_budget_mb else _build_source
+    try:
+        with WritePipeline(geojson_bytes, on_written=on_written) as writer:
+            for shapefile_path in candidates:
+                if should_skip_file(shapefile_path):
+                    continue
+
+                logger.info(f"Building layer: {layer.name} from {shapefile_path}")
+                build_source(
+                    shapefile_path,
+                    layer,
+                    source,
+                    writer=writer,
+                    labels=labels,
+                    bundles=bundles,
+                    cache=cache,
+                    mercator=mercator,
+                    validation=validation,
+                    report=report,
+                    pool=pool,
+                    checkpoint=checkpoint,
+                )
+    except BaseException:
+        if bundles is not None:
+            bundles.abort()
+        raise
+
+    if bundles is not None:
+        bundles.finish()
+    labels.write()
+    logger.info(f"Finished building layer: {layer.name}")
+
+
+def _build_source(
+    shapefile_path: Path,
+    layer: LayerConfig,
+    source: str,
+    *,
+    writer: WritePipeline,
+    labels: LabelCollector,
+    bundles: BundleWriter | None,
+    cache: SimplifyCache | None,
+    mercator: MercatorSettings | None,
+    validation: dict | None,
+    report: list[dict] | None,
+    pool: GeometryPool | None,
+    checkpoint: Checkpoint | None,
+) -> None:
+    """
+    Build one source shapefile, read whole.
+    """
+    output_dir = get_layer_out_dir(layer.published_dir)
+    gdf = read_simplified(
+        shapefile_path,
+        simplify_tolerance=layer.simplify_tolerance,
+        simplify_mode=layer.simplify_mode,
+        target_vertices=layer.simplify_target_vertices,
+        min_tolerance=layer.simplify_min_tolerance,
+        max_tolerance=layer.simplify_max_tolerance,
+        cache=cache,
+    )
+    gdf = _validate_source(gdf, shapefile_path, layer, validation, report)
+
+    groups = iter_split_groups(gdf, layer.split_by, shapefile_path.stem, label=shapefile_path.name)
+    for stem, sub_gdf in groups:
+        labels.add(sub_gdf, stem)
+        group_dir = output_dir / stem if layer.split_by else output_dir
+        if _group_written(checkpoint, len(sub_gdf), stem, layer, group_dir, source, pool):
+            continue
+        chunk_or_write_gdf(
+            sub_gdf, stem, layer.chunk_max_features, group_dir, writer=writer, pool=pool
+        )
+    if bundles is not None:
+        bundles.add(gdf)
+
+    if mercator is not None:
+        projected = to_web_mercator(gdf, mercator)
+        _write_mercator_groups(projected, shapefile_path, layer, writer, checkpoint, source)
+
+
+def _build_source_batched(
+    shapefile_path: Path,
+    layer: LayerConfig,
+    source: str,
+    *,
+    writer: WritePipeline,
+    labels: LabelCollector,
+    bundles: BundleWriter | None,
+    cache: SimplifyCache | None,
+    mercator: MercatorSettings | None,
+    validation: dict | None,
+    report: list[dict] | None,
+    pool: GeometryPool | None,
+    checkpoint: Checkpoint | None,
+) -> None:
+    """
+    Build one source shapefile window by window (layer.memory_budget_mb).
+
+    Each group's features are spooled until the last window, then
+    published in the chunk layout. Files are written synchronously, so
+    writer is unused.
+    """
+    batches = iter_simplified_batches(
+        shapefile_path,
+        layer.memory_budget_mb,
+        simplify_tolerance=layer.simplify_tolerance,
+        simplify_mode=layer.simplify_mode,
+        target_vertices=layer.simplify_target_vertices,
+        min_tolerance=layer.simplify_min_tolerance,
+        max_tolerance=layer.simplify_max_tolerance,
+        cache=cache,
+    )
+    output_dir = get_layer_out_dir(layer.published_dir)
+    mercator_dir = get_layer_mercator_dir(layer.published_dir)
+    spools: dict[Path, GroupSpool] = {}
+    mercator_spools: dict[Path, GroupSpool] = {}
+    rows: list[dict] = []
+    try:
+        for gdf in batches:
+            if validation is not None:
+                gdf, row = validate_gdf(gdf, repair=validation["repair"])
+                rows.append(row)
+            if bundles is not None:
+                bundles.add(gdf)
+            _spool_groups(gdf, shapefile_path, layer, output_dir, spools, labels=labels, pool=pool)
+            if mercator is not None:
+                projected = to_web_mercator(gdf, mercator)
+                _spool_groups(
+                    projected, shapefile_path, layer, mercator_dir, mercator_spools, keep_crs=True
+                )
+    except BaseException:
+        for spool in (*spools.values(), *mercator_spools.values()):
+            spool.discard()
+        raise
+
+    if rows and report is not None:
+        _add_report_row(report, shapefile_path, layer, merge_validate_rows(rows))
+    _finish_spools([*spools.values(), *mercator_spools.values()], layer, checkpoint, source)
+
+
+def _finish_spools(
+    spools: list[GroupSpool],
+    layer: LayerConfig,
+    checkpoint: Checkpoint | None,
+    source: str,
+) -> None:
+    """
+    Publish spooled groups, skipping those an interrupted run already wrote.
+
+    Pooled geometries of skipped groups were already counted by externalize().
+    """
+    for spool in spools:
+        if _group_written(checkpoint, spool.features, spool.stem, layer, spool.group_dir, source):
+            spool.discard()
+            continue
+        for path in spool.finish(layer.chunk_max_features):
+            if checkpoint is not None:
+                checkpoint.mark_written(path, source)
+
+
+def _group_written(
+    checkpoint: Checkpoint | None,
+    features: int,
+    stem: str,
+    layer: LayerConfig,
+    group_dir: Path,
+    source: str,
+    pool: GeometryPool | None = None,
+) -> bool:
+    """
+    Return True if an interrupted run already wrote every file of this group.
+
+    The pool adopts the references of skipped files so prune() keeps them.
+    """
+    if checkpoint is None:
+        return False
+    paths = chunk_output_paths(stem, features, layer.chunk_max_features, group_dir)
+    if not checkpoint.all_written(paths, source):
+        return False
+    if pool is not None:
+        pool.adopt(paths)
+    logger.debug(f"Already written by the interrupted run: {group_dir / stem}")
+    return True
+
+
+def _write_mercator_groups(
+    projected: gpd.GeoDataFrame,
+    shapefile_path: Path,
+    layer: LayerConfig,
+    writer: WritePipeline,
+    checkpoint: Checkpoint | None,
+    source: str,
+) -> None:
+    """
+    Write one source's EPSG:3857 groups, skipping those already written.
+    """
+    mercator_dir = get_layer_mercator_dir(layer.published_dir)
+    groups = iter_split_groups(
+        projected, layer.split_by, shapefile_path.stem, label=shapefile_path.name
+    )
+    for stem, sub_gdf in groups:
+        group_dir = mercator_dir / stem if layer.split_by else mercator_dir
+        if not _group_written(checkpoint, len(sub_gdf), stem, layer, group_dir, source):
+            write_mercator_group(sub_gdf, stem, layer, writer=writer)
+
+
+def _validate_source(
+    gdf: gpd.GeoDataFrame,
+    shapefile_path: Path,
+    layer: LayerConfig,
+    validation: dict | None,
+    report: list[dict] | None,
+) -> gpd.GeoDataFrame:
+    """
+    Validate (and repair) one source's features and add its report row.
+
+    Returns gdf unchanged when validation is disabled (None).
+    """
+    if validation is None:
+        return gdf
+    gdf, row = validate_gdf(gdf, repair=validation["repair"])
+    if report is not None:
+        _add_report_row(report, shapefile_path, layer, row)
+    return gdf
+
+
+def _spool_groups(
+    gdf: gpd.GeoDataFrame,
+    shapefile_path: Path,
+    layer: LayerConfig,
+    output_dir: Path,
+    spools: dict[Path, GroupSpool],
+    labels: LabelCollector | None = None,
+    pool: GeometryPool | None = None,
+    keep_crs: bool = False,
+) -> None:
+    """
+    Append one window's groups to their spools, opening spools on first use.
+    """
+    groups = iter_split_groups(gdf, layer.split_by, shapefile_path.stem, label=shapefile_path.name)
+    for stem, sub_gdf in groups:
+        if labels is not None:
+            labels.add(sub_gdf, stem)
+        if pool is not None:
+            sub_gdf = pool.externalize(sub_gdf)
+        group_dir = output_dir / stem if layer.split_by else output_dir
+        with profile_stage("write") as rec:
+            data = json.loads(geojson_bytes(sub_gdf, stem, keep_crs=keep_crs))
+            if group_dir / stem not in spools:
+                spools[group_dir / stem] = GroupSpool(group_dir, stem, data.get("crs"))
+            spools[group_dir / stem].append(data["features"])
+            rec.features += len(sub_gdf)
+
+
+def _add_report_row(
+    report: list[dict], shapefile_path: Path, layer: LayerConfig, row: dict
+) -> None:
+    """
+    Add one source's validation row to the build report.
+    """
+    source = shapefile_path.relative_to(get_data_in_dir()).as_posix()
+    report.append({"path": f"data-in/{source}", **row, "layer": layer.name})
+
+
+def main(resume: bool = False) -> int:
+    """
+    CLI entry point for the fused export + chunk pipeline.
+
+    Args:
+        resume (bool): Continue an interrupted run, skipping groups it finished.
+
+    Returns:
+        int: Exit code (0 if successful, 1 if failed).
+    """
+    try:
+        logger.info("=== Starting BUILD (fused export + chunk) for Forest layers ===")
+
+        get_data_out_dir().mkdir(parents=True, exist_ok=True)
+        remove_temp_files(get_data_out_dir())
+        remove_temp_files(get_mercator_out_dir())
+        layers = load_all_layer_configs()
+        cache = open_simplify_cache()
+        mercator = load_mercator_settings()
+        settings = load_validate_settings()
+        validation = settings if settings["enabled"] else None
+        report: list[dict] = []
+        pool = open_geometry_pool()
+        store = get_output_store()
+        store.reset()
+
+        try:
+            with open_checkpoint("build", resume=resume) as checkpoint:
+                for layer in layers:
+                    with profile_layer(layer.name):
+                        build_layer(
+                            layer,
+                            cache=cache,
+                            mercator=mercator,
+                            validation=validation,
+                            report=report,
+                            pool=pool,
+                            checkpoint=checkpoint,
+                        )
+        finally:
+            if cache is not None:
+                logger.info(f"Simplify cache: {cache.hits} hit(s), {cache.misses} miss(es)")
+                cache.close()
+
+        if pool is not None:
+            pool.prune()
+            pool.write_report()
+        if validation is not None:
+            report_path = get_reports_dir() / VALIDATE_REPORT
+            write_validate_report(report, report_path, repair=validation["repair"])
+        store.log_summary("Build outputs")
+        write_simplify_stats()
+        logger.info("=== BUILD complete ===")
+        return 0
+
+    except Exception as e:
+        logger.error(f"Build process failed: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,465 @@
+#!/usr/bin/env python3
+"""
+src/civic_data_boundaries_us_forests/serve.py
+
+Serve data-out/ over HTTP for development and on-prem deployments.
+
+This server:
+- serves files with strong ETags (content sha256) and If-None-Match → 304
+- honors single-range Range requests (and If-Range) with 206/416
+- serves precompressed .br / .gz sidecars when the client accepts them
+- streams /query?bbox=minx,miny,maxx,maxy as a GeoJSON Text Sequence
+  (RFC 8142) of only the features intersecting the bbox, using
+  index.json to skip files that cannot match (see utils/query_utils.py);
+  optional &layer=<name> (repeatable) and &clip=true; features that
+  reference the geometry pool are resolved, so results are self-contained
+  (pooled files and data-out/geometry-pool/ are served as they are)
+
+Built on asyncio streams from the standard library; HTTP/1.1 keep-alive
+is supported so it can be load-tested locally (benchmarks/bench_serve.py).
+
+Used by civic-usa CLI:
+    civic-usa serve --port 8000
+
+MIT License — maintained by Civic Interconnect
+"""
+
+import asyncio
+import hashlib
+import json
+import mimetypes
+import sys
+from email.utils import formatdate
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from civic_lib_core import log_utils
+
+from civic_data_boundaries_us_forests.utils.get_paths import get_data_out_dir
+from civic_data_boundaries_us_forests.utils.query_utils import parse_bbox, query_bbox
+
+__all__ = [
+    "DataServer",
+    "main",
+    "parse_range",
+    "serve",
+]
+
+logger = log_utils.logger
+
+_CHUNK = 1 << 16
+_MAX_HEADER_BYTES = 64 * 1024
+_RS = b"\x1e"
+
+_CONTENT_TYPES = {
+    ".geojson": "application/geo+json",
+    ".geojsons": "application/geo+json-seq",
+    ".json": "application/json",
+}
+
+# Sidecar suffix → Content-Encoding, in order of preference.
+_ENCODINGS = ((".br", "br"), (".gz", "gzip"))
+
+_REASONS = {
+    200: "OK",
+    206: "Partial Content",
+    304: "Not Modified",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    416: "Range Not Satisfiable",
+    500: "Internal Server Error",
+}
+
+
+class _ResponseAbortedError(Exception):
+    """
+    A response failed after its headers were sent; the connection must be dropped.
+    """
+
+
+def parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """
+    Parse a single-range "bytes=" header into an inclusive (start, end).
+
+    Args:
+        header (str): Range header value.
+        size (int): Representation size in bytes.
+
+    Returns:
+        tuple[int, int] | None: Byte range, or None to ignore the header
+            (multiple ranges or another unit).
+
+    Raises:
+        ValueError: If the range is not satisfiable.
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, _, last = spec.strip().partition("-")
+    if first:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    else:
+        suffix = int(last)
+        if suffix <= 0:
+            raise ValueError("Empty suffix range")
+        start, end = max(size - suffix, 0), size - 1
+    if start >= size or start > end:
+        raise ValueError(f"Range {header!r} not satisfiable for {size} bytes")
+    return start, end
+
+
+class DataServer:
+    """
+    Asyncio HTTP/1.1 server for a data-out/ tree.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root.resolve()
+        self._etags: dict[Path, tuple[int, int, str]] = {}
+        self._index: tuple[int, list[dict]] | None = None
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Serve requests on one connection until the client closes it.
+        """
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                    break
+                method, target, headers = _parse_head(head)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                if "content-length" in headers:
+                    await reader.readexactly(int(headers["content-length"]))
+                try:
+                    await self._dispatch(method, target, headers, writer, keep_alive)
+                except (ConnectionError, asyncio.CancelledError):
+                    raise
+                except _ResponseAbortedError as e:
+                    # Headers are out: a status line now would land inside the
+                    # body, so cut the connection and let the client see a
+                    # truncated transfer.
+                    logger.error(f"Error serving {target} after headers were sent: {e.__cause__}")
+                    writer.transport.abort()
+                    break
+                except Exception as e:
+                    logger.error(f"Error serving {target}: {e}")
+                    await _send_error(writer, 500, keep_alive=False)
+                    break
+                if not keep_alive:
+                    break
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(
+        self,
+        method: str,
+        target: str,
+        headers: dict[str, str],
+        writer: asyncio.StreamWriter,
+        keep_alive: bool,
+    ) -> None:
+        if method not in ("GET", "HEAD"):
+            await _send_error(writer, 405, keep_alive, {"Allow": "GET, HEAD"})
+            return
+
+        url = urlsplit(target)
+        if url.path == "/query":
+            await self._query(url.query, writer, keep_alive, head_only=method == "HEAD")
+            return
+
+        path = self._resolve(url.path)
+        if path is None:
+            await _send_error(writer, 404, keep_alive)
+            return
+        await self._send_file(path, headers, writer, keep_alive, head_only=method == "HEAD")
+
+    def _resolve(self, url_path: str) -> Path | None:
+        """
+        Map a URL path to a file under root, refusing anything outside it.
+        """
+        relative = unquote(url_path).lstrip("/") or "index.json"
+        path = (self.root / relative).resolve()
+        if not path.is_relative_to(self.root) or not path.is_file():
+            return None
+        return path
+
+    async def _send_file(
+        self,
+        path: Path,
+        headers: dict[str, str],
+        writer: asyncio.StreamWriter,
+        keep_alive: bool,
+        head_only: bool,
+    ) -> None:
+        body_path, encoding = _select_representation(path, headers.get("accept-encoding", ""))
+        stat = body_path.stat()
+        etag = await self._etag(body_path, stat.st_mtime_ns, stat.st_size)
+
+        response_headers = {
+            "Content-Type": _content_type(path),
+            "ETag": etag,
+            "Last-Modified": formatdate(stat.st_mtime, usegmt=True),
+            "Accept-Ranges": "bytes",
+            "Vary": "Accept-Encoding",
+            "Cache-Control": "no-cache",
+        }
+        if encoding:
+            response_headers["Content-Encoding"] = encoding
+
+        if etag in _etag_list(headers.get("if-none-match", "")):
+            await _send_head(writer, 304, response_headers, keep_alive)
+            return
+
+        status, start, end = 200, 0, stat.st_size - 1
+        range_header = headers.get("range")
+        if_range = headers.get("if-range")
+        if range_header and (if_range is None or if_range == etag):
+            try:
+                byte_range = parse_range(range_header, stat.st_size)
+            except ValueError:
+                response_headers["Content-Range"] = f"bytes */{stat.st_size}"
+                await _send_error(writer, 416, keep_alive, response_headers)
+                return
+            if byte_range is not None:
+                status, (start, end) = 206, byte_range
+                response_headers["Content-Range"] = f"bytes {start}-{end}/{stat.st_size}"
+
+        response_headers["Content-Length"] = str(max(end - start + 1, 0))
+        await _send_head(writer, status, response_headers, keep_alive)
+        if head_only:
+            return
+
+        await _send_body(writer, body_path, start, end)
+
+    async def _etag(self, path: Path, mtime_ns: int, size: int) -> str:
+        """
+        Return a strong ETag from the file's sha256, cached by mtime and size.
+        """
+        cached = self._etags.get(path)
+        if cached and cached[:2] == (mtime_ns, size):
+            return cached[2]
+        digest = await asyncio.to_thread(_sha256_file, path)
+        etag = f'"{digest[:32]}"'
+        self._etags[path] = (mtime_ns, size, etag)
+        return etag
+
+    async def _query(
+        self,
+        query: str,
+        writer: asyncio.StreamWriter,
+        keep_alive: bool,
+        head_only: bool,
+    ) -> None:
+        params = parse_qs(query)
+        try:
+            bbox = parse_bbox(params["bbox"][0])
+        except (KeyError, ValueError):
+            await _send_error(writer, 400, keep_alive, body=b"bbox=minx,miny,maxx,maxy required\n")
+            return
+
+        response_headers = {
+            "Content-Type": "application/geo+json-seq",
+            "Transfer-Encoding": "chunked",
+            "Cache-Control": "no-cache",
+        }
+        await _send_head(writer, 200, response_headers, keep_alive)
+        if head_only:
+            # A HEAD response has no body, not even the last-chunk marker.
+            return
+
+        try:
+            batches = query_bbox(
+                bbox,
+                layers=params.get("layer"),
+                clip=params.get("clip", ["false"])[0].lower() in ("1", "true", "yes"),
+                index=self._load_index(),
+                root=self.root,
+            )
+            while (gdf := await asyncio.to_thread(next, batches, None)) is not None:
+                features = json.loads(gdf.to_json(drop_id=True))["features"]
+                data = b"".join(_RS + json.dumps(f).encode("utf-8") + b"\n" for f in features)
+                writer.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            raise
+        except Exception as e:
+            # No terminating chunk: the client must not mistake this for a full result.
+            raise _ResponseAbortedError from e
+
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    def _load_index(self) -> list[dict]:
+        """
+        Read index.json, reloading it when it changes on disk.
+        """
+        index_path = self.root / "index.json"
+        try:
+            mtime = index_path.stat().st_mtime_ns
+        except OSError:
+            return []
+        if self._index is None or self._index[0] != mtime:
+            with index_path.open(encoding="utf-8") as f:
+                self._index = (mtime, json.load(f))
+        return self._index[1]
+
+
+async def serve(host: str, port: int, root: Path | None = None) -> None:
+    """
+    Run the data server until cancelled.
+
+    Args:
+        host (str): Interface to bind.
+        port (int): TCP port.
+        root (Path, optional): Folder to serve (default: data-out/).
+    """
+    server = DataServer(root or get_data_out_dir())
+    tcp_server = await asyncio.start_server(server.handle, host, port, limit=_MAX_HEADER_BYTES)
+    logger.info(f"Serving {server.root} on http://{host}:{port}/ (Ctrl+C to stop)")
+    async with tcp_server:
+        await tcp_server.serve_forever()
+
+
+def main(host: str = "127.0.0.1", port: int = 8000) -> int:
+    """
+    CLI entry point for the data server.
+
+    Returns:
+        int: Exit code (0 if stopped cleanly, 1 if failed).
+    """
+    try:
+        asyncio.run(serve(host, port))
+        return 0
+    except KeyboardInterrupt:
+        logger.info("Server stopped.")
+        return 0
+    except Exception as e:
+        logger.error(f"Server failed: {e}")
+        return 1
+
+
+def _accepted_encodings(header: str) -> set[str]:
+    """
+    Return the content codings an Accept-Encoding header allows (q > 0).
+    """
+    accepted = set()
+    for token in header.split(","):
+        coding, *params = (part.strip() for part in token.split(";"))
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding and q > 0:
+            accepted.add(coding.lower())
+    return accepted
+
+
+def _content_type(path: Path) -> str:
+    return _CONTENT_TYPES.get(path.suffix) or (
+        mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    )
+
+
+def _etag_list(header: str) -> set[str]:
+    return {tag.strip().removeprefix("W/") for tag in header.split(",") if tag.strip()}
+
+
+def _parse_head(head: bytes) -> tuple[str, str, dict[str, str]]:
+    """
+    Split a request head into method, target, and lower-cased headers.
+    """
+    lines = head.decode("latin-1").split("\r\n")
+    method, target, _ = lines[0].split(" ", 2)
+    headers = {}
+    for line in lines[1:]:
+        if ":" in line:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+    return method, target, headers
+
+
+def _select_representation(path: Path, accept_encoding: str) -> tuple[Path, str | None]:
+    """
+    Pick a precompressed sidecar the client accepts, else the file itself.
+    """
+    accepted = _accepted_encodings(accept_encoding)
+    for suffix, encoding in _ENCODINGS:
+        sidecar = path.with_name(path.name + suffix)
+        if encoding in accepted and sidecar.is_file():
+            return sidecar, encoding
+    return path, None
+
+
+async def _send_body(writer: asyncio.StreamWriter, path: Path, start: int, end: int) -> None:
+    """
+    Stream bytes start..end (inclusive) of a file after its headers were sent.
+
+    Reads run off the event loop, so a large file or a slow disk never
+    stalls other connections.
+    """
+    try:
+        with path.open("rb") as f:
+            f.seek(start)
+            remaining = end - start + 1
+            while remaining > 0:
+                chunk = await asyncio.to_thread(f.read, min(_CHUNK, remaining))
+                if not chunk:
+                    break
+                writer.write(chunk)
+                remaining -= len(chunk)
+                await writer.drain()
+    except (ConnectionError, asyncio.CancelledError):
+        raise
+    except Exception as e:
+        raise _ResponseAbortedError from e
+
+
+async def _send_error(
+    writer: asyncio.StreamWriter,
+    status: int,
+    keep_alive: bool,
+    headers: dict[str, str] | None = None,
+    body: bytes | None = None,
+) -> None:
+    body = body if body is not None else f"{status} {_REASONS[status]}\n".encode()
+    headers = {
+        **(headers or {}),
+        "Content-Type": "text/plain; charset=utf-8",
+        "Content-Length": str(len(body)),
+    }
+    headers.pop("Content-Encoding", None)
+    await _send_head(writer, status, headers, keep_alive)
+    writer.write(body)
+    await writer.drain()
+
+
+async def _send_head(
+    writer: asyncio.StreamWriter,
+    status: int,
+    headers: dict[str, str],
+    keep_alive: bool,
+) -> None:
+    lines = [f"HTTP/1.1 {status} {_REASONS[status]}", f"Date: {formatdate(usegmt=True)}"]
+    lines += [f"{name}: {value}" for name, value in headers.items()]
+    lines.append(f"Connection: {'keep-alive' if keep_alive else 'close'}")
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+    await writer.drain()
+
+
+def _sha256_file(path: Path) -> str:
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
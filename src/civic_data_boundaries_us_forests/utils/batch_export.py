@@ -0,0 +1,381 @@
+"""
+civic_data_boundaries_us_forests.utils.batch_export
+
+Memory-bounded export for source layers larger than memory (e.g. PAD-US).
+
+- Reads the shapefile in windows of features with pyogrio
+  (skip_features / max_features), sized from a memory budget.
+- Simplifies and splits each window on its own.
+- Appends each group's features to a streaming FeatureCollection
+  writer, so only one window is ever held in memory.
+- GroupSpool does the same for `civic-usa build`, where a group's
+  chunk layout is only known once its last window has been read.
+
+Output is byte-for-byte what the in-memory export writes for the same
+features, so the output store still skips unchanged files. In "area"
+simplify mode the reference area is the median of each window rather
+than of the whole layer.
+
+MIT License — maintained by Civic Interconnect
+"""
+
+import itertools
+import json
+import textwrap
+from collections.abc import Iterator
+from pathlib import Path
+
+import geopandas as gpd
+import pyogrio
+from civic_lib_core import log_utils
+
+from civic_data_boundaries_us_forests.utils.checkpoint import Checkpoint, source_fingerprint
+from civic_data_boundaries_us_forests.utils.export_utils import (
+    geojson_bytes,
+    iter_split_groups,
+    shapefile_size,
+)
+from civic_data_boundaries_us_forests.utils.get_paths import chunk_output_paths
+from civic_data_boundaries_us_forests.utils.label_utils import LabelCollector
+from civic_data_boundaries_us_forests.utils.output_store import get_output_store, temp_path
+from civic_data_boundaries_us_forests.utils.profile_utils import profile_stage
+from civic_data_boundaries_us_forests.utils.simplify_cache import SimplifyCache
+from civic_data_boundaries_us_forests.utils.simplify_utils import simplify_geometries
+from civic_data_boundaries_us_forests.utils.summary_utils import record_simplify_stats
+
+__all__ = [
+    "FeatureCollectionWriter",
+    "GroupSpool",
+    "batch_size_for",
+    "export_split_geojson_batched",
+    "iter_feature_batches",
+    "iter_simplified_batches",
+]
+
+logger = log_utils.logger
+
+# In-memory size of a feature relative to its on-disk shapefile size:
+# source geometry, simplified copy, attributes, and GeoJSON text.
+_MEMORY_FACTOR = 6.0
+
+# Spooled features handed to a FeatureCollectionWriter per append.
+_SPOOL_BATCH = 1000
+
+
+class FeatureCollectionWriter:
+    """
+    Incrementally write one GeoJSON FeatureCollection across many batches.
+
+    Features are appended to a temporary file that is opened only while
+    writing, so thousands of groups never hold thousands of file handles.
+    finish() moves it into place through the output store.
+
+    Pass the GeoJSON 'crs' member as crs to keep it (see geojson_bytes()).
+    """
+
+    def __init__(self, dest: Path, name: str, crs: dict | None = None) -> None:
+        self.dest = dest
+        self.tmp = dest.with_name(dest.name + ".part")
+        self.features = 0
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        header = {"type": "FeatureCollection", "name": name}
+        if crs is not None:
+            header["crs"] = crs
+        opening = json.dumps(header, indent=2).removesuffix("\n}")
+        self.tmp.write_text(opening + ',\n  "features": [\n', encoding="utf-8")
+
+    def append(self, features: list[dict]) -> int:
+        """
+        Append GeoJSON Feature dicts.
+
+        Args:
+            features (list[dict]): Features to append.
+
+        Returns:
+            int: Bytes appended.
+        """
+        if not features:
+            return 0
+        parts = [textwrap.indent(json.dumps(f, indent=2), "    ") for f in features]
+        text = (",\n" if self.features else "") + ",\n".join(parts)
+        with self.tmp.open("a", encoding="utf-8") as f:
+            f.write(text)
+        self.features += len(features)
+        return len(text.encode("utf-8"))
+
+    def finish(self) -> bool:
+        """
+        Close the collection and move it into place.
+
+        Returns:
+            bool: True if dest was written, False if it was unchanged.
+        """
+        with self.tmp.open("a", encoding="utf-8") as f:
+            f.write("\n  ]\n}")
+        return get_output_store().commit_file(self.tmp, self.dest)
+
+    def abort(self) -> None:
+        """
+        Discard the partial file.
+        """
+        self.tmp.unlink(missing_ok=True)
+
+
+class GroupSpool:
+    """
+    Collect one output group's features across windows, then publish it
+    in the chunk layout once its final size is known.
+
+    Features are appended as one compact JSON line each to a hidden
+    temporary file; finish() streams them back out as {stem}.geojson or
+    {stem}_chunked.geojson/{stem}_NNN.geojson parts, byte for byte what
+    chunk_or_write_gdf() writes for the whole group.
+    """
+
+    def __init__(self, group_dir: Path, stem: str, crs: dict | None = None) -> None:
+        self.group_dir = group_dir
+        self.stem = stem
+        self.crs = crs
+        self.features = 0
+        group_dir.mkdir(parents=True, exist_ok=True)
+        self.tmp = temp_path(group_dir / f"{stem}.spool")
+        self.tmp.write_bytes(b"")
+
+    def append(self, features: list[dict]) -> None:
+        """
+        Append GeoJSON Feature dicts.
+
+        Args:
+            features (list[dict]): Features to append.
+        """
+        if not features:
+            return
+        with self.tmp.open("a", encoding="utf-8") as f:
+            f.writelines(json.dumps(feature) + "\n" for feature in features)
+        self.features += len(features)
+
+    def finish(self, max_features: int) -> list[Path]:
+        """
+        Write the group's files and discard the spool.
+
+        Args:
+            max_features (int): Threshold for chunking.
+
+        Returns:
+            list[Path]: The files written (see chunk_output_paths()).
+        """
+        paths = chunk_output_paths(self.stem, self.features, max_features, self.group_dir)
+        size = max_features if len(paths) > 1 else self.features
+        try:
+            with profile_stage("write") as rec, self.tmp.open(encoding="utf-8") as lines:
+                for path in paths:
+                    writer = FeatureCollectionWriter(path, path.stem, self.crs)
+                    try:
+                        part = itertools.islice(lines, size)
+                        for batch in itertools.batched(part, _SPOOL_BATCH):
+                            rec.bytes_written += writer.append([json.loads(b) for b in batch])
+                    except BaseException:
+                        writer.abort()
+                        raise
+                    writer.finish()
+                    logger.info(f"Saved GeoJSON: {path} ({writer.features} features)")
+        finally:
+            self.discard()
+        return paths
+
+    def discard(self) -> None:
+        """
+        Delete the spool without writing anything.
+        """
+        self.tmp.unlink(missing_ok=True)
+
+
+def batch_size_for(shp_path: Path, memory_budget_mb: float) -> int:
+    """
+    Return how many features to read per window to stay within a memory budget.
+
+    Args:
+        shp_path (Path): Path to the .shp file.
+        memory_budget_mb (float): Memory budget in MB.
+
+    Returns:
+        int: Features per window (at least 1).
+    """
+    total = pyogrio.read_info(shp_path)["features"]
+    if total <= 0:
+        return 1
+    bytes_per_feature = shapefile_size(shp_path) / total
+    batch = int(memory_budget_mb * 1_048_576 / max(bytes_per_feature * _MEMORY_FACTOR, 1.0))
+    return max(1, min(batch, total))
+
+
+def export_split_geojson_batched(
+    shp_path: Path,
+    output_dir: Path,
+    memory_budget_mb: float,
+    split_by: str | None = None,
+    simplify_tolerance: float = 0.01,
+    simplify_mode: str = "fixed",
+    target_vertices: int = 500,
+    min_tolerance: float = 0.0001,
+    max_tolerance: float = 0.05,
+    cache: SimplifyCache | None = None,
+    labels: LabelCollector | None = None,
+    checkpoint: Checkpoint | None = None,
+) -> None:
+    """
+    Export a shapefile window by window, keeping peak memory within a budget.
+
+    Produces the same files as export_split_geojson(), and honors a
+    checkpoint the same way: groups journaled by an interrupted run are
+    still read (for labels) but not serialized or written again.
+
+    Args:
+        shp_path (Path): Path to the .shp file.
+        output_dir (Path): Output folder for GeoJSON files.
+        memory_budget_mb (float): Memory budget in MB for one window of features.
+        split_by (str, optional): Attribute to split on.
+        simplify_tolerance (float, optional): Simplification tolerance in degrees.
+        simplify_mode (str, optional): "fixed", "area", or "vertices".
+        target_vertices (int, optional): Vertex budget per geometry ("vertices" mode).
+        min_tolerance (float, optional): Lower bound for adaptive tolerances.
+        max_tolerance (float, optional): Upper bound for adaptive tolerances.
+        cache (SimplifyCache, optional): Reuse simplified geometries from earlier runs.
+        labels (LabelCollector, optional): Collects label points for each group.
+        checkpoint (Checkpoint, optional): Journal of completed files (see --resume).
+    """
+    source = source_fingerprint(shp_path)
+    batches = iter_simplified_batches(
+        shp_path,
+        memory_budget_mb,
+        simplify_tolerance=simplify_tolerance,
+        simplify_mode=simplify_mode,
+        target_vertices=target_vertices,
+        min_tolerance=min_tolerance,
+        max_tolerance=max_tolerance,
+        cache=cache,
+    )
+
+    writers: dict[Path, FeatureCollectionWriter] = {}
+    resumed: set[Path] = set()
+    try:
+        for batch in batches:
+            groups = iter_split_groups(batch, split_by, shp_path.stem, label=shp_path.name)
+            for stem, sub_gdf in groups:
+                if labels is not None:
+                    labels.add(sub_gdf, stem)
+                writer = _group_writer(
+                    writers, resumed, output_dir / f"{stem}.geojson", checkpoint, source
+                )
+                if writer is None:
+                    continue
+                with profile_stage("write") as rec:
+                    features = json.loads(geojson_bytes(sub_gdf, stem))["features"]
+                    rec.bytes_written += writer.append(features)
+                    rec.features += len(sub_gdf)
+    except BaseException:
+        for writer in writers.values():
+            writer.abort()
+        raise
+
+    for dest, writer in writers.items():
+        writer.finish()
+        if checkpoint is not None:
+            checkpoint.mark_written(dest, source)
+        logger.info(f"Saved GeoJSON: {dest} ({writer.features} features)")
+        logger.debug(f"Finished group {dest.stem}")
+
+
+def iter_feature_batches(shp_path: Path, batch_size: int) -> Iterator[gpd.GeoDataFrame]:
+    """
+    Yield consecutive windows of features from a shapefile.
+
+    Args:
+        shp_path (Path): Path to the .shp file.
+        batch_size (int): Features per window.
+
+    Yields:
+        gpd.GeoDataFrame: The next window of features.
+    """
+    total = pyogrio.read_info(shp_path)["features"]
+    bytes_per_feature = shapefile_size(shp_path) / total if total else 0
+
+    for offset in range(0, total, batch_size):
+        with profile_stage("read") as rec:
+            batch = pyogrio.read_dataframe(shp_path, skip_features=offset, max_features=batch_size)
+            rec.features += len(batch)
+            rec.bytes_read += int(bytes_per_feature * len(batch))
+        logger.debug(f"Read features {offset}–{offset + len(batch)} of {total}")
+        yield batch
+
+
+def iter_simplified_batches(
+    shp_path: Path,
+    memory_budget_mb: float,
+    simplify_tolerance: float = 0.01,
+    simplify_mode: str = "fixed",
+    target_vertices: int = 500,
+    min_tolerance: float = 0.0001,
+    max_tolerance: float = 0.05,
+    cache: SimplifyCache | None = None,
+) -> Iterator[gpd.GeoDataFrame]:
+    """
+    Yield simplified windows of a shapefile sized to a memory budget.
+
+    The windowed counterpart of read_simplified(): concatenated, the
+    windows hold the same features and geometries.
+
+    Args:
+        shp_path (Path): Path to the .shp file.
+        memory_budget_mb (float): Memory budget in MB for one window of features.
+        simplify_tolerance (float, optional): Simplification tolerance in degrees.
+        simplify_mode (str, optional): "fixed", "area", or "vertices".
+        target_vertices (int, optional): Vertex budget per geometry ("vertices" mode).
+        min_tolerance (float, optional): Lower bound for adaptive tolerances.
+        max_tolerance (float, optional): Upper bound for adaptive tolerances.
+        cache (SimplifyCache, optional): Reuse simplified geometries from earlier runs.
+
+    Yields:
+        gpd.GeoDataFrame: The next simplified window of features.
+    """
+    batch_size = batch_size_for(shp_path, memory_budget_mb)
+    logger.info(
+        f"Batched read of {shp_path.name}: {batch_size} features per window "
+        f"(budget {memory_budget_mb} MB)"
+    )
+    for batch in iter_feature_batches(shp_path, batch_size):
+        if simplify_tolerance > 0 or simplify_mode != "fixed":
+            with profile_stage("simplify") as rec:
+                simplified, stats = simplify_geometries(
+                    batch.geometry.values,
+                    simplify_tolerance,
+                    mode=simplify_mode,
+                    target_vertices=target_vertices,
+                    min_tolerance=min_tolerance,
+                    max_tolerance=max_tolerance,
+                    cache=cache,
+                )
+                batch["geometry"] = gpd.GeoSeries(simplified, index=batch.index, crs=batch.crs)
+                record_simplify_stats(stats)
+                rec.features += len(batch)
+        yield batch
+
+
+def _group_writer(
+    writers: dict[Path, FeatureCollectionWriter],
+    resumed: set[Path],
+    dest: Path,
+    checkpoint: Checkpoint | None,
+    source: str,
+) -> FeatureCollectionWriter | None:
+    """
+    Return the group's writer, opening it on first use (None if already written).
+    """
+    if dest in resumed:
+        return None
+    if dest not in writers:
+        if checkpoint is not None and checkpoint.is_written(dest, source):
+            resumed.add(dest)
+            return None
+        writers[dest] = FeatureCollectionWriter(dest, dest.stem)
+    return writers[dest]
@@ -0,0 +1,204 @@
+"""
+civic_data_boundaries_us_forests.utils.bundle_utils
+
+Region and nationwide bundles as GeoJSON Text Sequences (RFC 8142).
+
+- One bundle per value of a layer's ``bundle_by`` attribute
+  (e.g. USFS REGION), plus a nationwide bundle for nationwide layers.
+- Each feature is one record: RS (0x1E), a compact JSON text, LF.
+  Clients can parse and draw features as the response streams in,
+  and fetch a whole region in a single request.
+- Bundles live in data-out/bundles/{layer.published_dir}/ and are written
+  through the output store, so unchanged bundles are not rewritten.
+- BundleWriter appends records as features arrive, so `civic-usa build`
+  never holds a whole layer in memory to bundle it.
+
+MIT License — maintained by Civic Interconnect
+"""
+
+import io
+from pathlib import Path
+
+import geopandas as gpd
+import pandas as pd
+from civic_lib_core import log_utils
+
+from civic_data_boundaries_us_forests.utils.config_utils import LayerConfig
+from civic_data_boundaries_us_forests.utils.export_utils import (
+    iter_split_groups,
+    safe_filename,
+)
+from civic_data_boundaries_us_forests.utils.get_paths import (
+    get_layer_bundle_dir,
+    get_layer_in_geojson_dir,
+)
+from civic_data_boundaries_us_forests.utils.output_store import get_output_store, temp_path
+from civic_data_boundaries_us_forests.utils.profile_utils import profile_stage
+
+__all__ = [
+    "BUNDLE_SUFFIX",
+    "NATIONWIDE_BUNDLE",
+    "BundleWriter",
+    "geojson_seq_bytes",
+    "output_format",
+    "read_exported_layer",
+    "write_layer_bundles",
+]
+
+logger = log_utils.logger
+
+BUNDLE_SUFFIX = ".geojsons"
+NATIONWIDE_BUNDLE = "nationwide"
+
+
+class BundleWriter:
+    """
+    Stream a layer's features into its region and nationwide bundles.
+
+    Records are appended to hidden temporary files as frames are added;
+    finish() moves them into place through the output store. The bundles
+    are byte for byte those write_layer_bundles() writes for all the
+    frames concatenated.
+    """
+
+    def __init__(self, layer: LayerConfig) -> None:
+        self.layer = layer
+        self.bundle_dir = get_layer_bundle_dir(layer.published_dir)
+        self.parts: dict[Path, Path] = {}
+        self.features: dict[Path, int] = {}
+
+    def add(self, gdf: gpd.GeoDataFrame) -> None:
+        """
+        Append features to the bundles they belong to.
+
+        Args:
+            gdf (gpd.GeoDataFrame): The next features of the layer.
+        """
+        if self.layer.bundle_by:
+            groups = iter_split_groups(
+                gdf, self.layer.bundle_by, self.layer.name, label=self.layer.name
+            )
+            for stem, sub_gdf in groups:
+                name = f"{safe_filename(self.layer.bundle_by)}-{stem}{BUNDLE_SUFFIX}"
+                self._append(self.bundle_dir / name, sub_gdf)
+
+        if self.layer.nationwide:
+            self._append(self.bundle_dir / f"{NATIONWIDE_BUNDLE}{BUNDLE_SUFFIX}", gdf)
+
+    def finish(self) -> list[Path]:
+        """
+        Publish the bundles and remove those for groups that no longer exist.
+
+        Returns:
+            list[Path]: Bundle files for this layer.
+        """
+        store = get_output_store()
+        for path, tmp in self.parts.items():
+            with profile_stage("bundle") as rec:
+                size = tmp.stat().st_size
+                if store.commit_file(tmp, path):
+                    rec.bytes_written += size
+
+        if self.bundle_dir.exists():
+            for stale in self.bundle_dir.glob(f"*{BUNDLE_SUFFIX}"):
+                if stale not in self.parts:
+                    stale.unlink()
+                    logger.info(f"Removed stale bundle: {stale}")
+
+        if self.parts:
+            logger.info(
+                f"Wrote {len(self.parts)} bundle(s) for {self.layer.name} to {self.bundle_dir}"
+            )
+        return list(self.parts)
+
+    def abort(self) -> None:
+        """
+        Discard the unfinished bundles.
+        """
+        for tmp in self.parts.values():
+            tmp.unlink(missing_ok=True)
+        self.parts.clear()
+
+    def _append(self, path: Path, gdf: gpd.GeoDataFrame) -> None:
+        with profile_stage("bundle") as rec:
+            if path not in self.parts:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                self.parts[path] = temp_path(path)
+                self.parts[path].write_bytes(b"")
+            with self.parts[path].open("ab") as f:
+                f.write(geojson_seq_bytes(gdf))
+            rec.features += len(gdf)
+
+
+def geojson_seq_bytes(gdf: gpd.GeoDataFrame) -> bytes:
+    """
+    Serialize a GeoDataFrame as an RFC 8142 GeoJSON Text Sequence.
+
+    Args:
+        gdf (gpd.GeoDataFrame): Features to serialize.
+
+    Returns:
+        bytes: RS-prefixed, LF-terminated GeoJSON Feature records.
+    """
+    buffer = io.BytesIO()
+    gdf.to_file(buffer, driver="GeoJSONSeq", index=False, layer_options={"RS": "YES"})
+    return buffer.getvalue()
+
+
+def output_format(path: Path | str) -> str:
+    """
+    Return the index "format" value for an output file.
+
+    Args:
+        path (Path | str): Output file path.
+
+    Returns:
+        str: "geojson-seq" for bundles, otherwise "geojson".
+    """
+    return "geojson-seq" if str(path).endswith(BUNDLE_SUFFIX) else "geojson"
+
+
+def read_exported_layer(layer: LayerConfig) -> gpd.GeoDataFrame | None:
+    """
+    Read all of a layer's exported GeoJSONs from data-in-geojson/ as one frame.
+
+    Only the layer's own top-level files are read; nested folders
+    belong to other layers.
+
+    Args:
+        layer (LayerConfig): Layer configuration.
+
+    Returns:
+        gpd.GeoDataFrame | None: All features, or None if nothing was exported.
+    """
+    files = sorted(get_layer_in_geojson_dir(layer.output_dir).glob("*.geojson"))
+    if not files:
+        return None
+
+    with profile_stage("read") as rec:
+        frames = [gpd.read_file(f) for f in files]
+        gdf = gpd.GeoDataFrame(pd.concat(frames, ignore_index=True), crs=frames[0].crs)
+        rec.features += len(gdf)
+    return gdf
+
+
+def write_layer_bundles(gdf: gpd.GeoDataFrame, layer: LayerConfig) -> list[Path]:
+    """
+    Write a layer's region bundles and, if nationwide, its nationwide bundle.
+
+    Bundles for groups that no longer exist are removed.
+
+    Args:
+        gdf (gpd.GeoDataFrame): All features of the layer.
+        layer (LayerConfig): Layer configuration (``bundle_by``, ``nationwide``).
+
+    Returns:
+        list[Path]: Bundle files for this layer.
+    """
+    bundles = BundleWriter(layer)
+    try:
+        bundles.add(gdf)
+    except BaseException:
+        bundles.abort()
+        raise
+    return bundles.finish()
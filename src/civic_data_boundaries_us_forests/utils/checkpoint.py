@@ -0,0 +1,196 @@
+"""
+civic_data_boundaries_us_forests.utils.checkpoint
+
+Per-stage checkpoint journals for resuming interrupted runs.
+
+- Each stage (export, chunk, build) appends one JSON line per completed
+  unit to data-cache/checkpoints/<stage>.jsonl, e.g.
+  {"unit": "data-in-geojson/forests/Tonto_National_Forest.geojson", "source": "81234:1700000000000000000"}
+- A unit is an output file written atomically (see output_store), so a
+  journaled unit is always complete on disk.
+- ``source`` fingerprints the input the unit was made from (size and
+  mtime); a unit whose source has changed since is redone.
+- With resume=True the journal is read and kept; otherwise it starts
+  empty. It is deleted when the stage completes, so only an interrupted
+  run leaves one behind.
+
+Lines are flushed as they are written, which survives the process being
+killed (OOM, a cancelled CI job). A torn last line is ignored.
+
+MIT License — maintained by Civic Interconnect
+"""
+
+import json
+import threading
+from pathlib import Path
+from typing import Self
+
+from civic_lib_core import log_utils
+
+from civic_data_boundaries_us_forests.utils.get_paths import get_cache_dir, get_repo_root
+
+__all__ = [
+    "CHECKPOINTS_DIR_NAME",
+    "Checkpoint",
+    "open_checkpoint",
+    "source_fingerprint",
+    "unit_name",
+]
+
+logger = log_utils.logger
+
+CHECKPOINTS_DIR_NAME = "checkpoints"
+
+_MISSING = object()
+
+
+class Checkpoint:
+    """
+    Append-only journal of a stage's completed units.
+    """
+
+    def __init__(self, path: Path, resume: bool = False) -> None:
+        self.path = path
+        self.resumed = 0
+        self._done: dict[str, str | None] = {}
+        self._lock = threading.Lock()
+        if resume:
+            self._done = _read_journal(path)
+            logger.info(f"Resuming from {path.name}: {len(self._done)} unit(s) already done")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = path.open("a" if resume else "w", encoding="utf-8")
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close(completed=exc_type is None)
+
+    def close(self, completed: bool) -> None:
+        """
+        Close the journal; delete it if the stage completed.
+
+        Args:
+            completed (bool): The stage finished every unit.
+        """
+        if self._file.closed:
+            return
+        self._file.close()
+        if completed:
+            self.path.unlink(missing_ok=True)
+        if self.resumed:
+            logger.info(f"Skipped {self.resumed} unit(s) completed by the interrupted run")
+
+    def all_written(self, paths: list[Path], source: str | None = None) -> bool:
+        """
+        Return True if every file of a group is journaled and on disk.
+
+        Args:
+            paths (list[Path]): The group's output files.
+            source (str, optional): Current fingerprint of their input.
+        """
+        with self._lock:
+            units = [unit_name(path) for path in paths]
+            if not all(self._done.get(u, _MISSING) == source for u in units):
+                return False
+            if not all(path.exists() for path in paths):
+                return False
+            self.resumed += len(units)
+            return True
+
+    def is_done(self, unit: str, source: str | None = None) -> bool:
+        """
+        Return True if unit was completed from the same source (and counts it).
+
+        Args:
+            unit (str): Unit name (see unit_name()).
+            source (str, optional): Current fingerprint of the unit's input.
+        """
+        with self._lock:
+            if self._done.get(unit, _MISSING) != source:
+                return False
+            self.resumed += 1
+            return True
+
+    def is_written(self, path: Path, source: str | None = None) -> bool:
+        """
+        Return True if an output file was journaled from the same source and is on disk.
+
+        Args:
+            path (Path): Output file.
+            source (str, optional): Current fingerprint of its input.
+        """
+        return self.all_written([path], source)
+
+    def mark_done(self, unit: str, source: str | None = None) -> None:
+        """
+        Record a completed unit. Safe to call from worker threads.
+
+        Args:
+            unit (str): Unit name (see unit_name()).
+            source (str, optional): Fingerprint of the unit's input.
+        """
+        line = json.dumps({"unit": unit, "source": source}) + "\n"
+        with self._lock:
+            self._done[unit] = source
+            self._file.write(line)
+            self._file.flush()
+
+    def mark_written(self, path: Path, source: str | None = None) -> None:
+        """
+        Record an output file as completed (e.g. WritePipeline's on_written).
+
+        Args:
+            path (Path): Output file, already renamed into place.
+            source (str, optional): Fingerprint of its input.
+        """
+        self.mark_done(unit_name(path), source)
+
+
+def open_checkpoint(stage: str, resume: bool = False) -> Checkpoint:
+    """
+    Open data-cache/checkpoints/<stage>.jsonl.
+
+    Args:
+        stage (str): Stage name, e.g. "export".
+        resume (bool): Keep and honor the journal of an interrupted run.
+
+    Returns:
+        Checkpoint: The journal.
+    """
+    return Checkpoint(get_cache_dir() / CHECKPOINTS_DIR_NAME / f"{stage}.jsonl", resume=resume)
+
+
+def source_fingerprint(path: Path) -> str:
+    """
+    Return a cheap fingerprint of an input file: "<size>:<mtime_ns>".
+    """
+    stat = path.stat()
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def unit_name(path: Path) -> str:
+    """
+    Return an output file's unit name (its path relative to the repo root).
+    """
+    try:
+        return path.relative_to(get_repo_root()).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def _read_journal(path: Path) -> dict[str, str | None]:
+    """
+    Read completed units from a journal, ignoring a torn last line.
+    """
+    done: dict[str, str | None] = {}
+    if not path.exists():
+        return done
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            done[entry["unit"]] = entry.get("source")
+    return done
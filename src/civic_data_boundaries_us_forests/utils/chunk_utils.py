@@ -5,33 +5,89 @@ Utilities for chunking and managing GeoJSON files.
 
 - Handles chunking of large GeoJSON files into smaller pieces.
 - Copies smaller files as-is.
-- Provides utility functions for file management and configuration loading.
+- `civic-usa chunk` and `civic-usa build` write parts through the same
+  writer (chunk_or_write_gdf), laid out by get_paths.chunk_output_paths().
+- Schedules one task per file over a process pool, largest files first,
+  and reports per-file timing.
+- Journals each finished task in a checkpoint, with the number of files
+  it wrote, so a resumed run only chunks the files an interrupted run did
+  not finish (or whose outputs have since gone missing).
+- Profiles the process pool as "chunk-pool"; the workers' own "chunk"
+  records are merged in unchanged, so no work is counted twice.
+- Provides utility functions for file management and per-layer chunking parameters.
 """
 
-import shutil
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 
 import geopandas as gpd
-import yaml
 from civic_lib_core import log_utils
-from civic_lib_geo.cli.chunk_geojson import chunk_one
 
-from civic_data_boundaries_us_forests.utils.get_paths import get_repo_root
+from civic_data_boundaries_us_forests.utils.checkpoint import (
+    Checkpoint,
+    source_fingerprint,
+    unit_name,
+)
+from civic_data_boundaries_us_forests.utils.config_utils import (
+    LayerConfig,
+    load_all_layer_configs,
+)
+from civic_data_boundaries_us_forests.utils.export_utils import write_geojson
+from civic_data_boundaries_us_forests.utils.geometry_pool import GeometryPool
+from civic_data_boundaries_us_forests.utils.get_paths import CHUNKED_SUFFIX, chunk_output_paths
+from civic_data_boundaries_us_forests.utils.output_store import OutputStats, get_output_store
+from civic_data_boundaries_us_forests.utils.profile_utils import (
+    StageRecord,
+    enable_profiling,
+    get_profiler,
+    path_size,
+    profile_layer,
+    profile_stage,
+)
+from civic_data_boundaries_us_forests.utils.write_pipeline import WritePipeline
 
 __all__ = [
+    "CHUNK_REPORT",
+    "ChunkTask",
     "chunk_geojson_file",
     "chunk_geojson_folder",
     "chunk_or_copy_file",
+    "chunk_or_write_gdf",
+    "chunk_output_paths",
     "copy_geojson_file",
     "get_chunking_params",
     "geojson_feature_count",
     "is_chunked_file",
     "load_all_layer_configs",
+    "run_chunk_task",
+    "run_chunk_tasks",
     "should_skip_file",
+    "task_outputs",
+    "write_chunk_report",
 ]
 
 logger = log_utils.logger
 
+CHUNK_REPORT = "chunk.json"
+
+
+@dataclass(frozen=True)
+class ChunkTask:
+    """
+    One exported GeoJSON to chunk or copy into data-out/.
+    """
+
+    layer: str
+    source: Path
+    output_dir: Path
+    max_features: int
+    size: int
+
 
 def chunk_geojson_file(
     geojson_file: Path,
@@ -41,26 +97,22 @@ def chunk_geojson_file(
     """
     Chunk a single GeoJSON file into smaller pieces in the output_dir.
 
-    Skips the file if it's a directory or already chunked.
+    Always writes {stem}_chunked.geojson/{stem}_NNN.geojson, even for
+    files within max_features. Skips the file if it's a directory or
+    already chunked.
     """
     if should_skip_file(geojson_file):
         return
 
-    chunked_folder = output_dir / f"{geojson_file.stem}_chunked.geojson"
-    chunked_folder.mkdir(parents=True, exist_ok=True)
-
-    logger.info(f"Chunking file: {geojson_file} → {chunked_folder}")
-    chunk_one(
-        geojson_file,
-        max_features=max_features,
-        output_dir=chunked_folder,
-    )
+    gdf = _read_for_chunking(geojson_file)
+    _write_chunks(gdf, geojson_file.stem, max_features, output_dir, force_chunks=True)
 
 
 def chunk_geojson_folder(
     input_folder: Path,
     max_features: int,
     output_folder: Path,
+    pool: GeometryPool | None = None,
 ) -> None:
     """
     Chunk all eligible GeoJSON files in a folder.
@@ -69,6 +121,7 @@ def chunk_geojson_folder(
         input_folder (Path): Folder containing GeoJSON files.
         max_features (int): Maximum features per chunk.
         output_folder (Path): Destination folder for chunked files.
+        pool (GeometryPool, optional): Move geometries into the shared pool.
     """
     geojson_files = list(input_folder.glob("*.geojson"))
     logger.debug(f"Found {len(geojson_files)} GeoJSON files in {input_folder}")
@@ -82,6 +135,7 @@ def chunk_geojson_folder(
             geojson_file,
             max_features,
             output_folder,
+            pool=pool,
         )
 
 
@@ -89,65 +143,97 @@ def chunk_or_copy_file(
     geojson_file: Path,
     max_features: int,
     output_dir: Path,
+    pool: GeometryPool | None = None,
 ) -> None:
     """
     Decide whether to chunk a GeoJSON file or simply copy it.
 
+    With a geometry pool the file is always rewritten, since its
+    geometries are replaced by references.
+
     Args:
         geojson_file (Path): The file to process.
         max_features (int): Threshold for chunking.
         output_dir (Path): Destination folder.
+        pool (GeometryPool, optional): Move geometries into the shared pool.
     """
+    if pool is not None:
+        gdf = gpd.read_file(geojson_file)
+        chunk_or_write_gdf(gdf, geojson_file.stem, max_features, output_dir, pool=pool)
+        return
+
     feature_count = geojson_feature_count(geojson_file)
 
     if feature_count > max_features:
-        chunked_folder = output_dir / f"{geojson_file.stem}_chunked.geojson"
-        chunked_folder.mkdir(parents=True, exist_ok=True)
-        logger.info(f"Chunking file: {geojson_file} → {chunked_folder}")
-        chunk_one(
-            geojson_file,
-            max_features=max_features,
-            output_dir=chunked_folder,
-        )
+        gdf = _read_for_chunking(geojson_file)
+        chunk_or_write_gdf(gdf, geojson_file.stem, max_features, output_dir)
     else:
         dest = output_dir / geojson_file.name
         copy_geojson_file(geojson_file, dest)
 
 
+def chunk_or_write_gdf(
+    gdf: gpd.GeoDataFrame,
+    stem: str,
+    max_features: int,
+    output_dir: Path,
+    writer: WritePipeline | None = None,
+    pool: GeometryPool | None = None,
+    keep_crs: bool = False,
+) -> None:
+    """
+    Write an in-memory group directly to its final location, chunking if needed.
+
+    Mirrors chunk_or_copy_file() without an intermediate GeoJSON on disk:
+    - small groups are written as {stem}.geojson
+    - large groups are written as {stem}_chunked.geojson/{stem}_NNN.geojson
+
+    Args:
+        gdf (gpd.GeoDataFrame): Features of one exported group.
+        stem (str): File stem for the group.
+        max_features (int): Threshold for chunking.
+        output_dir (Path): Destination folder.
+        writer (WritePipeline, optional): Hand files to this pipeline instead
+            of writing them synchronously.
+        pool (GeometryPool, optional): Move geometries into the shared pool
+            and write geometry_ref properties instead.
+        keep_crs (bool): Keep the GeoJSON 'crs' member (non-WGS 84 output).
+    """
+    if pool is not None:
+        gdf = pool.externalize(gdf)
+    _write_chunks(gdf, stem, max_features, output_dir, writer=writer, keep_crs=keep_crs)
+
+
 def copy_geojson_file(src: Path, dest: Path) -> None:
     """
     Copy a GeoJSON file from src to dest.
+
+    Identical destinations are left untouched; otherwise the copy is a
+    reflink or hardlink where the filesystem allows it.
     """
-    dest.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(src, dest)
-    logger.info(f"Copied unchunked file to: {dest}")
+    with profile_stage("copy") as rec:
+        outcome = get_output_store().copy_file(src, dest)
+        if outcome == "copied":
+            size = path_size(dest)
+            rec.bytes_read += size
+            rec.bytes_written += size
+    logger.info(f"Unchunked file {outcome}: {dest}")
 
 
-def get_chunking_params() -> dict:
+def get_chunking_params(layer: LayerConfig) -> dict:
     """
-    Load chunking and simplification parameters from YAML layer configs.
+    Return the effective chunking and simplification parameters for one layer.
+
+    Args:
+        layer (LayerConfig): Layer configuration.
 
     Returns:
         dict: Dictionary with chunking parameters.
     """
-    chunk_max_features = 500
-    simplify_tolerance = 0.01
-
-    yaml_dir = get_repo_root() / "data-config"
-    yaml_files = list(yaml_dir.glob("*.yaml"))
-
-    for yaml_file in yaml_files:
-        with open(yaml_file, encoding="utf-8") as f:
-            logger.debug(f"Loading config from: {yaml_file.name}")
-            config = yaml.safe_load(f) or {}
-            for layer in config.get("layers", []):
-                chunk_max_features = layer.get("chunk_max_features", chunk_max_features)
-                simplify_tolerance = layer.get("simplify_tolerance", simplify_tolerance)
-
-    return dict(
-        chunk_max_features=chunk_max_features,
-        simplify_tolerance=simplify_tolerance,
-    )
+    return {
+        "chunk_max_features": layer.chunk_max_features,
+        "simplify_tolerance": layer.simplify_tolerance,
+    }
 
 
 def geojson_feature_count(path: Path) -> int:
@@ -161,8 +247,11 @@ def geojson_feature_count(path: Path) -> int:
         int: Feature count or 0 if reading fails.
     """
     try:
-        gdf = gpd.read_file(path)
-        count = len(gdf)
+        with profile_stage("count") as rec:
+            gdf = gpd.read_file(path)
+            count = len(gdf)
+            rec.bytes_read += path_size(path)
+            rec.features += count
         logger.debug(f"{path} has {count} features.")
         return count
     except Exception as e:
@@ -180,27 +269,91 @@ def is_chunked_file(path: Path) -> bool:
     Returns:
         bool: True if the file ends with '_chunked.geojson'.
     """
-    return path.is_file() and path.name.endswith("_chunked.geojson")
+    return path.is_file() and path.name.endswith(CHUNKED_SUFFIX)
 
 
-def load_all_layer_configs() -> list[dict]:
+def run_chunk_task(task: ChunkTask, pool: GeometryPool | None = None) -> dict:
     """
-    Load and merge all YAML layer configs into a single list.
+    Chunk or copy one file and time it.
+
+    Args:
+        task (ChunkTask): File and destination.
+        pool (GeometryPool, optional): Move geometries into the shared pool.
 
     Returns:
-        list[dict]: List of all configured layers.
+        dict: Timing row with "path", "layer", "bytes", and "seconds".
+    """
+    start = time.perf_counter()
+    with profile_layer(task.layer):
+        task.output_dir.mkdir(parents=True, exist_ok=True)
+        chunk_or_copy_file(task.source, task.max_features, task.output_dir, pool=pool)
+    return {
+        "path": task.source.as_posix(),
+        "layer": task.layer,
+        "bytes": task.size,
+        "seconds": round(time.perf_counter() - start, 3),
+    }
+
+
+def run_chunk_tasks(
+    tasks: list[ChunkTask],
+    workers: int = 0,
+    pool: GeometryPool | None = None,
+    checkpoint: Checkpoint | None = None,
+) -> list[dict]:
     """
-    yaml_dir = get_repo_root() / "data-config"
-    yaml_files = sorted(yaml_dir.glob("*.yaml"))
+    Run chunk tasks over a process pool, largest files first.
 
-    all_layers = []
-    for yaml_file in yaml_files:
-        logger.info(f"Processing YAML config: {yaml_file.name}")
-        with open(yaml_file, encoding="utf-8") as f:
-            config = yaml.safe_load(f) or {}
-            all_layers.extend(config.get("layers", []))
+    Every task writes its own destination files, so the output does not
+    depend on scheduling. Starting the largest files first keeps one big
+    file from finishing alone at the end of the run.
+
+    Args:
+        tasks (list[ChunkTask]): Files to chunk or copy.
+        workers (int): Worker processes (0 uses every CPU; 1 runs inline).
+        pool (GeometryPool, optional): Move geometries into the shared pool;
+            keys and counts from the workers are merged into it.
+            (Output tallies and profiler records are merged the same way.)
+        checkpoint (Checkpoint, optional): Journal each task as it finishes
+            and skip tasks an interrupted run already finished.
 
-    return all_layers
+    Returns:
+        list[dict]: One timing row per task run, ordered by source path.
+    """
+    if checkpoint is not None:
+        tasks = _pending_tasks(tasks, checkpoint, pool)
+    tasks = sorted(tasks, key=lambda t: (-t.size, t.source.as_posix()))
+    workers = min(workers or os.cpu_count() or 1, max(len(tasks), 1))
+    logger.info(f"Chunking {len(tasks)} file(s) with {workers} worker(s)")
+
+    rows = []
+    if workers == 1:
+        for task in tasks:
+            rows.append(run_chunk_task(task, pool))
+            _mark_task_done(checkpoint, task)
+    else:
+        store = get_output_store()
+        profiler = get_profiler()
+        empty = GeometryPool(pool.pool_dir, pool.precision) if pool is not None else None
+        with (
+            profile_stage("chunk-pool") as rec,
+            ProcessPoolExecutor(max_workers=workers) as executor,
+        ):
+            futures = {
+                executor.submit(_run_in_worker, task, empty, profiler.enabled): task
+                for task in tasks
+            }
+            for future in as_completed(futures):
+                row, stats, worker_pool, records = future.result()
+                rows.append(row)
+                store.merge(stats)
+                profiler.merge(records)
+                if pool is not None:
+                    pool.merge(worker_pool)
+                _mark_task_done(checkpoint, futures[future])
+                rec.bytes_read += row["bytes"]
+
+    return sorted(rows, key=lambda row: row["path"])
 
 
 def should_skip_file(path: Path) -> bool:
@@ -220,3 +373,135 @@ def should_skip_file(path: Path) -> bool:
         logger.debug(f"Skipping already-chunked file: {path}")
         return True
     return False
+
+
+def task_outputs(task: ChunkTask) -> list[Path]:
+    """
+    Return the files a finished task left in data-out/.
+
+    Args:
+        task (ChunkTask): A chunk task.
+
+    Returns:
+        list[Path]: {stem}.geojson, or the parts in {stem}_chunked.geojson/.
+    """
+    single = task.output_dir / f"{task.source.stem}.geojson"
+    if single.is_file():
+        return [single]
+    return sorted((task.output_dir / f"{task.source.stem}{CHUNKED_SUFFIX}").glob("*.geojson"))
+
+
+def write_chunk_report(rows: list[dict], path: Path, workers: int, seconds: float) -> Path:
+    """
+    Log the slowest files and write per-file timing to a JSON report.
+
+    Args:
+        rows (list[dict]): Rows from run_chunk_tasks().
+        path (Path): Report file (e.g. data-reports/chunk.json).
+        workers (int): Worker processes used.
+        seconds (float): Wall time of the chunk pass.
+
+    Returns:
+        Path: The report file.
+    """
+    slowest = sorted(rows, key=lambda row: -row["seconds"])[:3]
+    if slowest:
+        names = ", ".join(f"{Path(r['path']).name} ({r['seconds']:.2f}s)" for r in slowest)
+        logger.info(f"Chunked {len(rows)} file(s) in {seconds:.2f}s; slowest: {names}")
+
+    report = {
+        "workers": workers,
+        "seconds": round(seconds, 3),
+        "task_seconds": round(sum(row["seconds"] for row in rows), 3),
+        "files": rows,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return path
+
+
+def _run_in_worker(
+    task: ChunkTask, pool: GeometryPool | None, profile: bool = False
+) -> tuple[dict, OutputStats, GeometryPool | None, list[StageRecord]]:
+    """
+    Run one task in a worker process and hand back its output tallies and profile.
+    """
+    store = get_output_store()
+    store.reset()
+    profiler = enable_profiling() if profile else get_profiler()
+    row = run_chunk_task(task, pool)
+    records = list(profiler.records.values()) if profile else []
+    return row, store.stats, pool, records
+
+
+def _mark_task_done(checkpoint: Checkpoint | None, task: ChunkTask) -> None:
+    """
+    Journal a finished task (keyed by its source file) with its output count.
+    """
+    if checkpoint is not None:
+        checkpoint.mark_done(unit_name(task.source), _task_fingerprint(task, task_outputs(task)))
+
+
+def _pending_tasks(
+    tasks: list[ChunkTask], checkpoint: Checkpoint, pool: GeometryPool | None
+) -> list[ChunkTask]:
+    """
+    Drop tasks an interrupted run finished; their pool references are kept.
+
+    A task only counts as finished if the files it wrote are all still
+    there: none missing, and as many as were journaled.
+    """
+    pending = []
+    for task in tasks:
+        outputs = task_outputs(task)
+        if outputs and checkpoint.is_done(unit_name(task.source), _task_fingerprint(task, outputs)):
+            if pool is not None:
+                pool.adopt(outputs)
+        else:
+            pending.append(task)
+    return pending
+
+
+def _task_fingerprint(task: ChunkTask, outputs: list[Path]) -> str:
+    """
+    Fingerprint a task's source file, chunk size, and number of output files.
+    """
+    return f"{source_fingerprint(task.source)}:{task.max_features}:{len(outputs)}"
+
+
+def _read_for_chunking(geojson_file: Path) -> gpd.GeoDataFrame:
+    """
+    Read an exported GeoJSON inside a "chunk" profiling stage.
+    """
+    with profile_stage("chunk") as rec:
+        gdf = gpd.read_file(geojson_file)
+        rec.bytes_read += path_size(geojson_file)
+        rec.features += len(gdf)
+    return gdf
+
+
+def _write_chunks(
+    gdf: gpd.GeoDataFrame,
+    stem: str,
+    max_features: int,
+    output_dir: Path,
+    writer: WritePipeline | None = None,
+    force_chunks: bool = False,
+    keep_crs: bool = False,
+) -> None:
+    """
+    Write a group as the files chunk_output_paths() names for it.
+    """
+    options = {"keep_crs": True} if keep_crs else {}
+    write = partial(writer.submit if writer is not None else write_geojson, **options)
+    paths = chunk_output_paths(stem, len(gdf), max_features, output_dir, force_chunks)
+    paths[0].parent.mkdir(parents=True, exist_ok=True)
+
+    if len(paths) == 1 and not force_chunks:
+        write(gdf, paths[0])
+        logger.info(f"Wrote unchunked file to: {paths[0]}")
+        return
+
+    logger.info(f"Chunking {len(gdf)} features of {stem} → {paths[0].parent}")
+    for path, start in zip(paths, range(0, max(len(gdf), 1), max_features), strict=True):
+        write(gdf.iloc[start : start + max_features], path)
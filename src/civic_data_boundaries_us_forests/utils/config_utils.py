@@ -0,0 +1,323 @@
+"""
+civic_data_boundaries_us_forests.utils.config_utils
+
+Unified, cached loader for pipeline configuration.
+
+- Reads global defaults from config.yaml (``layer_defaults``).
+- Reads and validates every layer in data-config/*.yaml.
+- Returns typed LayerConfig objects with effective per-layer settings.
+
+YAML files are parsed once per process; call clear_config_cache()
+after editing them in a long-running session.
+
+MIT License — maintained by Civic Interconnect
+"""
+
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+
+import yaml
+from civic_lib_core import log_utils
+
+from civic_data_boundaries_us_forests.utils.get_paths import get_repo_root
+
+__all__ = [
+    "DEFAULT_CHUNK_MAX_FEATURES",
+    "DEFAULT_SIMPLIFY_TOLERANCE",
+    "SIMPLIFY_MODES",
+    "LayerConfig",
+    "clear_config_cache",
+    "get_layer_config",
+    "layer_for_path",
+    "load_all_layer_configs",
+    "load_pipeline_config",
+    "parse_layer_config",
+]
+
+logger = log_utils.logger
+
+DEFAULT_CHUNK_MAX_FEATURES = 500
+DEFAULT_SIMPLIFY_TOLERANCE = 0.01
+
+# See utils/simplify_utils.py for what each mode does.
+SIMPLIFY_MODES = ("fixed", "area", "vertices")
+
+
+@dataclass(frozen=True)
+class LayerConfig:
+    """
+    Effective settings for a single layer.
+
+    Values come from the layer entry in data-config/*.yaml,
+    falling back to ``layer_defaults`` in config.yaml,
+    then to the module defaults.
+
+    output_dir names the layer's folder under data-in/ and
+    data-in-geojson/; publish_dir, if set, names its folder under
+    data-out/ (and data-out-3857/, data-out/bundles/) instead.
+    """
+
+    name: str
+    output_dir: str
+    publish_dir: str | None = None
+    url: str | None = None
+    year: int | None = None
+    nationwide: bool = False
+    extract: bool = True
+    split_by: str | None = None
+    id_field: str | None = None
+    bundle_by: str | None = None
+    parent_layer: str | None = None
+    chunk_max_features: int = DEFAULT_CHUNK_MAX_FEATURES
+    simplify_tolerance: float = DEFAULT_SIMPLIFY_TOLERANCE
+    simplify_mode: str = "fixed"
+    simplify_target_vertices: int = 500
+    simplify_min_tolerance: float = 0.0001
+    simplify_max_tolerance: float = 0.05
+    memory_budget_mb: float | None = None
+    source_file: str | None = None
+
+    @property
+    def published_dir(self) -> str:
+        """
+        Return the layer's folder under data-out/ (publish_dir or output_dir).
+        """
+        return self.publish_dir or self.output_dir
+
+
+# Expected Python types for each configurable key (source_file is set by the loader).
+_FIELD_TYPES: dict[str, tuple[type, ...]] = {
+    "name": (str,),
+    "output_dir": (str,),
+    "publish_dir": (str,),
+    "url": (str,),
+    "year": (int,),
+    "nationwide": (bool,),
+    "extract": (bool,),
+    "split_by": (str,),
+    "id_field": (str,),
+    "bundle_by": (str,),
+    "parent_layer": (str,),
+    "chunk_max_features": (int,),
+    "simplify_tolerance": (int, float),
+    "simplify_mode": (str,),
+    "simplify_target_vertices": (int,),
+    "simplify_min_tolerance": (int, float),
+    "simplify_max_tolerance": (int, float),
+    "memory_budget_mb": (int, float),
+}
+
+# Value constraints checked after merging defaults.
+_FLOAT_KEYS = (
+    "simplify_tolerance",
+    "simplify_min_tolerance",
+    "simplify_max_tolerance",
+    "memory_budget_mb",
+)
+_POSITIVE_KEYS = ("chunk_max_features", "simplify_target_vertices", "memory_budget_mb")
+_CHOICES = {"simplify_mode": SIMPLIFY_MODES}
+
+_REQUIRED_KEYS = ("name", "output_dir")
+
+
+def clear_config_cache() -> None:
+    """
+    Discard cached configuration so the next call re-reads the YAML files.
+    """
+    _load_layer_configs.cache_clear()
+    _load_pipeline_config.cache_clear()
+
+
+def get_layer_config(name: str) -> LayerConfig:
+    """
+    Return the effective configuration for a single layer by name.
+
+    Args:
+        name (str): Layer name, e.g. "us-forests".
+
+    Returns:
+        LayerConfig: Effective settings for that layer.
+
+    Raises:
+        KeyError: If no layer with that name is configured.
+    """
+    for layer in load_all_layer_configs():
+        if layer.name == name:
+            return layer
+    raise KeyError(f"No layer named '{name}' in data-config/")
+
+
+def layer_for_path(
+    relative_path: str,
+    layers: list[LayerConfig] | None = None,
+    published: bool = True,
+) -> LayerConfig | None:
+    """
+    Return the layer whose folder contains a path.
+
+    The longest matching folder wins, so nested folders map to the
+    innermost layer.
+
+    Args:
+        relative_path (str): POSIX path relative to data-out/, e.g. "forests/x/x.geojson".
+        layers (list[LayerConfig], optional): Layers to search (default: all configured).
+        published (bool): Match published_dir (paths under data-out/); False
+            matches output_dir (paths under data-in-geojson/).
+
+    Returns:
+        LayerConfig | None: The owning layer, or None if no layer matches.
+    """
+    best, best_dir = None, ""
+    for layer in layers if layers is not None else load_all_layer_configs():
+        folder = (layer.published_dir if published else layer.output_dir).strip("/")
+        if relative_path.startswith(folder + "/") and (best is None or len(folder) > len(best_dir)):
+            best, best_dir = layer, folder
+    return best
+
+
+def load_all_layer_configs() -> list[LayerConfig]:
+    """
+    Load, validate, and merge all YAML layer configs into a list of layers.
+
+    Returns:
+        list[LayerConfig]: Effective configuration for every layer.
+
+    Raises:
+        TypeError: If a YAML file or layer entry is not a mapping.
+        ValueError: If any layer config is invalid.
+    """
+    return list(_load_layer_configs(get_repo_root()))
+
+
+def load_pipeline_config() -> dict:
+    """
+    Load the global config.yaml at the repository root.
+
+    Returns:
+        dict: Parsed config (empty if the file does not exist).
+
+    Raises:
+        TypeError: If config.yaml is not a mapping.
+    """
+    return dict(_load_pipeline_config(get_repo_root()))
+
+
+def parse_layer_config(raw: dict, defaults: dict, source: str) -> LayerConfig:
+    """
+    Validate a raw layer dictionary and merge it with defaults.
+
+    Args:
+        raw (dict): Layer entry from a YAML file.
+        defaults (dict): Values from ``layer_defaults`` in config.yaml.
+        source (str): Name of the YAML file (for error messages).
+
+    Returns:
+        LayerConfig: Effective settings for the layer.
+
+    Raises:
+        TypeError: If the layer entry is not a mapping.
+        ValueError: If required keys are missing or values have the wrong type.
+    """
+    if not isinstance(raw, dict):
+        raise TypeError(f"{source}: each layer must be a mapping, got {type(raw).__name__}")
+
+    label = f"{source}: layer '{raw.get('name', '?')}'"
+
+    missing = [key for key in _REQUIRED_KEYS if not raw.get(key)]
+    if missing:
+        raise ValueError(f"{label} is missing required keys: {missing}")
+
+    unknown = sorted(set(raw) - set(_FIELD_TYPES))
+    if unknown:
+        logger.warning(f"{label} has unknown keys (ignored): {unknown}")
+
+    merged = {key: value for key, value in defaults.items() if key in _FIELD_TYPES}
+    merged.update({key: value for key, value in raw.items() if key in _FIELD_TYPES})
+
+    _check_types(merged, label)
+    _check_values(merged, label)
+
+    for key in _FLOAT_KEYS:
+        if merged.get(key) is not None:
+            merged[key] = float(merged[key])
+
+    return LayerConfig(**merged, source_file=source)
+
+
+def _check_types(merged: dict, label: str) -> None:
+    """
+    Raise ValueError if any value does not match its expected type.
+    """
+    for key, value in merged.items():
+        expected = _FIELD_TYPES[key]
+        # bool is a subclass of int; only accept it where a bool is expected.
+        is_bad_bool = isinstance(value, bool) and bool not in expected
+        if value is not None and (is_bad_bool or not isinstance(value, expected)):
+            names = " or ".join(t.__name__ for t in expected)
+            raise ValueError(f"{label}: '{key}' must be {names}, got {value!r}")
+
+
+def _check_values(merged: dict, label: str) -> None:
+    """
+    Raise ValueError if any value is out of range or not an allowed choice.
+    """
+    for key in _POSITIVE_KEYS:
+        if merged.get(key) is not None and merged[key] <= 0:
+            raise ValueError(f"{label}: '{key}' must be positive")
+
+    for key in _FLOAT_KEYS:
+        if merged.get(key) is not None and merged[key] < 0:
+            raise ValueError(f"{label}: '{key}' must not be negative")
+
+    for key, choices in _CHOICES.items():
+        if merged.get(key) is not None and merged[key] not in choices:
+            raise ValueError(f"{label}: '{key}' must be one of {choices}")
+
+
+@cache
+def _load_layer_configs(repo_root: Path) -> tuple[LayerConfig, ...]:
+    """
+    Parse every data-config/*.yaml once per repository root.
+    """
+    defaults = _load_pipeline_config(repo_root).get("layer_defaults") or {}
+    yaml_dir = repo_root / "data-config"
+    yaml_files = sorted(yaml_dir.glob("*.yaml"))
+
+    layers: list[LayerConfig] = []
+    for yaml_file in yaml_files:
+        logger.info(f"Processing YAML config: {yaml_file.name}")
+        with yaml_file.open("r", encoding="utf-8") as f:
+            config = yaml.safe_load(f) or {}
+
+        if not isinstance(config, dict):
+            raise TypeError(f"{yaml_file.name}: expected a mapping at the top level")
+
+        for raw in config.get("layers") or []:
+            layers.append(parse_layer_config(raw, defaults, yaml_file.name))
+
+    names = [layer.name for layer in layers]
+    duplicates = sorted({n for n in names if names.count(n) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate layer names in data-config/: {duplicates}")
+
+    logger.debug(f"Loaded {len(layers)} layer config(s): {names}")
+    return tuple(layers)
+
+
+@cache
+def _load_pipeline_config(repo_root: Path) -> dict:
+    """
+    Parse config.yaml once per repository root.
+    """
+    config_path = repo_root / "config.yaml"
+    if not config_path.exists():
+        return {}
+
+    with config_path.open("r", encoding="utf-8") as f:
+        config = yaml.safe_load(f) or {}
+
+    if not isinstance(config, dict):
+        raise TypeError(f"{config_path.name}: expected a mapping at the top level")
+
+    return config
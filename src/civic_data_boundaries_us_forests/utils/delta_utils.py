@@ -0,0 +1,232 @@
+"""
+civic_data_boundaries_us_forests.utils.delta_utils
+
+Release-to-release change detection for published outputs.
+
+- feature_hashes() fingerprints each feature's geometry (normalized WKB)
+  and attributes (canonical JSON) separately.
+- diff_releases() compares the previous and new index and lists added,
+  removed, and modified files, plus added/removed/modified features
+  inside each modified file.
+- write_patches() writes one feature-level patch per modified file so
+  clients can update without re-downloading the whole file.
+
+MIT License — maintained by Civic Interconnect
+"""
+
+import hashlib
+import json
+import shutil
+from pathlib import Path
+
+import geopandas as gpd
+import numpy as np
+import shapely
+from civic_lib_core import log_utils
+
+from civic_data_boundaries_us_forests.utils.geometry_pool import read_geojson
+
+__all__ = [
+    "FEATURE_HASH_LENGTH",
+    "diff_features",
+    "diff_releases",
+    "feature_hashes",
+    "patch_filename",
+    "write_patches",
+]
+
+logger = log_utils.logger
+
+# Hex digits kept per hash; 64 bits is ample for change detection.
+FEATURE_HASH_LENGTH = 16
+
+
+def diff_features(before: dict[str, str], after: dict[str, str]) -> dict[str, list[str]]:
+    """
+    Compare two {feature id: hash} maps.
+
+    Args:
+        before (dict[str, str]): Feature hashes from the previous release.
+        after (dict[str, str]): Feature hashes from the new release.
+
+    Returns:
+        dict[str, list[str]]: Sorted feature ids under "added", "removed", and "modified".
+    """
+    return {
+        "added": sorted(after.keys() - before.keys()),
+        "removed": sorted(before.keys() - after.keys()),
+        "modified": sorted(k for k in after.keys() & before.keys() if after[k] != before[k]),
+    }
+
+
+def diff_releases(
+    previous_index: list[dict],
+    index: list[dict],
+    previous_features: dict[str, dict[str, str]],
+    features: dict[str, dict[str, str]],
+) -> dict:
+    """
+    Compare two releases by file sha256 and, for modified files, by feature hashes.
+
+    Args:
+        previous_index (list[dict]): Entries of the previous index.json.
+        index (list[dict]): Entries of the new index.json.
+        previous_features (dict): Previous {path: {feature id: hash}} sidecar.
+        features (dict): New {path: {feature id: hash}} sidecar.
+
+    Returns:
+        dict: Change manifest with "files", "features", and "summary" keys.
+    """
+    before = {e["path"]: e.get("sha256") for e in previous_index}
+    after = {e["path"]: e.get("sha256") for e in index}
+
+    added = sorted(after.keys() - before.keys())
+    removed = sorted(before.keys() - after.keys())
+    # A missing hash (index written by an older release) counts as modified.
+    modified = sorted(
+        p for p in after.keys() & before.keys() if after[p] is None or after[p] != before[p]
+    )
+
+    feature_changes = {}
+    for path in modified:
+        if path in previous_features and path in features:
+            feature_changes[path] = diff_features(previous_features[path], features[path])
+
+    return {
+        "files": {"added": added, "removed": removed, "modified": modified},
+        "features": feature_changes,
+        "summary": {
+            "files_added": len(added),
+            "files_removed": len(removed),
+            "files_modified": len(modified),
+            "files_unchanged": len(after) - len(added) - len(modified),
+            "features_added": sum(len(c["added"]) for c in feature_changes.values()),
+            "features_removed": sum(len(c["removed"]) for c in feature_changes.values()),
+            "features_modified": sum(len(c["modified"]) for c in feature_changes.values()),
+        },
+    }
+
+
+def feature_hashes(gdf: gpd.GeoDataFrame, id_field: str | None = None) -> dict[str, str]:
+    """
+    Fingerprint every feature as "<geometry hash>:<attribute hash>".
+
+    Features are keyed by id_field when it is present and unique,
+    otherwise by position ("#0", "#1", ...).
+
+    Args:
+        gdf (gpd.GeoDataFrame): Features read from one output file.
+        id_field (str, optional): Attribute holding a stable feature id.
+
+    Returns:
+        dict[str, str]: Feature id → combined hash.
+    """
+    ids = _feature_ids(gdf, id_field)
+
+    geoms = np.asarray(gdf.geometry.values, dtype=object)
+    wkbs = shapely.to_wkb(shapely.normalize(geoms))
+    attributes = gdf.drop(columns=gdf.geometry.name)
+    # to_dict("records") returns [] rather than one {} per row when there are no columns.
+    records = attributes.to_dict("records") if len(attributes.columns) else [{}] * len(gdf)
+
+    hashes = {}
+    for fid, wkb, record in zip(ids, wkbs, records, strict=True):
+        geom_hash = _short_hash(wkb if wkb is not None else b"")
+        attrs = json.dumps(record, sort_keys=True, default=str).encode("utf-8")
+        hashes[fid] = f"{geom_hash}:{_short_hash(attrs)}"
+    return hashes
+
+
+def patch_filename(path: str) -> str:
+    """
+    Return the patch file name for an index path.
+
+    Args:
+        path (str): Index path, e.g. "data-out/forests/x/x.geojson".
+
+    Returns:
+        str: e.g. "forests__x__x.patch.json".
+    """
+    relative = path.split("/", 1)[1] if "/" in path else path
+    return relative.removesuffix(".geojson").replace("/", "__") + ".patch.json"
+
+
+def write_patches(
+    changes: dict,
+    repo_root: Path,
+    patch_dir: Path,
+    previous_index: list[dict],
+    index: list[dict],
+    id_fields: dict[str, str | None],
+) -> int:
+    """
+    Write a feature-level patch for every modified file with feature changes.
+
+    Each patch is a GeoJSON FeatureCollection holding the added and modified
+    features (with a "change" member), plus foreign members "removed"
+    (feature ids) and "base_sha256"/"target_sha256" to check the client's copy.
+
+    Args:
+        changes (dict): Output of diff_releases().
+        repo_root (Path): Repository root the index paths are relative to.
+        patch_dir (Path): Folder for patch files; cleared first.
+        previous_index (list[dict]): Entries of the previous index.json.
+        index (list[dict]): Entries of the new index.json.
+        id_fields (dict[str, str | None]): Index path → id_field of its layer.
+
+    Returns:
+        int: Number of patch files written.
+    """
+    if patch_dir.exists():
+        shutil.rmtree(patch_dir)
+    patch_dir.mkdir(parents=True)
+
+    before = {e["path"]: e.get("sha256") for e in previous_index}
+    after = {e["path"]: e.get("sha256") for e in index}
+
+    written = 0
+    for path, feature_change in changes["features"].items():
+        changed_ids = dict.fromkeys(feature_change["added"], "added")
+        changed_ids.update(dict.fromkeys(feature_change["modified"], "modified"))
+        if not changed_ids and not feature_change["removed"]:
+            continue
+
+        gdf = read_geojson(repo_root / path)
+        ids = _feature_ids(gdf, id_fields.get(path))
+        collection = json.loads(gdf.to_json(drop_id=True))
+
+        patch_features = []
+        for fid, feature in zip(ids, collection["features"], strict=True):
+            if fid in changed_ids:
+                patch_features.append({"id": fid, "change": changed_ids[fid], **feature})
+
+        patch = {
+            "type": "FeatureCollection",
+            "path": path,
+            "base_sha256": before.get(path),
+            "target_sha256": after.get(path),
+            "removed": feature_change["removed"],
+            "features": patch_features,
+        }
+        with (patch_dir / patch_filename(path)).open("w", encoding="utf-8") as f:
+            json.dump(patch, f, indent=2)
+        written += 1
+
+    logger.info(f"Wrote {written} patch file(s) to {patch_dir}")
+    return written
+
+
+def _feature_ids(gdf: gpd.GeoDataFrame, id_field: str | None) -> list[str]:
+    """
+    Return stable feature ids: id_field values if usable, else positions.
+    """
+    if id_field and id_field in gdf.columns:
+        values = gdf[id_field]
+        if values.notna().all() and values.is_unique:
+            return [str(v) for v in values]
+        logger.debug(f"'{id_field}' is missing or not unique; using feature positions")
+    return [f"#{i}" for i in range(len(gdf))]
+
+
+def _short_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:FEATURE_HASH_LENGTH]
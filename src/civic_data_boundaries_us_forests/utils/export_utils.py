@@ -6,18 +6,36 @@ Shared export utilities for the US Forest boundaries pipeline.
 MIT License — maintained by Civic Interconnect
 """
 
+import io
 import json
+from collections.abc import Iterator
+from functools import partial
 from pathlib import Path
 
 import geopandas as gpd
 from civic_lib_core import log_utils
 
-__all = [
+from civic_data_boundaries_us_forests.utils.checkpoint import Checkpoint, source_fingerprint
+from civic_data_boundaries_us_forests.utils.label_utils import LabelCollector
+from civic_data_boundaries_us_forests.utils.output_store import get_output_store
+from civic_data_boundaries_us_forests.utils.profile_utils import path_size, profile_stage
+from civic_data_boundaries_us_forests.utils.simplify_cache import SimplifyCache
+from civic_data_boundaries_us_forests.utils.simplify_utils import simplify_geometries
+from civic_data_boundaries_us_forests.utils.summary_utils import record_simplify_stats
+from civic_data_boundaries_us_forests.utils.write_pipeline import WritePipeline
+
+__all__ = [
     "export_split_geojson",
+    "geojson_bytes",
+    "iter_split_groups",
     "load_layer",
+    "read_simplified",
     "remove_crs_field",
+    "safe_filename",
+    "shapefile_size",
     "should_skip_file",
     "validate_columns",
+    "write_geojson",
 ]
 
 
@@ -29,55 +47,128 @@ def export_split_geojson(
     output_dir: Path,
     split_by: str | None = None,
     simplify_tolerance: float = 0.01,
+    simplify_mode: str = "fixed",
+    target_vertices: int = 500,
+    min_tolerance: float = 0.0001,
+    max_tolerance: float = 0.05,
+    cache: SimplifyCache | None = None,
+    labels: LabelCollector | None = None,
+    checkpoint: Checkpoint | None = None,
 ) -> None:
     """
     Export a shapefile to one or more GeoJSON files.
 
     If split_by is provided, saves one file per unique attribute value.
+    Groups are serialized and written by a WritePipeline, so the next
+    group is prepared while earlier ones are still being encoded and
+    flushed to disk.
+
+    With a checkpoint, each written file is journaled, and groups already
+    journaled from this shapefile (by an interrupted run) are not
+    serialized or written again. They still feed the label layer.
 
     Args:
         shp_path (Path): Path to the .shp file.
         output_dir (Path): Output folder.
         split_by (str, optional): Attribute to split on.
         simplify_tolerance (float, optional): Simplification tolerance in degrees.
+        simplify_mode (str, optional): "fixed", "area", or "vertices".
+        target_vertices (int, optional): Vertex budget per geometry ("vertices" mode).
+        min_tolerance (float, optional): Lower bound for adaptive tolerances.
+        max_tolerance (float, optional): Upper bound for adaptive tolerances.
+        cache (SimplifyCache, optional): Reuse simplified geometries from earlier runs.
+        labels (LabelCollector, optional): Collects label points for each group.
+        checkpoint (Checkpoint, optional): Journal of completed files (see --resume).
     """
-    logger.info(f"Reading shapefile: {shp_path}")
-    gdf = gpd.read_file(shp_path)
+    source = source_fingerprint(shp_path)
+    gdf = read_simplified(
+        shp_path,
+        simplify_tolerance=simplify_tolerance,
+        simplify_mode=simplify_mode,
+        target_vertices=target_vertices,
+        min_tolerance=min_tolerance,
+        max_tolerance=max_tolerance,
+        cache=cache,
+    )
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    groups = iter_split_groups(gdf, split_by, shp_path.stem, label=shp_path.name)
+    on_written = partial(checkpoint.mark_written, source=source) if checkpoint is not None else None
+    with WritePipeline(geojson_bytes, on_written=on_written) as writer:
+        for stem, sub_gdf in groups:
+            filepath = output_dir / f"{stem}.geojson"
+            if checkpoint is not None and checkpoint.is_written(filepath, source):
+                logger.debug(f"Already written by the interrupted run: {filepath}")
+            else:
+                writer.submit(sub_gdf, filepath)
+                logger.info(f"Queued GeoJSON: {filepath}")
+            if labels is not None:
+                labels.add(sub_gdf, stem)
 
-    if simplify_tolerance > 0:
-        gdf["geometry"] = gdf["geometry"].simplify(simplify_tolerance, preserve_topology=True)
-        logger.info(f"Simplified geometries with tolerance {simplify_tolerance}")
 
-    if split_by:
-        validate_columns(gdf, [split_by], label=shp_path.name)
+def geojson_bytes(gdf: gpd.GeoDataFrame, name: str, keep_crs: bool = False) -> bytes:
+    """
+    Serialize a GeoDataFrame to GeoJSON bytes without the 'crs' member.
 
-        unique_vals = gdf[split_by].dropna().unique()
-        logger.info(f"Splitting layer by '{split_by}' → {len(unique_vals)} groups")
+    Output matches writing with the GeoJSON driver and then dropping the
+    'crs' member, so unchanged data always yields identical bytes.
 
-        for val in unique_vals:
-            sub_gdf = gdf[gdf[split_by] == val]
-            if sub_gdf.empty:
-                logger.warning(f"Skipped empty group for {split_by}={val}")
-                continue
-            logger.debug(f"Processing group: {val} with {len(sub_gdf)} features")
+    Args:
+        gdf (gpd.GeoDataFrame): Features to serialize.
+        name (str): FeatureCollection name (the file stem).
+        keep_crs (bool): Keep the 'crs' member, for coordinates that are
+            not WGS 84 lon/lat (e.g. the EPSG:3857 variant).
 
-            # Safe filename
-            safe_val = (
-                str(val).strip().lower().replace(" ", "_").replace("/", "-").replace("\\", "-")
-            )
-            filename = f"{safe_val}.geojson"
-            filepath = output_dir / filename
-            output_dir.mkdir(parents=True, exist_ok=True)
+    Returns:
+        bytes: UTF-8 encoded GeoJSON.
+    """
+    buffer = io.BytesIO()
+    gdf.to_file(buffer, driver="GeoJSON", layer=name, index=False)
+    data = json.loads(buffer.getvalue())
+    if not keep_crs:
+        data.pop("crs", None)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def iter_split_groups(
+    gdf: gpd.GeoDataFrame,
+    split_by: str | None,
+    default_stem: str,
+    label: str,
+) -> Iterator[tuple[str, gpd.GeoDataFrame]]:
+    """
+    Yield (file stem, features) pairs for each output group.
+
+    Without split_by, yields the whole GeoDataFrame once under default_stem.
+    Groups are yielded in order of first appearance; null values are skipped.
+
+    Args:
+        gdf (gpd.GeoDataFrame): Features to split.
+        split_by (str, optional): Attribute to split on.
+        default_stem (str): File stem when not splitting.
+        label (str): Name to show in error messages.
+
+    Yields:
+        tuple[str, gpd.GeoDataFrame]: Safe file stem and that group's features.
+    """
+    if not split_by:
+        yield default_stem, gdf
+        return
+
+    validate_columns(gdf, [split_by], label=label)
 
-            sub_gdf.to_file(filepath, driver="GeoJSON", index=False)
-            remove_crs_field(filepath)
-            logger.info(f"Saved split GeoJSON: {filepath}")
-    else:
-        filename = shp_path.stem + ".geojson"
-        filepath = output_dir / filename
-        gdf.to_file(filepath, driver="GeoJSON", index=False)
-        remove_crs_field(filepath)
-        logger.info(f"Saved GeoJSON: {filepath}")
+    with profile_stage("split") as rec:
+        groups = gdf.groupby(split_by, sort=False, dropna=True).indices
+        rec.features += len(gdf)
+    logger.info(f"Splitting layer by '{split_by}' → {len(groups)} groups")
+
+    for val, positions in groups.items():
+        sub_gdf = gdf.iloc[positions]
+        if sub_gdf.empty:
+            logger.warning(f"Skipped empty group for {split_by}={val}")
+            continue
+        logger.debug(f"Processing group: {val} with {len(sub_gdf)} features")
+        yield safe_filename(val), sub_gdf
 
 
 def load_layer(source: Path, required_cols: list[str]) -> gpd.GeoDataFrame:
@@ -96,26 +187,107 @@ def load_layer(source: Path, required_cols: list[str]) -> gpd.GeoDataFrame:
     return gdf
 
 
+def read_simplified(
+    shp_path: Path,
+    simplify_tolerance: float = 0.01,
+    simplify_mode: str = "fixed",
+    target_vertices: int = 500,
+    min_tolerance: float = 0.0001,
+    max_tolerance: float = 0.05,
+    cache: SimplifyCache | None = None,
+) -> gpd.GeoDataFrame:
+    """
+    Read a shapefile and simplify its geometries.
+
+    Args:
+        shp_path (Path): Path to the .shp file.
+        simplify_tolerance (float, optional): Simplification tolerance in degrees.
+        simplify_mode (str, optional): "fixed", "area", or "vertices".
+        target_vertices (int, optional): Vertex budget per geometry ("vertices" mode).
+        min_tolerance (float, optional): Lower bound for adaptive tolerances.
+        max_tolerance (float, optional): Upper bound for adaptive tolerances.
+        cache (SimplifyCache, optional): Reuse simplified geometries from earlier runs.
+
+    Returns:
+        gpd.GeoDataFrame: Simplified features.
+    """
+    logger.info(f"Reading shapefile: {shp_path}")
+    with profile_stage("read") as rec:
+        gdf = gpd.read_file(shp_path)
+        rec.bytes_read += shapefile_size(shp_path)
+        rec.features += len(gdf)
+
+    if simplify_tolerance > 0 or simplify_mode != "fixed":
+        with profile_stage("simplify") as rec:
+            simplified, stats = simplify_geometries(
+                gdf.geometry.values,
+                simplify_tolerance,
+                mode=simplify_mode,
+                target_vertices=target_vertices,
+                min_tolerance=min_tolerance,
+                max_tolerance=max_tolerance,
+                cache=cache,
+            )
+            gdf["geometry"] = gpd.GeoSeries(simplified, index=gdf.index, crs=gdf.crs)
+            record_simplify_stats(stats)
+            rec.features += len(gdf)
+
+    return gdf
+
+
 def remove_crs_field(geojson_path: Path) -> None:
     """
     Remove the 'crs' property from a GeoJSON file, if present.
 
+    The pipeline no longer needs this (geojson_bytes() never writes 'crs');
+    it is kept for callers cleaning up GeoJSON written by other tools.
+    The file is rewritten through the output store.
+
     Args:
         geojson_path (Path): Path to the GeoJSON file.
     """
     try:
-        with geojson_path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        if "crs" in data:
-            del data["crs"]
-            with geojson_path.open("w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
-            logger.debug(f"Removed 'crs' property from {geojson_path}")
+        with profile_stage("crs-strip") as rec:
+            with geojson_path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+            rec.bytes_read += path_size(geojson_path)
+
+            if "crs" in data:
+                del data["crs"]
+                encoded = json.dumps(data, indent=2).encode("utf-8")
+                if get_output_store().write_bytes(geojson_path, encoded):
+                    rec.bytes_written += len(encoded)
+                logger.debug(f"Removed 'crs' property from {geojson_path}")
     except Exception as e:
         logger.warning(f"Could not remove 'crs' from {geojson_path}: {e}")
 
 
+def safe_filename(value: object) -> str:
+    """
+    Turn an attribute value into a safe, lowercase file stem.
+
+    Args:
+        value (object): Attribute value, e.g. "Bly Ranger District".
+
+    Returns:
+        str: File stem, e.g. "bly_ranger_district".
+    """
+    return str(value).strip().lower().replace(" ", "_").replace("/", "-").replace("\\", "-")
+
+
+def shapefile_size(shp_path: Path) -> int:
+    """
+    Return the combined size in bytes of a shapefile and its sidecar files.
+
+    Args:
+        shp_path (Path): Path to the .shp file.
+
+    Returns:
+        int: Total bytes of all files sharing the shapefile's stem.
+    """
+    return sum(path_size(p) for p in shp_path.parent.glob(f"{shp_path.stem}.*"))
+
+
 def should_skip_file(path: Path) -> bool:
     """
     Determine whether this path should be skipped.
@@ -128,6 +300,25 @@ def should_skip_file(path: Path) -> bool:
     return False
 
 
+def write_geojson(gdf: gpd.GeoDataFrame, filepath: Path, keep_crs: bool = False) -> None:
+    """
+    Write a GeoDataFrame to a GeoJSON file without the 'crs' member.
+
+    Goes through the output store, so a file whose content is unchanged
+    is left untouched.
+
+    Args:
+        gdf (gpd.GeoDataFrame): Features to write.
+        filepath (Path): Destination .geojson file.
+        keep_crs (bool): Keep the 'crs' member (see geojson_bytes()).
+    """
+    with profile_stage("write") as rec:
+        data = geojson_bytes(gdf, filepath.stem, keep_crs=keep_crs)
+        if get_output_store().write_bytes(filepath, data):
+            rec.bytes_written += len(data)
+        rec.features += len(gdf)
+
+
 def validate_columns(gdf: gpd.GeoDataFrame, columns: list[str], label: str) -> None:
     """
     Check if required columns exist in a GeoDataFrame.
@@ -0,0 +1,344 @@
+"""
+civic_data_boundaries_us_forests.utils.geometry_pool
+
+Deduplicated geometry store shared by all layers in data-out/.
+
+- Each geometry is keyed by sha256 of its normalized WKB, after snapping
+  to a ``precision`` grid, so identical and near-identical copies (e.g. a
+  national grassland that is also its only ranger district) share a key.
+- Each distinct geometry is stored once, as a GeoJSON geometry object,
+  at data-out/geometry-pool/<key[:2]>/<key>.json. The stored geometry is
+  the canonical form the key was hashed from (snapped, normalized, then
+  oriented per RFC 7946), so a key's file never depends on which layer,
+  file, or worker process saw it first.
+- Pooled features keep their properties, gain a ``geometry_ref``
+  property holding the key, and have a null geometry (valid RFC 7946).
+- read_geojson() resolves references transparently; index, summary,
+  hierarchy, delta patches, and bbox queries all read through it.
+
+Disabled by default (``geometry_pool.enabled`` in config.yaml): plain
+GeoJSON clients cannot follow references.
+
+MIT License — maintained by Civic Interconnect
+"""
+
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+
+import geopandas as gpd
+import numpy as np
+import pyogrio
+import shapely
+from civic_lib_core import log_utils
+
+from civic_data_boundaries_us_forests.utils.config_utils import load_pipeline_config
+from civic_data_boundaries_us_forests.utils.get_paths import (
+    GEOMETRY_POOL_DIR_NAME,
+    get_geometry_pool_dir,
+    get_reports_dir,
+)
+from civic_data_boundaries_us_forests.utils.output_store import get_output_store
+from civic_data_boundaries_us_forests.utils.profile_utils import profile_stage
+
+__all__ = [
+    "DEFAULT_PRECISION",
+    "GEOMETRY_REF",
+    "POOL_REPORT",
+    "GeometryPool",
+    "geometry_keys",
+    "is_pooled",
+    "open_geometry_pool",
+    "pool_path",
+    "read_geojson",
+    "resolve_geometry_refs",
+]
+
+logger = log_utils.logger
+
+GEOMETRY_REF = "geometry_ref"
+POOL_REPORT = "geometry-pool.json"
+
+# Grid (in degrees, about 1 cm) that geometries are snapped to before hashing.
+DEFAULT_PRECISION = 1e-7
+
+
+class GeometryPool:
+    """
+    Writes each distinct geometry once and replaces features' geometries with keys.
+
+    One pool is shared by every layer of a run, so duplicates across
+    layers are found too. Counts cover everything passed to externalize().
+    """
+
+    def __init__(self, pool_dir: Path, precision: float = DEFAULT_PRECISION) -> None:
+        self.pool_dir = pool_dir
+        self.precision = precision
+        self.features = 0
+        self.keys: set[str] = set()
+
+    def adopt(self, paths: list[Path]) -> None:
+        """
+        Count the references of already-written pooled files (e.g. on resume).
+
+        Keeps prune() from deleting geometries that files written by an
+        earlier, interrupted run still point to.
+
+        Args:
+            paths (list[Path]): Pooled GeoJSON files.
+        """
+        for path in paths:
+            refs = pyogrio.read_dataframe(path, columns=[GEOMETRY_REF], read_geometry=False)
+            if GEOMETRY_REF not in refs.columns:
+                continue
+            keys = [key for key in refs[GEOMETRY_REF].tolist() if isinstance(key, str) and key]
+            self.keys.update(keys)
+            self.features += len(keys)
+
+    @property
+    def dedupe_ratio(self) -> float:
+        """
+        Pooled features per stored geometry (1.0 means no duplicates).
+        """
+        return self.features / len(self.keys) if self.keys else 1.0
+
+    def externalize(self, gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+        """
+        Store the frame's geometries in the pool and return a referencing copy.
+
+        Missing and empty geometries stay inline, with a null geometry_ref.
+
+        Args:
+            gdf (gpd.GeoDataFrame): Features in EPSG:4326.
+
+        Returns:
+            gpd.GeoDataFrame: The same features with null geometries and a
+                geometry_ref column.
+        """
+        with profile_stage("pool") as rec:
+            geoms = np.asarray(gdf.geometry.values, dtype=object)
+            canonical = _canonical(geoms, self.precision)
+            keys = _hash_keys(canonical)
+            store = get_output_store()
+            for key, geom in zip(keys, canonical, strict=True):
+                if key is None or key in self.keys:
+                    continue
+                self.keys.add(key)
+                path = pool_path(self.pool_dir, key)
+                # Content-addressed: an existing file already holds this geometry.
+                if not path.exists():
+                    data = shapely.to_geojson(_oriented(geom)).encode("utf-8")
+                    if store.write_bytes(path, data):
+                        rec.bytes_written += len(data)
+            pooled = np.array([key is not None for key in keys], dtype=bool)
+            self.features += int(pooled.sum())
+            rec.features += len(gdf)
+
+        result = gdf.copy()
+        result[GEOMETRY_REF] = keys
+        inline = np.where(pooled, None, geoms)
+        return result.set_geometry(gpd.GeoSeries(inline, index=gdf.index, crs=gdf.crs))
+
+    def merge(self, other: "GeometryPool") -> None:
+        """
+        Add the keys and counts of another pool (e.g. from a worker process).
+
+        Args:
+            other (GeometryPool): Pool filled elsewhere for the same folder.
+        """
+        self.keys |= other.keys
+        self.features += other.features
+
+    def prune(self) -> int:
+        """
+        Delete pool files no longer referenced by this run's features.
+
+        Only call after every layer has been written through this pool.
+
+        Returns:
+            int: Number of files deleted.
+        """
+        removed = 0
+        if not self.pool_dir.exists():
+            return removed
+        for path in sorted(self.pool_dir.rglob("*.json")):
+            if path.stem not in self.keys:
+                path.unlink()
+                removed += 1
+        for folder in sorted(self.pool_dir.iterdir()):
+            if folder.is_dir() and not any(folder.iterdir()):
+                folder.rmdir()
+        if removed:
+            logger.info(f"Removed {removed} unreferenced geometr(ies) from {self.pool_dir}")
+        return removed
+
+    def report(self) -> dict:
+        """
+        Return the pool's counts and dedupe ratio.
+        """
+        return {
+            "precision": self.precision,
+            "features": self.features,
+            "geometries": len(self.keys),
+            "duplicates": self.features - len(self.keys),
+            "dedupe_ratio": round(self.dedupe_ratio, 4),
+        }
+
+    def write_report(self, path: Path | None = None) -> Path:
+        """
+        Log the dedupe ratio and write it to data-reports/geometry-pool.json.
+
+        Args:
+            path (Path, optional): Report file (default: data-reports/geometry-pool.json).
+
+        Returns:
+            Path: The report file.
+        """
+        path = path or get_reports_dir() / POOL_REPORT
+        report = self.report()
+        logger.info(
+            f"Geometry pool: {report['features']} feature(s) → {report['geometries']} "
+            f"geometr(ies), {report['duplicates']} duplicate(s) "
+            f"(dedupe ratio {report['dedupe_ratio']:.2f})"
+        )
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        return path
+
+
+def geometry_keys(geoms: np.ndarray, precision: float = DEFAULT_PRECISION) -> list[str | None]:
+    """
+    Return the pool key of every geometry (None for missing or empty ones).
+
+    Args:
+        geoms (np.ndarray): Shapely geometries.
+        precision (float): Snapping grid applied before hashing (0 disables).
+
+    Returns:
+        list[str | None]: Hex sha256 of the normalized, snapped WKB.
+    """
+    return _hash_keys(_canonical(np.asarray(geoms, dtype=object), precision))
+
+
+def is_pooled(path: Path) -> bool:
+    """
+    Return True if a GeoJSON file references the geometry pool.
+    """
+    return GEOMETRY_REF in pyogrio.read_info(path)["fields"]
+
+
+def open_geometry_pool() -> GeometryPool | None:
+    """
+    Open the geometry pool configured in config.yaml (``geometry_pool``).
+
+    Returns:
+        GeometryPool | None: The pool, or None if disabled.
+    """
+    settings = load_pipeline_config().get("geometry_pool") or {}
+    if not settings.get("enabled", False):
+        return None
+    precision = float(settings.get("precision", DEFAULT_PRECISION))
+    return GeometryPool(get_geometry_pool_dir(), precision=precision)
+
+
+def pool_path(pool_dir: Path, key: str) -> Path:
+    """
+    Return the file holding a pooled geometry, e.g. geometry-pool/3f/3f9a….json.
+    """
+    return pool_dir / key[:2] / f"{key}.json"
+
+
+def read_geojson(path: Path, **kwargs) -> gpd.GeoDataFrame:
+    """
+    Read a GeoJSON file with pyogrio, resolving pooled geometries.
+
+    Args:
+        path (Path): GeoJSON file.
+        **kwargs: Passed to pyogrio.read_dataframe (e.g. columns).
+
+    Returns:
+        gpd.GeoDataFrame: Features with inline geometries and no geometry_ref.
+    """
+    if kwargs.get("columns") is not None:
+        kwargs["columns"] = [*kwargs["columns"], GEOMETRY_REF]
+    gdf = pyogrio.read_dataframe(path, **kwargs)
+    if GEOMETRY_REF not in gdf.columns:
+        return gdf
+    return resolve_geometry_refs(gdf, _pool_dir_for(path))
+
+
+def resolve_geometry_refs(gdf: gpd.GeoDataFrame, pool_dir: Path) -> gpd.GeoDataFrame:
+    """
+    Replace geometry_ref keys with the pooled geometries they point to.
+
+    Args:
+        gdf (gpd.GeoDataFrame): Features read from a pooled file.
+        pool_dir (Path): The geometry-pool folder.
+
+    Returns:
+        gpd.GeoDataFrame: A copy without the geometry_ref column.
+    """
+    if GEOMETRY_REF not in gdf.columns:
+        return gdf
+    with profile_stage("resolve") as rec:
+        geoms = np.asarray(gdf.geometry.values, dtype=object).copy()
+        for i, key in enumerate(gdf[GEOMETRY_REF].tolist()):
+            if isinstance(key, str) and key:
+                geoms[i] = _load_pooled(pool_path(pool_dir, key))
+        rec.features += len(gdf)
+    resolved = gdf.drop(columns=GEOMETRY_REF)
+    return resolved.set_geometry(gpd.GeoSeries(geoms, index=gdf.index, crs=gdf.crs))
+
+
+def _canonical(geoms: np.ndarray, precision: float) -> np.ndarray:
+    """
+    Snap to the precision grid and normalize (None for missing or empty geometries).
+    """
+    canonical = np.full(len(geoms), None, dtype=object)
+    present = np.flatnonzero(~(shapely.is_missing(geoms) | shapely.is_empty(geoms)))
+    if present.size:
+        snapped = geoms[present]
+        if precision > 0:
+            snapped = shapely.set_precision(snapped, precision)
+        canonical[present] = shapely.normalize(snapped)
+    return canonical
+
+
+def _hash_keys(canonical: np.ndarray) -> list[str | None]:
+    """
+    Hash canonical geometries' big-endian WKB.
+    """
+    keys: list[str | None] = [None] * len(canonical)
+    present = np.flatnonzero(~shapely.is_missing(canonical))
+    if present.size:
+        wkbs = shapely.to_wkb(canonical[present], byte_order=1)
+        for i, wkb in zip(present.tolist(), wkbs, strict=True):
+            keys[i] = hashlib.sha256(wkb).hexdigest()
+    return keys
+
+
+@lru_cache(maxsize=4096)
+def _load_pooled(path: Path) -> shapely.Geometry:
+    """
+    Read one pooled geometry (content-addressed, so safe to cache).
+    """
+    return shapely.from_geojson(path.read_bytes())
+
+
+def _oriented(geom: shapely.Geometry) -> shapely.Geometry:
+    """
+    Orient a normalized geometry for storage (exteriors counter-clockwise).
+    """
+    return shapely.orient_polygons(geom, exterior_cw=False)
+
+
+def _pool_dir_for(path: Path) -> Path:
+    """
+    Return the geometry pool of the data-out/ tree holding path.
+    """
+    for parent in path.resolve().parents:
+        candidate = parent / GEOMETRY_POOL_DIR_NAME
+        if candidate.is_dir():
+            return candidate
+    return get_geometry_pool_dir()
@@ -8,18 +8,88 @@ Ensures that the pipeline works when run directly
 from source code and when invoked via the installed CLI.
 """
 
+import os
 from pathlib import Path
 
 __all__ = [
+    "BUNDLES_DIR_NAME",
+    "CHUNKED_SUFFIX",
+    "GEOMETRY_POOL_DIR_NAME",
+    "MERCATOR_DIR_NAME",
+    "REPO_ROOT_ENV_VAR",
+    "chunk_output_paths",
+    "get_cache_dir",
     "get_data_in_dir",
     "get_data_in_geojson_dir",
     "get_data_out_dir",
+    "get_geometry_pool_dir",
+    "get_layer_bundle_dir",
     "get_layer_in_dir",
     "get_layer_in_geojson_dir",
+    "get_layer_mercator_dir",
     "get_layer_out_dir",
+    "get_mercator_out_dir",
     "get_repo_root",
+    "get_reports_dir",
 ]
 
+# Environment variable that points the pipeline at another repository root,
+# e.g. a scratch folder with synthetic inputs used by the benchmark suite.
+REPO_ROOT_ENV_VAR = "CIVIC_USA_REPO_ROOT"
+
+# Folder under data-out/ holding region and nationwide GeoJSONSeq bundles.
+BUNDLES_DIR_NAME = "bundles"
+
+# Folder under data-out/ holding deduplicated geometries shared across layers.
+GEOMETRY_POOL_DIR_NAME = "geometry-pool"
+
+# Sibling of data-out/ holding the optional pre-projected EPSG:3857 variant.
+MERCATOR_DIR_NAME = "data-out-3857"
+
+# Folder suffix for a group split into parts: {stem}_chunked.geojson/{stem}_NNN.geojson.
+CHUNKED_SUFFIX = "_chunked.geojson"
+
+
+def chunk_output_paths(
+    stem: str,
+    feature_count: int,
+    max_features: int,
+    output_dir: Path,
+    force_chunks: bool = False,
+) -> list[Path]:
+    """
+    Return the files a group of this size is published as.
+
+    This is the one definition of the chunk layout; `civic-usa chunk`,
+    `civic-usa build`, resume checks, and label sources all use it.
+
+    Args:
+        stem (str): File stem for the group.
+        feature_count (int): Features in the group.
+        max_features (int): Threshold for chunking.
+        output_dir (Path): Destination folder.
+        force_chunks (bool): Use the chunked layout even for small groups.
+
+    Returns:
+        list[Path]: [{stem}.geojson], or {stem}_chunked.geojson/{stem}_NNN.geojson parts.
+    """
+    if feature_count <= max_features and not force_chunks:
+        return [output_dir / f"{stem}.geojson"]
+    chunked_folder = output_dir / f"{stem}{CHUNKED_SUFFIX}"
+    parts = max(1, -(-feature_count // max_features))
+    return [chunked_folder / f"{stem}_{number:03d}.geojson" for number in range(1, parts + 1)]
+
+
+def get_cache_dir() -> Path:
+    """
+    Return the data-cache directory for reusable build caches
+    (e.g. simplified geometries). Cleanup keeps it unless asked otherwise.
+
+    Returns:
+        Path: data-cache directory.
+    """
+    return get_repo_root() / "data-cache"
+
 
 def get_data_in_dir() -> Path:
     """
@@ -54,6 +124,29 @@ def get_data_out_dir() -> Path:
     return get_repo_root() / "data-out"
 
 
+def get_geometry_pool_dir() -> Path:
+    """
+    Return the shared geometry pool referenced by pooled features.
+
+    Returns:
+        Path: data-out/geometry-pool directory.
+    """
+    return get_data_out_dir() / GEOMETRY_POOL_DIR_NAME
+
+
+def get_layer_bundle_dir(layer_output_dir: str) -> Path:
+    """
+    Return the folder for a specific layer's GeoJSONSeq bundles.
+
+    Args:
+        layer_output_dir (str): The layer's subdirectory under data-out/.
+
+    Returns:
+        Path: data-out/bundles/{layer_output_dir}.
+    """
+    return get_data_out_dir() / BUNDLES_DIR_NAME / layer_output_dir
+
+
 def get_layer_in_dir(layer_output_dir: str) -> Path:
     """
     Return the input folder for a specific layer's shapefiles.
@@ -82,6 +175,19 @@ def get_layer_in_geojson_dir(layer_output_dir: str) -> Path:
     return get_data_in_geojson_dir() / layer_output_dir
 
 
+def get_layer_mercator_dir(layer_output_dir: str) -> Path:
+    """
+    Return the EPSG:3857 variant folder for a specific layer.
+
+    Args:
+        layer_output_dir (str): The layer's subdirectory under data-out/.
+
+    Returns:
+        Path: data-out-3857/{layer_output_dir}.
+    """
+    return get_mercator_out_dir() / layer_output_dir
+
+
 def get_layer_out_dir(layer_output_dir: str) -> Path:
     """
     Return the output folder for a specific layer's final chunked GeoJSONs.
@@ -95,11 +201,22 @@ def get_layer_out_dir(layer_output_dir: str) -> Path:
     return get_data_out_dir() / layer_output_dir
 
 
+def get_mercator_out_dir() -> Path:
+    """
+    Return the data-out-3857 directory for the pre-projected Web Mercator variant.
+
+    Returns:
+        Path: data-out-3857 directory.
+    """
+    return get_repo_root() / MERCATOR_DIR_NAME
+
+
 def get_repo_root() -> Path:
     """
     Return the root directory of the civic-data-boundaries-us-forests repository.
 
-    This function first checks whether the file path is running from
+    If the CIVIC_USA_REPO_ROOT environment variable is set, that folder is used.
+    Otherwise this function checks whether the file path is running from
     a cloned source repo (using __file__ as a reference), and if that
     does not locate the repo, searches upward from the current working
     directory until it finds a folder containing a data-config directory.
@@ -110,6 +227,10 @@ def get_repo_root() -> Path:
     Raises:
         RuntimeError: If the repo root cannot be found.
     """
+    override = os.environ.get(REPO_ROOT_ENV_VAR)
+    if override:
+        return Path(override).resolve()
+
     # Check if we’re running from source
     source_root = Path(__file__).resolve().parents[3]
     if (source_root / "data-config").exists():
@@ -122,3 +243,14 @@ def get_repo_root() -> Path:
             return parent
 
     raise RuntimeError(f"Could not locate repository root from working dir: {Path.cwd()}")
+
+
+def get_reports_dir() -> Path:
+    """
+    Return the data-reports directory for machine-readable run reports
+    (profile traces, benchmark results, validation reports).
+
+    Returns:
+        Path: data-reports directory.
+    """
+    return get_repo_root() / "data-reports"
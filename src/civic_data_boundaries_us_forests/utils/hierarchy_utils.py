@@ -0,0 +1,286 @@
+"""
+civic_data_boundaries_us_forests.utils.hierarchy_utils
+
+Containment hierarchy between layers (e.g. ranger districts → national forests).
+
+- Every layer with a ``parent_layer`` is joined to its parent once, with
+  a geopandas sjoin (STRtree-backed) on "intersects".
+- Candidate pairs are scored by area overlap computed in an equal-area
+  CRS (EPSG:6933): the share of the child inside the parent and the
+  share of the parent covered by the child. Pairs below ``min_overlap``
+  of the child (shared borders, simplification slivers) are dropped.
+- The result is written to data-out/hierarchy.json as compact
+  [child id, parent id, child share, parent share] rows per link.
+- Hierarchy loads that file and answers lookups in both directions.
+
+Each configured link costs one join, so adding layers adds work linearly.
+
+MIT License — maintained by Civic Interconnect
+"""
+
+import json
+from collections import defaultdict
+from pathlib import Path
+
+import geopandas as gpd
+import pandas as pd
+import shapely
+from civic_lib_core import log_utils
+
+from civic_data_boundaries_us_forests.utils.bundle_utils import BUNDLE_SUFFIX, NATIONWIDE_BUNDLE
+from civic_data_boundaries_us_forests.utils.config_utils import LayerConfig, layer_for_path
+from civic_data_boundaries_us_forests.utils.geometry_pool import read_geojson
+from civic_data_boundaries_us_forests.utils.get_paths import (
+    BUNDLES_DIR_NAME,
+    get_data_out_dir,
+    get_repo_root,
+)
+from civic_data_boundaries_us_forests.utils.output_store import get_output_store
+from civic_data_boundaries_us_forests.utils.profile_utils import profile_stage
+
+__all__ = [
+    "DEFAULT_MIN_OVERLAP",
+    "EQUAL_AREA_CRS",
+    "HIERARCHY_FILE",
+    "Hierarchy",
+    "compute_link",
+    "read_layer_outputs",
+    "write_hierarchy",
+]
+
+logger = log_utils.logger
+
+HIERARCHY_FILE = "hierarchy.json"
+EQUAL_AREA_CRS = "EPSG:6933"
+DEFAULT_MIN_OVERLAP = 0.01
+
+_PRECISION = 4
+
+
+def compute_link(
+    children: gpd.GeoDataFrame,
+    parents: gpd.GeoDataFrame,
+    child_id: str,
+    parent_id: str,
+    min_overlap: float = DEFAULT_MIN_OVERLAP,
+) -> list[list]:
+    """
+    Return containment rows between two layers.
+
+    Args:
+        children (gpd.GeoDataFrame): Child features (e.g. districts).
+        parents (gpd.GeoDataFrame): Parent features (e.g. forests).
+        child_id (str): Child id column.
+        parent_id (str): Parent id column.
+        min_overlap (float): Smallest share of a child's area inside a parent to keep.
+
+    Returns:
+        list[list]: [child id, parent id, child share, parent share] rows,
+            sorted by child id then descending child share.
+    """
+    children = children[[child_id, "geometry"]].to_crs(EQUAL_AREA_CRS)
+    parents = parents[[parent_id, "geometry"]].to_crs(EQUAL_AREA_CRS)
+    children = children.rename(columns={child_id: "_child"})
+    parents = parents.rename(columns={parent_id: "_parent"})
+
+    with profile_stage("hierarchy") as rec:
+        pairs = gpd.sjoin(children, parents, how="inner", predicate="intersects")
+        child_geoms = children.geometry.values[children.index.get_indexer(pairs.index)]
+        parent_geoms = parents.geometry.values[parents.index.get_indexer(pairs["index_right"])]
+
+        overlap = shapely.area(shapely.intersection(child_geoms, parent_geoms))
+        child_area = shapely.area(child_geoms)
+        parent_area = shapely.area(parent_geoms)
+        frame = pd.DataFrame({
+            "child": pairs["_child"].astype(str).to_numpy(),
+            "parent": pairs["_parent"].astype(str).to_numpy(),
+            "child_share": overlap / child_area.clip(min=1e-12),
+            "parent_share": overlap / parent_area.clip(min=1e-12),
+        })
+        frame = frame[frame["child_share"] >= min_overlap]
+        frame = frame.sort_values(["child", "child_share"], ascending=[True, False])
+        rec.features += len(children)
+
+    return [
+        [
+            row.child,
+            row.parent,
+            round(row.child_share, _PRECISION),
+            round(row.parent_share, _PRECISION),
+        ]
+        for row in frame.itertuples(index=False)
+    ]
+
+
+def read_layer_outputs(
+    layer: LayerConfig,
+    index: list[dict],
+    layers: list[LayerConfig],
+) -> gpd.GeoDataFrame | None:
+    """
+    Read all of a layer's features from data-out/.
+
+    Uses the layer's nationwide bundle when it is indexed (one file),
+    otherwise every GeoJSON file the layer owns.
+
+    Args:
+        layer (LayerConfig): Layer to read.
+        index (list[dict]): Entries of the index being built.
+        layers (list[LayerConfig]): All configured layers (to attribute files).
+
+    Returns:
+        gpd.GeoDataFrame | None: The layer's features, or None if it has none.
+    """
+    repo_root = get_repo_root()
+    paths = {entry["path"] for entry in index}
+    bundle = f"data-out/{BUNDLES_DIR_NAME}/{layer.published_dir}/{NATIONWIDE_BUNDLE}{BUNDLE_SUFFIX}"
+    if bundle in paths:
+        files = [repo_root / bundle]
+    else:
+        files = [
+            repo_root / entry["path"]
+            for entry in index
+            if entry.get("format") == "geojson"
+            and entry["path"].startswith("data-out/")
+            and _owner(entry["path"], layers) == layer.name
+        ]
+    if not files:
+        return None
+
+    columns = [layer.id_field] if layer.id_field else None
+    with profile_stage("read") as rec:
+        frames = [read_geojson(f, columns=columns) for f in files]
+        gdf = gpd.GeoDataFrame(pd.concat(frames, ignore_index=True), crs=frames[0].crs)
+        rec.features += len(gdf)
+    return gdf
+
+
+def write_hierarchy(
+    index: list[dict],
+    layers: list[LayerConfig],
+    out_dir: Path | None = None,
+    min_overlap: float = DEFAULT_MIN_OVERLAP,
+) -> Path | None:
+    """
+    Compute every configured parent/child link and write hierarchy.json.
+
+    Args:
+        index (list[dict]): Entries of the index being built.
+        layers (list[LayerConfig]): All configured layers.
+        out_dir (Path, optional): Output folder (default: data-out/).
+        min_overlap (float): Smallest share of a child's area inside a parent to keep.
+
+    Returns:
+        Path | None: The hierarchy file, or None if no layer has a parent_layer.
+    """
+    by_name = {layer.name: layer for layer in layers}
+    cache: dict[str, gpd.GeoDataFrame | None] = {}
+
+    def features(layer: LayerConfig) -> gpd.GeoDataFrame | None:
+        if layer.name not in cache:
+            cache[layer.name] = read_layer_outputs(layer, index, layers)
+        return cache[layer.name]
+
+    links = []
+    for child in layers:
+        if not child.parent_layer:
+            continue
+        parent = by_name.get(child.parent_layer)
+        if parent is None or not (child.id_field and parent.id_field):
+            logger.warning(
+                f"Skipping hierarchy for {child.name}: parent layer "
+                f"'{child.parent_layer}' missing or without id_field"
+            )
+            continue
+
+        children_gdf, parents_gdf = features(child), features(parent)
+        if children_gdf is None or parents_gdf is None:
+            logger.warning(f"Skipping hierarchy for {child.name}: no outputs indexed")
+            continue
+
+        rows = compute_link(children_gdf, parents_gdf, child.id_field, parent.id_field, min_overlap)
+        links.append({
+            "child_layer": child.name,
+            "parent_layer": parent.name,
+            "child_id_field": child.id_field,
+            "parent_id_field": parent.id_field,
+            "rows": rows,
+        })
+        logger.info(f"Hierarchy {child.name} → {parent.name}: {len(rows)} link(s)")
+
+    if not links:
+        return None
+
+    document = {
+        "area_crs": EQUAL_AREA_CRS,
+        "min_overlap": min_overlap,
+        "columns": ["child_id", "parent_id", "child_share", "parent_share"],
+        "links": links,
+    }
+    path = (out_dir or get_data_out_dir()) / HIERARCHY_FILE
+    data = json.dumps(document, separators=(",", ":")).encode("utf-8")
+    get_output_store().write_bytes(path, data)
+    logger.info(f"{HIERARCHY_FILE} written to {path}")
+    return path
+
+
+class Hierarchy:
+    """
+    Bidirectional parent/child lookups over hierarchy.json.
+
+    Example:
+        h = Hierarchy.load()
+        h.children("0102")        # district ids in forest 0102
+        h.parent("01020101")      # forest with the largest share of the district
+    """
+
+    def __init__(self, document: dict) -> None:
+        self._children: dict[str, list[tuple[str, float]]] = defaultdict(list)
+        self._parents: dict[str, list[tuple[str, float]]] = defaultdict(list)
+
+        for link in document.get("links", []):
+            for child_id, parent_id, child_share, parent_share in link["rows"]:
+                self._parents[child_id].append((parent_id, child_share))
+                self._children[parent_id].append((child_id, parent_share))
+
+        for entries in (*self._children.values(), *self._parents.values()):
+            entries.sort(key=lambda item: (-item[1], item[0]))
+
+    @classmethod
+    def load(cls, path: Path | None = None) -> "Hierarchy":
+        """
+        Load hierarchy.json (default: data-out/hierarchy.json).
+        """
+        path = path or get_data_out_dir() / HIERARCHY_FILE
+        with path.open(encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def children(self, parent_id: str) -> list[str]:
+        """
+        Return ids of the children that overlap a parent, largest share first.
+        """
+        return [child_id for child_id, _ in self._children.get(str(parent_id), [])]
+
+    def parents(self, child_id: str) -> list[str]:
+        """
+        Return ids of every parent a child overlaps, largest share first.
+        """
+        return [parent_id for parent_id, _ in self._parents.get(str(child_id), [])]
+
+    def parent(self, child_id: str) -> str | None:
+        """
+        Return the parent holding the largest share of a child, if any.
+        """
+        parents = self.parents(child_id)
+        return parents[0] if parents else None
+
+    def share(self, child_id: str, parent_id: str) -> float:
+        """
+        Return the share of a child's area inside a parent (0.0 if unrelated).
+        """
+        return dict(self._parents.get(str(child_id), [])).get(str(parent_id), 0.0)
+
+
+def _owner(path: str, layers: list[LayerConfig]) -> str | None:
+    layer = layer_for_path(path.removeprefix("data-out/"), layers)
+    return layer.name if layer else None
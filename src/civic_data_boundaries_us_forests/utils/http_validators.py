@@ -0,0 +1,110 @@
+"""
+civic_data_boundaries_us_forests.utils.http_validators
+
+HTTP cache validators kept next to downloaded source archives.
+
+- After a download, the response's ETag and Last-Modified are saved to
+  <archive>.http.json (only when the server sent at least one).
+- The next fetch sends them back as If-None-Match / If-Modified-Since;
+  a 304 Not Modified means the local archive is current and nothing is
+  downloaded.
+- The sidecar's mtime records when the archive was last confirmed
+  current, which cleanup uses as its least-recently-used order.
+
+MIT License — maintained by Civic Interconnect
+"""
+
+import json
+from collections.abc import Mapping
+from datetime import UTC, datetime
+from pathlib import Path
+
+from civic_lib_core import log_utils
+
+__all__ = [
+    "VALIDATORS_SUFFIX",
+    "conditional_headers",
+    "read_validators",
+    "touch_validators",
+    "validators_path",
+    "write_validators",
+]
+
+logger = log_utils.logger
+
+VALIDATORS_SUFFIX = ".http.json"
+
+
+def conditional_headers(validators: Mapping | None) -> dict[str, str]:
+    """
+    Return If-None-Match / If-Modified-Since headers for saved validators.
+    """
+    if not validators:
+        return {}
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+def read_validators(archive: Path) -> dict | None:
+    """
+    Return the saved validators of an archive, or None if there are none.
+    """
+    path = validators_path(archive)
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable {path.name}: {e}")
+        return None
+
+
+def touch_validators(archive: Path) -> None:
+    """
+    Mark an archive as just confirmed current (e.g. after a 304).
+    """
+    path = validators_path(archive)
+    if path.exists():
+        path.touch()
+
+
+def validators_path(archive: Path) -> Path:
+    """
+    Return the sidecar path, e.g. S_USA.RangerDistrict.zip.http.json.
+    """
+    return archive.with_name(archive.name + VALIDATORS_SUFFIX)
+
+
+def write_validators(archive: Path, url: str, headers: Mapping[str, str]) -> Path | None:
+    """
+    Save a response's ETag and Last-Modified next to the downloaded archive.
+
+    Args:
+        archive (Path): The downloaded file.
+        url (str): URL it was downloaded from.
+        headers (Mapping[str, str]): Response headers (case-insensitive mapping).
+
+    Returns:
+        Path | None: The sidecar, or None if the response had no validators
+            (an existing sidecar is removed so it cannot go stale).
+    """
+    path = validators_path(archive)
+    etag = headers.get("ETag")
+    last_modified = headers.get("Last-Modified")
+    if not (etag or last_modified):
+        path.unlink(missing_ok=True)
+        return None
+
+    validators = {
+        "url": url,
+        "etag": etag,
+        "last_modified": last_modified,
+        "size": archive.stat().st_size,
+        "fetched_at": datetime.now(UTC).isoformat(timespec="seconds"),
+    }
+    path.write_text(json.dumps(validators, indent=2), encoding="utf-8")
+    return path
@@ -0,0 +1,165 @@
+"""
+civic_data_boundaries_us_forests.utils.label_utils
+
+Lightweight label-point layers for map labeling.
+
+- One point per feature at its pole of inaccessibility (center of the
+  maximum inscribed circle), computed with vectorized shapely ufuncs;
+  point_on_surface is the fallback for geometries without a circle.
+- Each point carries the label attributes (FORESTNAME, DISTRICTNA,
+  REGION, GIS_ACRES, plus the layer's id_field when present), the
+  feature's bbox, and the data-out/ path of the file holding it.
+- One compact GeoJSON per layer in data-out/labels/{layer.name}.geojson,
+  written through the output store.
+
+A national-zoom map can draw every label from one small request.
+
+MIT License — maintained by Civic Interconnect
+"""
+
+import json
+from pathlib import Path
+
+import geopandas as gpd
+import numpy as np
+import shapely
+from civic_lib_core import log_utils
+
+from civic_data_boundaries_us_forests.utils.config_utils import LayerConfig
+from civic_data_boundaries_us_forests.utils.get_paths import (
+    chunk_output_paths,
+    get_data_out_dir,
+)
+from civic_data_boundaries_us_forests.utils.output_store import get_output_store
+from civic_data_boundaries_us_forests.utils.profile_utils import profile_stage
+
+__all__ = [
+    "LABELS_DIR_NAME",
+    "LABEL_ATTRIBUTES",
+    "LabelCollector",
+    "label_points",
+]
+
+logger = log_utils.logger
+
+LABEL_ATTRIBUTES = ("FORESTNAME", "DISTRICTNA", "REGION", "GIS_ACRES")
+LABELS_DIR_NAME = "labels"
+
+# Decimal places kept for label coordinates and bboxes (about 1 m).
+_PRECISION = 5
+
+
+def label_points(geoms: np.ndarray) -> np.ndarray:
+    """
+    Return one label point per geometry (pole of inaccessibility).
+
+    Args:
+        geoms (np.ndarray): Shapely geometries.
+
+    Returns:
+        np.ndarray: Shapely Points (None for missing or empty geometries).
+    """
+    points = shapely.point_on_surface(geoms)
+    polygonal = shapely.get_type_id(geoms) >= 3
+    polygonal &= ~shapely.is_empty(geoms) & shapely.is_valid(geoms)
+    if hasattr(shapely, "maximum_inscribed_circle") and polygonal.any():
+        circles = shapely.maximum_inscribed_circle(geoms[polygonal])
+        points[polygonal] = shapely.get_point(circles, 0)
+    return points
+
+
+class LabelCollector:
+    """
+    Accumulates label rows for one layer while its groups are exported.
+
+    Groups may arrive in several pieces (batched export); positions are
+    kept per group so each row links to the right chunk file once the
+    group's final size is known.
+    """
+
+    def __init__(self, layer: LayerConfig) -> None:
+        self.layer = layer
+        self._features: list[tuple[str, int, dict]] = []
+        self._group_sizes: dict[str, int] = {}
+
+    def add(self, gdf: gpd.GeoDataFrame, stem: str) -> None:
+        """
+        Add label rows for features of one output group.
+
+        Args:
+            gdf (gpd.GeoDataFrame): Features in EPSG:4326, in output order.
+            stem (str): Output group file stem.
+        """
+        if gdf.empty:
+            return
+
+        with profile_stage("label") as rec:
+            geoms = np.asarray(gdf.geometry.values)
+            points = label_points(geoms)
+            xs = np.round(shapely.get_x(points), _PRECISION).tolist()
+            ys = np.round(shapely.get_y(points), _PRECISION).tolist()
+            bounds = np.round(shapely.bounds(geoms), _PRECISION).tolist()
+            columns = dict.fromkeys(c for c in (*LABEL_ATTRIBUTES, self.layer.id_field) if c)
+            values = {c: gdf[c].tolist() for c in columns if c in gdf.columns}
+
+            start = self._group_sizes.get(stem, 0)
+            for i, (x, y) in enumerate(zip(xs, ys, strict=True)):
+                if np.isnan(x):
+                    continue
+                properties = {c: _plain(v[i]) for c, v in values.items()}
+                properties["bbox"] = bounds[i]
+                feature = {
+                    "type": "Feature",
+                    "properties": properties,
+                    "geometry": {"type": "Point", "coordinates": [x, y]},
+                }
+                self._features.append((stem, start + i, feature))
+            self._group_sizes[stem] = start + len(gdf)
+            rec.features += len(gdf)
+
+    def write(self, out_dir: Path | None = None) -> Path | None:
+        """
+        Write the layer's label GeoJSON.
+
+        Args:
+            out_dir (Path, optional): Labels folder (default: data-out/labels/).
+
+        Returns:
+            Path | None: The labels file, or None if no features were added.
+        """
+        if not self._features:
+            return None
+
+        features = []
+        for stem, position, feature in self._features:
+            feature["properties"]["source"] = self._source(stem, position)
+            features.append(feature)
+
+        path = (out_dir or get_data_out_dir() / LABELS_DIR_NAME) / f"{self.layer.name}.geojson"
+        document = {"type": "FeatureCollection", "name": self.layer.name, "features": features}
+        data = json.dumps(document, separators=(",", ":")).encode("utf-8")
+        get_output_store().write_bytes(path, data)
+        logger.info(f"Wrote {len(features)} label point(s) for {self.layer.name} to {path}")
+        return path
+
+    def _source(self, stem: str, position: int) -> str:
+        """
+        Return the data-out/ path of the file that holds a feature.
+
+        Follows chunk_output_paths(): {stem}.geojson, or
+        {stem}_chunked.geojson/{stem}_NNN.geojson for large groups.
+        """
+        layer = self.layer
+        group_dir = Path("data-out") / layer.published_dir
+        if layer.split_by:
+            group_dir /= stem
+        size, limit = self._group_sizes[stem], layer.chunk_max_features
+        paths = chunk_output_paths(stem, size, limit, group_dir)
+        return paths[position // limit if len(paths) > 1 else 0].as_posix()
+
+
+def _plain(value):
+    """
+    Convert NaN (missing attribute) to None for JSON.
+    """
+    return None if isinstance(value, float) and np.isnan(value) else value
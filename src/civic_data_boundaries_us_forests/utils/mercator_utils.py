@@ -0,0 +1,140 @@
+"""
+civic_data_boundaries_us_forests.utils.mercator_utils
+
+Optional pre-projected Web Mercator (EPSG:3857) output variant.
+
+- Every coordinate of a frame goes through one vectorized
+  pyproj.Transformer call (via shapely.transform), not one call per
+  geometry or per vertex.
+- Latitudes are clamped to the Web Mercator limit (±85.0511°) first.
+- Geometries are then simplified in meters and snapped to a metric grid
+  (shapely.set_precision), so coordinates carry only screen-relevant
+  precision.
+- Files mirror data-out/ under data-out-3857/, with the same split and
+  chunk layout. They keep the GeoJSON "crs" member (RFC 7946 output
+  drops it) and are listed in the index shards with "crs": "EPSG:3857".
+
+Enabled with ``web_mercator.enabled`` in config.yaml.
+
+MIT License — maintained by Civic Interconnect
+"""
+
+from dataclasses import dataclass
+
+import geopandas as gpd
+import numpy as np
+import shapely
+from civic_lib_core import log_utils
+from pyproj import Transformer
+
+from civic_data_boundaries_us_forests.utils.chunk_utils import chunk_or_write_gdf
+from civic_data_boundaries_us_forests.utils.config_utils import (
+    LayerConfig,
+    load_pipeline_config,
+)
+from civic_data_boundaries_us_forests.utils.get_paths import get_layer_mercator_dir
+from civic_data_boundaries_us_forests.utils.profile_utils import profile_stage
+from civic_data_boundaries_us_forests.utils.write_pipeline import WritePipeline
+
+__all__ = [
+    "WEB_MERCATOR",
+    "MercatorSettings",
+    "load_mercator_settings",
+    "to_web_mercator",
+    "write_mercator_group",
+]
+
+logger = log_utils.logger
+
+WEB_MERCATOR = "EPSG:3857"
+
+# Web Mercator is undefined at the poles; tiles stop at this latitude.
+_MAX_LATITUDE = 85.05112878
+
+_TRANSFORMER = Transformer.from_crs("EPSG:4326", WEB_MERCATOR, always_xy=True)
+
+
+@dataclass(frozen=True)
+class MercatorSettings:
+    """
+    Effective settings for the EPSG:3857 variant.
+    """
+
+    simplify_tolerance_m: float = 100.0
+    precision_m: float = 1.0
+
+
+def load_mercator_settings() -> MercatorSettings | None:
+    """
+    Return the EPSG:3857 variant settings from config.yaml, or None if disabled.
+    """
+    settings = load_pipeline_config().get("web_mercator") or {}
+    if not settings.get("enabled", False):
+        return None
+
+    defaults = MercatorSettings()
+    tolerance = float(settings.get("simplify_tolerance_m", defaults.simplify_tolerance_m))
+    precision = float(settings.get("precision_m", defaults.precision_m))
+    if tolerance < 0 or precision < 0:
+        raise ValueError("web_mercator: simplify_tolerance_m and precision_m must not be negative")
+    return MercatorSettings(simplify_tolerance_m=tolerance, precision_m=precision)
+
+
+def to_web_mercator(gdf: gpd.GeoDataFrame, settings: MercatorSettings) -> gpd.GeoDataFrame:
+    """
+    Project a frame to EPSG:3857, simplify in meters, and quantize coordinates.
+
+    Args:
+        gdf (gpd.GeoDataFrame): Features in EPSG:4326 (or any geographic CRS).
+        settings (MercatorSettings): Simplification and precision in meters.
+
+    Returns:
+        gpd.GeoDataFrame: A copy with projected geometries.
+    """
+    if gdf.crs is not None and gdf.crs.to_epsg() not in (None, 4326):
+        gdf = gdf.to_crs("EPSG:4326")
+
+    with profile_stage("project") as rec:
+        geoms = shapely.transform(gdf.geometry.values, _project)
+        if settings.simplify_tolerance_m > 0:
+            geoms = shapely.simplify(geoms, settings.simplify_tolerance_m, preserve_topology=True)
+        if settings.precision_m > 0:
+            geoms = shapely.set_precision(geoms, settings.precision_m)
+        rec.features += len(gdf)
+
+    projected = gdf.copy()
+    projected["geometry"] = gpd.GeoSeries(geoms, index=gdf.index, crs=WEB_MERCATOR)
+    return projected.set_crs(WEB_MERCATOR, allow_override=True)
+
+
+def write_mercator_group(
+    gdf: gpd.GeoDataFrame,
+    stem: str,
+    layer: LayerConfig,
+    writer: WritePipeline | None = None,
+) -> None:
+    """
+    Write one already-projected output group under data-out-3857/.
+
+    Uses the same folder and chunk layout as the EPSG:4326 group in data-out/.
+    Files keep the GeoJSON 'crs' member, so readers do not take the meter
+    coordinates for lon/lat.
+
+    Args:
+        gdf (gpd.GeoDataFrame): Projected features of one group.
+        stem (str): File stem for the group.
+        layer (LayerConfig): Layer configuration (split_by, chunk_max_features).
+        writer (WritePipeline, optional): Write through this pipeline.
+    """
+    output_dir = get_layer_mercator_dir(layer.published_dir)
+    group_dir = output_dir / stem if layer.split_by else output_dir
+    chunk_or_write_gdf(gdf, stem, layer.chunk_max_features, group_dir, writer=writer, keep_crs=True)
+
+
+def _project(coords: np.ndarray) -> np.ndarray:
+    """
+    Project an (N, 2) lon/lat array to Web Mercator in one pyproj call.
+    """
+    lat = np.clip(coords[:, 1], -_MAX_LATITUDE, _MAX_LATITUDE)
+    x, y = _TRANSFORMER.transform(coords[:, 0], lat)
+    return np.column_stack((x, y))
@@ -0,0 +1,325 @@
+"""
+civic_data_boundaries_us_forests.utils.output_store
+
+Content-addressed writes for pipeline outputs.
+
+- write_bytes() compares the sha256 of new content with the file already
+  on disk and leaves identical files untouched (same bytes, same mtime),
+  so git, rsync and the CDN mirror see no churn.
+- copy_file() skips identical destinations and otherwise prefers a
+  reflink (copy-on-write clone), then a hardlink, then a plain copy.
+- Every call is tallied (worker processes hand their tallies back
+  through merge()); log_summary() reports how many files were
+  written, skipped, reflinked, hardlinked, or copied.
+
+Changed files are always written to a hidden temporary file next to
+the destination and renamed into place (os.replace), so:
+- a file hardlinked from elsewhere is never modified through its other
+  name (the rename gives dest a new inode), and
+- a run killed mid-write never leaves a truncated output behind, only a
+  stray temporary file that remove_temp_files() sweeps up.
+
+MIT License — maintained by Civic Interconnect
+"""
+
+import contextlib
+import errno
+import hashlib
+import os
+import shutil
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from civic_lib_core import log_utils
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+__all__ = [
+    "OutputStats",
+    "OutputStore",
+    "file_sha256",
+    "get_output_store",
+    "remove_temp_files",
+    "temp_path",
+]
+
+logger = log_utils.logger
+
+# Linux FICLONE ioctl: share extents with the source file (btrfs, XFS, ...).
+_FICLONE = 0x40049409
+
+_TEMP_SUFFIX = ".tmp"
+
+# Error numbers meaning "this filesystem cannot do that", not "something broke".
+_UNSUPPORTED = {
+    errno.EXDEV,
+    errno.EPERM,
+    errno.EOPNOTSUPP,
+    errno.ENOTTY,
+    errno.EINVAL,
+    errno.EMLINK,
+    errno.ENOSYS,
+}
+
+
+@dataclass
+class OutputStats:
+    """
+    Counts of output operations by outcome.
+    """
+
+    written: int = 0
+    skipped: int = 0
+    reflinked: int = 0
+    hardlinked: int = 0
+    copied: int = 0
+    bytes_written: int = 0
+
+    @property
+    def linked(self) -> int:
+        """
+        Files materialized without copying bytes (reflinks plus hardlinks).
+        """
+        return self.reflinked + self.hardlinked
+
+
+class OutputStore:
+    """
+    Writes files only when their content changes and tallies the outcome.
+    """
+
+    def __init__(self) -> None:
+        self.stats = OutputStats()
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        """
+        Clear all counters.
+        """
+        with self._lock:
+            self.stats = OutputStats()
+
+    def write_bytes(self, dest: Path, data: bytes) -> bool:
+        """
+        Write data to dest unless dest already holds exactly these bytes.
+
+        Args:
+            dest (Path): Destination file.
+            data (bytes): Full file content.
+
+        Returns:
+            bool: True if the file was written, False if it was already identical.
+        """
+        if _same_content(dest, len(data), lambda: hashlib.sha256(data).digest()):
+            self._count("skipped")
+            logger.debug(f"Unchanged, not rewritten: {dest}")
+            return False
+
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp = temp_path(dest)
+        try:
+            with tmp.open("wb") as f:
+                f.write(data)
+            os.replace(tmp, dest)
+        except BaseException:
+            _unlink_if_exists(tmp)
+            raise
+        self._count("written", len(data))
+        return True
+
+    def commit_file(self, tmp: Path, dest: Path) -> bool:
+        """
+        Move a fully written temporary file into place unless dest is identical.
+
+        For outputs too large to hold in memory; tmp is always consumed.
+
+        Args:
+            tmp (Path): Finished temporary file (same filesystem as dest).
+            dest (Path): Destination file.
+
+        Returns:
+            bool: True if dest was replaced, False if it was already identical.
+        """
+        size = tmp.stat().st_size
+        if _same_content(dest, size, lambda: file_sha256(tmp)):
+            tmp.unlink()
+            self._count("skipped")
+            logger.debug(f"Unchanged, not rewritten: {dest}")
+            return False
+
+        os.replace(tmp, dest)
+        self._count("written", size)
+        return True
+
+    def copy_file(self, src: Path, dest: Path) -> str:
+        """
+        Make dest a copy of src, as cheaply as the filesystem allows.
+
+        Args:
+            src (Path): Source file.
+            dest (Path): Destination file.
+
+        Returns:
+            str: "skipped", "reflinked", "hardlinked", or "copied".
+        """
+        if _same_content(dest, src.stat().st_size, lambda: file_sha256(src)):
+            self._count("skipped")
+            logger.debug(f"Unchanged, not copied: {dest}")
+            return "skipped"
+
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp = temp_path(dest)
+        try:
+            if _try_reflink(src, tmp):
+                outcome = "reflinked"
+            elif _try_hardlink(src, tmp):
+                outcome = "hardlinked"
+            else:
+                shutil.copy2(src, tmp)
+                outcome = "copied"
+            os.replace(tmp, dest)
+        except BaseException:
+            _unlink_if_exists(tmp)
+            raise
+
+        self._count(outcome, dest.stat().st_size if outcome == "copied" else 0)
+        return outcome
+
+    def log_summary(self, label: str = "Outputs") -> None:
+        """
+        Log the tally of output operations.
+
+        Args:
+            label (str): Prefix for the log line, e.g. the stage name.
+        """
+        s = self.stats
+        logger.info(
+            f"{label}: {s.written} written, {s.skipped} unchanged, "
+            f"{s.linked} linked ({s.reflinked} reflink, {s.hardlinked} hardlink), "
+            f"{s.copied} copied, {s.bytes_written / 1_048_576:.1f} MB written"
+        )
+
+    def merge(self, stats: OutputStats) -> None:
+        """
+        Add counts tallied elsewhere (e.g. by a worker process) to this store.
+
+        Args:
+            stats (OutputStats): Counts to add.
+        """
+        with self._lock:
+            for name, value in asdict(stats).items():
+                setattr(self.stats, name, getattr(self.stats, name) + value)
+
+    def to_dict(self) -> dict:
+        """
+        Return the counters as a plain dict.
+        """
+        return {**asdict(self.stats), "linked": self.stats.linked}
+
+    def _count(self, outcome: str, nbytes: int = 0) -> None:
+        with self._lock:
+            setattr(self.stats, outcome, getattr(self.stats, outcome) + 1)
+            self.stats.bytes_written += nbytes
+
+
+_store = OutputStore()
+
+
+def file_sha256(path: Path) -> bytes:
+    """
+    Return the sha256 digest of a file's content.
+    """
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").digest()
+
+
+def get_output_store() -> OutputStore:
+    """
+    Return the process-wide output store.
+    """
+    return _store
+
+
+def remove_temp_files(folder: Path) -> int:
+    """
+    Delete temporary files left under folder by an interrupted run.
+
+    Covers temp_path() files, hidden ".tmp" staging folders, and the
+    ".part" files of streamed writers.
+
+    Args:
+        folder (Path): Output folder to sweep.
+
+    Returns:
+        int: Number of files and folders deleted.
+    """
+    if not folder.exists():
+        return 0
+    removed = 0
+    for pattern in (f".*{_TEMP_SUFFIX}", "*.part"):
+        for path in sorted(folder.rglob(pattern)):
+            if path.is_dir():
+                shutil.rmtree(path, ignore_errors=True)
+            elif path.exists():
+                _unlink_if_exists(path)
+            else:
+                continue
+            removed += 1
+    if removed:
+        logger.info(f"Removed {removed} partial file(s) from an interrupted run in {folder}")
+    return removed
+
+
+def temp_path(dest: Path) -> Path:
+    """
+    Return a hidden temporary file next to dest, unique per process and thread.
+    """
+    return dest.with_name(f".{dest.name}.{os.getpid()}.{threading.get_ident()}{_TEMP_SUFFIX}")
+
+
+def _same_content(dest: Path, size: int, digest) -> bool:
+    """
+    Return True if dest exists with the given size and sha256 digest.
+
+    The digest is only computed when sizes match.
+    """
+    try:
+        if dest.stat().st_size != size:
+            return False
+    except OSError:
+        return False
+    return file_sha256(dest) == digest()
+
+
+def _try_hardlink(src: Path, dest: Path) -> bool:
+    try:
+        os.link(src, dest)
+        return True
+    except OSError as e:
+        if e.errno in _UNSUPPORTED:
+            return False
+        raise
+
+
+def _try_reflink(src: Path, dest: Path) -> bool:
+    if fcntl is None:
+        return False
+    try:
+        with src.open("rb") as s, dest.open("wb") as d:
+            fcntl.ioctl(d.fileno(), _FICLONE, s.fileno())
+    except OSError as e:
+        _unlink_if_exists(dest)
+        if e.errno in _UNSUPPORTED:
+            return False
+        raise
+    shutil.copystat(src, dest)
+    return True
+
+
+def _unlink_if_exists(path: Path) -> None:
+    with contextlib.suppress(FileNotFoundError):
+        path.unlink()
@@ -0,0 +1,296 @@
+"""
+civic_data_boundaries_us_forests.utils.query_utils
+
+Bounding-box queries across the forest and district layers in data-out/.
+
+- candidate_files() uses the bboxes in the index to skip every file
+  that cannot contain a match, without opening it. With a sharded
+  index (data-out/index/root.json) only the shards whose bbox touches
+  the query are read; otherwise index.json is read whole.
+- query_bbox() reads candidates in windows of features with pyogrio's
+  bbox filter, keeps exact matches with a vectorized shapely.intersects
+  against a prepared query box, optionally clips them to the box, and
+  yields one GeoDataFrame per window. Features that reference the
+  geometry pool (geometry_ref) are resolved first.
+
+Results are produced lazily, so memory is bounded by one window
+(batch_size features, and at most one chunked output file) no matter
+how large the whole dataset is.
+
+Example:
+    for gdf in query_bbox((-112.0, 43.0, -110.0, 45.0), layers=["us-forests"]):
+        print(gdf.attrs["layer"], len(gdf))
+
+MIT License — maintained by Civic Interconnect
+"""
+
+import json
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+import geopandas as gpd
+import shapely
+from civic_lib_core import log_utils
+
+from civic_data_boundaries_us_forests.utils.bundle_utils import output_format
+from civic_data_boundaries_us_forests.utils.config_utils import (
+    LayerConfig,
+    layer_for_path,
+    load_all_layer_configs,
+)
+from civic_data_boundaries_us_forests.utils.geometry_pool import is_pooled, read_geojson
+from civic_data_boundaries_us_forests.utils.get_paths import get_data_out_dir
+from civic_data_boundaries_us_forests.utils.profile_utils import profile_stage
+from civic_data_boundaries_us_forests.utils.shard_utils import ROOT_MANIFEST, SHARDS_DIR_NAME
+
+__all__ = [
+    "DEFAULT_BATCH_SIZE",
+    "ShardedIndex",
+    "bboxes_intersect",
+    "candidate_files",
+    "load_index",
+    "parse_bbox",
+    "query_bbox",
+]
+
+logger = log_utils.logger
+
+DEFAULT_BATCH_SIZE = 5_000
+
+BBox = tuple[float, float, float, float]
+
+
+def bboxes_intersect(a: Iterable[float], b: Iterable[float]) -> bool:
+    """
+    Return True if two [minx, miny, maxx, maxy] boxes overlap or touch.
+    """
+    a_minx, a_miny, a_maxx, a_maxy = a
+    b_minx, b_miny, b_maxx, b_maxy = b
+    return a_minx <= b_maxx and b_minx <= a_maxx and a_miny <= b_maxy and b_miny <= a_maxy
+
+
+def candidate_files(
+    bbox: BBox,
+    index: list[dict] | None = None,
+    layers: Iterable[str] | None = None,
+    all_layers: list[LayerConfig] | None = None,
+    root: Path | None = None,
+) -> list[tuple[Path, str]]:
+    """
+    Return data-out/ GeoJSON files whose index bbox intersects the query.
+
+    Bundles, label points, data-out-chunked/ copies, and other files
+    outside a layer's output_dir are skipped, so each feature is found
+    in exactly one file.
+
+    Args:
+        bbox (BBox): Query box (minx, miny, maxx, maxy) in EPSG:4326.
+        index (list[dict], optional): Index entries (default: the shards of
+            data-out/index/ that touch bbox, or data-out/index.json).
+        layers (Iterable[str], optional): Layer names to include (default: all).
+        all_layers (list[LayerConfig], optional): Configured layers (default: loaded).
+        root (Path, optional): Folder the index describes (default: data-out/).
+
+    Returns:
+        list[tuple[Path, str]]: (file, owning layer name) pairs.
+    """
+    root = root or get_data_out_dir()
+    if index is None:
+        if (root / SHARDS_DIR_NAME / ROOT_MANIFEST).exists():
+            index = ShardedIndex.load(root / SHARDS_DIR_NAME).entries(bbox, layers)
+        else:
+            index = load_index(root / "index.json")
+    wanted = set(layers) if layers is not None else None
+    all_layers = load_all_layer_configs() if all_layers is None else all_layers
+
+    candidates = []
+    for entry in index:
+        path = entry["path"]
+        # index.json entries carry no format; the shards do.
+        file_format = entry.get("format", output_format(path))
+        if file_format != "geojson" or not path.startswith("data-out/"):
+            continue
+        if not entry.get("bbox") or not bboxes_intersect(entry["bbox"], bbox):
+            continue
+        relative_path = path.removeprefix("data-out/")
+        layer = layer_for_path(relative_path, all_layers)
+        if layer is None or (wanted is not None and layer.name not in wanted):
+            continue
+        candidates.append((root / relative_path, layer.name))
+
+    logger.debug(f"{len(candidates)} of {len(index)} indexed files intersect {bbox}")
+    return candidates
+
+
+def load_index(index_path: Path | None = None) -> list[dict]:
+    """
+    Read index.json (default: data-out/index.json).
+
+    Returns:
+        list[dict]: Index entries, or an empty list if there is no index.
+    """
+    index_path = index_path or get_data_out_dir() / "index.json"
+    if not index_path.exists():
+        logger.warning(f"No index found at {index_path}; run `civic-usa index` first.")
+        return []
+    with index_path.open(encoding="utf-8") as f:
+        return json.load(f)
+
+
+def parse_bbox(value: str) -> BBox:
+    """
+    Parse "minx,miny,maxx,maxy" into floats.
+
+    Raises:
+        ValueError: If the value is not four numbers with min <= max.
+    """
+    parts = [float(p) for p in value.split(",")]
+    if len(parts) != 4 or parts[0] > parts[2] or parts[1] > parts[3]:
+        raise ValueError(f"Invalid bbox: {value!r}")
+    return parts[0], parts[1], parts[2], parts[3]
+
+
+def query_bbox(
+    bbox: BBox,
+    layers: Iterable[str] | None = None,
+    clip: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    index: list[dict] | None = None,
+    root: Path | None = None,
+    all_layers: list[LayerConfig] | None = None,
+) -> Iterator[gpd.GeoDataFrame]:
+    """
+    Yield features intersecting a bbox, one window of features at a time.
+
+    Each yielded frame has ``attrs["layer"]`` (layer name) and
+    ``attrs["source"]`` (file it was read from).
+
+    Args:
+        bbox (BBox): Query box (minx, miny, maxx, maxy) in EPSG:4326.
+        layers (Iterable[str], optional): Layer names to include (default: all).
+        clip (bool, optional): Clip geometries to the bbox.
+        batch_size (int, optional): Maximum features read per window.
+        index (list[dict], optional): Parsed index.json (default: read from data-out/).
+        root (Path, optional): Folder the index describes (default: data-out/).
+        all_layers (list[LayerConfig], optional): Configured layers (default: loaded).
+
+    Yields:
+        gpd.GeoDataFrame: Non-empty frames of matching features.
+    """
+    query_box = shapely.box(*bbox)
+    shapely.prepare(query_box)
+
+    candidates = candidate_files(bbox, index=index, layers=layers, all_layers=all_layers, root=root)
+    for path, layer_name in candidates:
+        for window in _read_windows(path, bbox, batch_size):
+            with profile_stage("query") as rec:
+                geoms = window.geometry.values
+                hits = window[shapely.intersects(query_box, geoms)]
+                if clip and not hits.empty:
+                    clipped = shapely.clip_by_rect(hits.geometry.values, *bbox)
+                    hits = hits.set_geometry(gpd.GeoSeries(clipped, index=hits.index, crs=hits.crs))
+                    hits = hits[~hits.geometry.is_empty]
+                rec.features += len(hits)
+            if hits.empty:
+                continue
+            hits.attrs = {"layer": layer_name, "source": str(path)}
+            yield hits
+
+
+class ShardedIndex:
+    """
+    Lazy reader for the sharded index in data-out/index/.
+
+    Only root.json is read up front; each shard is read the first time a
+    lookup needs it and then kept.
+
+    Example:
+        sharded = ShardedIndex.load()
+        entries = sharded.entries((-112.0, 43.0, -110.0, 45.0), layers=["us-forests"])
+    """
+
+    def __init__(self, manifest: dict, shards_dir: Path) -> None:
+        self.manifest = manifest
+        self.shards_dir = shards_dir
+        self._loaded: dict[str, list[dict]] = {}
+
+    @classmethod
+    def load(cls, shards_dir: Path | None = None) -> "ShardedIndex":
+        """
+        Read root.json (default: data-out/index/root.json).
+        """
+        shards_dir = shards_dir or get_data_out_dir() / SHARDS_DIR_NAME
+        with (shards_dir / ROOT_MANIFEST).open(encoding="utf-8") as f:
+            return cls(json.load(f), shards_dir)
+
+    def shards(
+        self,
+        bbox: BBox | None = None,
+        layers: Iterable[str] | None = None,
+        crs: str = "EPSG:4326",
+    ) -> list[dict]:
+        """
+        Return root rows of the shards that may hold matching files.
+
+        Args:
+            bbox (BBox, optional): Query box in the shard CRS (default: everywhere).
+            layers (Iterable[str], optional): Layer names to include (default: all).
+            crs (str): CRS of the files to look up.
+        """
+        wanted = set(layers) if layers is not None else None
+        return [
+            row
+            for row in self.manifest.get("shards", [])
+            if row["crs"] == crs
+            and (wanted is None or row["layer"] in wanted)
+            and (bbox is None or (row.get("bbox") and bboxes_intersect(row["bbox"], bbox)))
+        ]
+
+    def entries(
+        self,
+        bbox: BBox | None = None,
+        layers: Iterable[str] | None = None,
+        crs: str = "EPSG:4326",
+    ) -> list[dict]:
+        """
+        Return index entries from the matching shards whose bbox intersects the query.
+
+        Args:
+            bbox (BBox, optional): Query box in the shard CRS (default: everywhere).
+            layers (Iterable[str], optional): Layer names to include (default: all).
+            crs (str): CRS of the files to look up.
+        """
+        entries = []
+        for row in self.shards(bbox, layers, crs):
+            if row["path"] not in self._loaded:
+                with (self.shards_dir / row["path"]).open(encoding="utf-8") as f:
+                    self._loaded[row["path"]] = json.load(f)
+            entries += [
+                entry
+                for entry in self._loaded[row["path"]]
+                if bbox is None or (entry.get("bbox") and bboxes_intersect(entry["bbox"], bbox))
+            ]
+        return entries
+
+
+def _read_windows(path: Path, bbox: BBox, batch_size: int) -> Iterator[gpd.GeoDataFrame]:
+    """
+    Read the features of one file that pass the bbox filter, batch_size at a time.
+
+    Files that reference the geometry pool have null geometries on disk,
+    so they are read unfiltered and resolved; query_bbox() then applies
+    the exact intersects test.
+    """
+    window_filter = {} if is_pooled(path) else {"bbox": bbox}
+    offset = 0
+    while True:
+        with profile_stage("read") as rec:
+            window = read_geojson(
+                path, skip_features=offset, max_features=batch_size, **window_filter
+            )
+            rec.features += len(window)
+        if not window.empty:
+            yield window
+        if len(window) < batch_size:
+            return
+        offset += batch_size
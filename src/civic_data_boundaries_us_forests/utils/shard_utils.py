@@ -0,0 +1,137 @@
+"""
+civic_data_boundaries_us_forests.utils.shard_utils
+
+Sharded index layout written next to index.json by `civic-usa index`.
+
+- Index entries are grouped into shards by (crs, layer, region); files
+  that hold several regions (nationwide bundles, label points, layers
+  without bundle_by) go to the layer's "all" shard, files outside any
+  layer to the "other" layer.
+- Each shard is one compact JSON list of index entries at
+  data-out/index/<crs>/<layer>/<region>.json.
+- data-out/index/root.json lists every shard with its bbox, file and
+  feature counts, and sha256, so a client reads the small root, picks
+  the shards its viewport touches, and fetches only those.
+
+The root stays small as layers are added: it grows by one row per
+layer and region, not per file. index.json is still written for
+existing clients.
+
+MIT License — maintained by Civic Interconnect
+"""
+
+import hashlib
+import json
+from collections import defaultdict
+from pathlib import Path
+
+from civic_lib_core import log_utils
+
+from civic_data_boundaries_us_forests.utils.export_utils import safe_filename
+from civic_data_boundaries_us_forests.utils.get_paths import get_data_out_dir
+from civic_data_boundaries_us_forests.utils.output_store import get_output_store
+
+__all__ = [
+    "ALL_REGIONS",
+    "OTHER_LAYER",
+    "ROOT_MANIFEST",
+    "SHARDS_DIR_NAME",
+    "shard_key",
+    "shard_path",
+    "write_index_shards",
+]
+
+logger = log_utils.logger
+
+SHARDS_DIR_NAME = "index"
+ROOT_MANIFEST = "root.json"
+ALL_REGIONS = "all"
+OTHER_LAYER = "other"
+
+_MANIFEST_VERSION = 1
+
+
+def shard_key(entry: dict) -> tuple[str, str, str]:
+    """
+    Return the (crs, layer, region) shard an index entry belongs to.
+    """
+    return (
+        entry.get("crs") or "EPSG:4326",
+        entry.get("layer") or OTHER_LAYER,
+        entry.get("region") or ALL_REGIONS,
+    )
+
+
+def shard_path(crs: str, layer: str, region: str) -> str:
+    """
+    Return a shard's path relative to the shards folder.
+
+    Example:
+        shard_path("EPSG:4326", "us-forests", "01") -> "epsg-4326/us-forests/01.json"
+    """
+    return f"{safe_filename(crs.replace(':', '-'))}/{layer}/{safe_filename(region)}.json"
+
+
+def write_index_shards(index: list[dict], out_dir: Path | None = None) -> Path:
+    """
+    Write one compact index per shard and the root manifest.
+
+    Shard files left over from earlier runs (e.g. a removed layer) are deleted.
+
+    Args:
+        index (list[dict]): Entries of the index being built.
+        out_dir (Path, optional): data-out/ folder (default: data-out/).
+
+    Returns:
+        Path: The root manifest (data-out/index/root.json).
+    """
+    shards_dir = (out_dir or get_data_out_dir()) / SHARDS_DIR_NAME
+    store = get_output_store()
+
+    groups: dict[tuple[str, str, str], list[dict]] = defaultdict(list)
+    for entry in index:
+        groups[shard_key(entry)].append(entry)
+
+    rows = []
+    for (crs, layer, region), entries in sorted(groups.items()):
+        entries = sorted(entries, key=lambda e: e["path"])
+        relative = shard_path(crs, layer, region)
+        data = json.dumps(entries, separators=(",", ":")).encode("utf-8")
+        store.write_bytes(shards_dir / relative, data)
+        rows.append({
+            "crs": crs,
+            "layer": layer,
+            "region": region,
+            "path": relative,
+            "bbox": _union_bbox(e.get("bbox") for e in entries),
+            "files": len(entries),
+            "features": sum(e.get("features") or 0 for e in entries),
+            "sha256": hashlib.sha256(data).hexdigest(),
+        })
+
+    written = {shards_dir / row["path"] for row in rows}
+    for stale in shards_dir.rglob("*.json"):
+        if stale.name != ROOT_MANIFEST and stale not in written:
+            stale.unlink()
+            logger.info(f"Removed stale index shard {stale}")
+
+    root = {"version": _MANIFEST_VERSION, "entries": len(index), "shards": rows}
+    path = shards_dir / ROOT_MANIFEST
+    store.write_bytes(path, json.dumps(root, separators=(",", ":")).encode("utf-8"))
+    logger.info(f"Index shards written to {shards_dir} ({len(rows)} shard(s))")
+    return path
+
+
+def _union_bbox(bboxes) -> list[float] | None:
+    """
+    Return the bbox covering every non-empty bbox, or None if there are none.
+    """
+    boxes = [b for b in bboxes if b]
+    if not boxes:
+        return None
+    return [
+        min(b[0] for b in boxes),
+        min(b[1] for b in boxes),
+        max(b[2] for b in boxes),
+        max(b[3] for b in boxes),
+    ]
@@ -0,0 +1,236 @@
+"""
+civic_data_boundaries_us_forests.utils.simplify_cache
+
+On-disk cache of simplified geometries.
+
+- Entries map sha256(source WKB + algorithm + tolerance) to simplified WKB.
+- Stored in a single SQLite file under data-cache/.
+- Size-bounded: least recently used entries are evicted once the
+  cache grows past its byte budget.
+
+Re-running export after a tolerance change or a small upstream update
+only recomputes geometries whose key is not already cached.
+
+MIT License — maintained by Civic Interconnect
+"""
+
+import hashlib
+import sqlite3
+import time
+from pathlib import Path
+
+import numpy as np
+import shapely
+from civic_lib_core import log_utils
+
+from civic_data_boundaries_us_forests.utils.config_utils import load_pipeline_config
+from civic_data_boundaries_us_forests.utils.get_paths import get_cache_dir
+
+__all__ = [
+    "DEFAULT_CACHE_MAX_MB",
+    "SimplifyCache",
+    "cache_keys",
+    "open_simplify_cache",
+]
+
+logger = log_utils.logger
+
+DEFAULT_CACHE_MAX_MB = 512
+
+# SQLite limits the number of bound parameters per statement.
+_BATCH = 500
+
+
+class SimplifyCache:
+    """
+    Size-bounded LRU store of simplified WKB keyed by content hash.
+    """
+
+    def __init__(self, path: Path, max_bytes: int) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key BLOB PRIMARY KEY,"
+            " value BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_lru ON entries (last_used)")
+        self._conn.commit()
+
+    def close(self) -> None:
+        """
+        Evict down to the byte budget and close the database.
+        """
+        self.evict()
+        self._conn.close()
+
+    def get_many(self, keys: list[bytes]) -> dict[bytes, bytes]:
+        """
+        Look up many keys at once and mark hits as recently used.
+
+        Args:
+            keys (list[bytes]): Cache keys.
+
+        Returns:
+            dict[bytes, bytes]: Simplified WKB for every key found.
+        """
+        found: dict[bytes, bytes] = {}
+        unique = list(dict.fromkeys(keys))
+        for start in range(0, len(unique), _BATCH):
+            batch = unique[start : start + _BATCH]
+            placeholders = ",".join("?" * len(batch))
+            rows = self._conn.execute(
+                f"SELECT key, value FROM entries WHERE key IN ({placeholders})", batch
+            ).fetchall()
+            found.update(rows)
+
+        if found:
+            now = time.time()
+            self._conn.executemany(
+                "UPDATE entries SET last_used = ? WHERE key = ?",
+                [(now, key) for key in found],
+            )
+            self._conn.commit()
+
+        self.hits += sum(1 for key in keys if key in found)
+        self.misses += sum(1 for key in keys if key not in found)
+        return found
+
+    def put_many(self, items: list[tuple[bytes, bytes]]) -> None:
+        """
+        Store simplified WKB values.
+
+        Args:
+            items (list[tuple[bytes, bytes]]): (key, simplified WKB) pairs.
+        """
+        if not items:
+            return
+        now = time.time()
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO entries (key, value, size, last_used) VALUES (?, ?, ?, ?)",
+            [(key, value, len(key) + len(value), now) for key, value in items],
+        )
+        self._conn.commit()
+
+    def total_bytes(self) -> int:
+        """
+        Return the payload size currently held in the cache.
+        """
+        (total,) = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return int(total)
+
+    def evict(self) -> int:
+        """
+        Delete least recently used entries until the cache fits its budget.
+
+        Returns:
+            int: Number of entries evicted.
+        """
+        excess = self.total_bytes() - self.max_bytes
+        if excess <= 0:
+            return 0
+
+        victims = []
+        freed = 0
+        for key, size in self._conn.execute("SELECT key, size FROM entries ORDER BY last_used"):
+            victims.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+        self._conn.commit()
+        self._conn.execute("VACUUM")
+        logger.info(f"Simplify cache evicted {len(victims)} entries ({freed / 1_048_576:.1f} MB)")
+        return len(victims)
+
+    def simplify(
+        self,
+        geoms: np.ndarray,
+        tolerances: np.ndarray,
+        algorithm: str,
+    ) -> np.ndarray:
+        """
+        Simplify geometries, reusing cached results where available.
+
+        Args:
+            geoms (np.ndarray): Source geometries.
+            tolerances (np.ndarray): Tolerance per geometry.
+            algorithm (str): Identifier of the simplification routine and its parameters.
+
+        Returns:
+            np.ndarray: Simplified geometries.
+        """
+        geoms = np.asarray(geoms, dtype=object)
+        tolerances = np.broadcast_to(np.asarray(tolerances, dtype="float64"), geoms.shape)
+
+        # Missing geometries (None) pass straight through without caching.
+        result = geoms.copy()
+        present = np.flatnonzero(~shapely.is_missing(geoms))
+        if present.size == 0:
+            return result
+
+        keys = cache_keys(geoms[present], tolerances[present], algorithm)
+        cached = self.get_many(keys)
+
+        hit = np.array([key in cached for key in keys], dtype=bool)
+        if hit.any():
+            result[present[hit]] = shapely.from_wkb([
+                cached[k] for k, h in zip(keys, hit, strict=True) if h
+            ])
+
+        if not hit.all():
+            todo = present[~hit]
+            computed = shapely.simplify(geoms[todo], tolerances[todo], preserve_topology=True)
+            result[todo] = computed
+            missing_keys = [k for k, h in zip(keys, hit, strict=True) if not h]
+            self.put_many(list(zip(missing_keys, shapely.to_wkb(computed), strict=True)))
+
+        return result
+
+
+def cache_keys(geoms: np.ndarray, tolerances: np.ndarray, algorithm: str) -> list[bytes]:
+    """
+    Build one cache key per geometry from its WKB, the algorithm, and its tolerance.
+
+    Args:
+        geoms (np.ndarray): Source geometries.
+        tolerances (np.ndarray): Tolerance per geometry.
+        algorithm (str): Identifier of the simplification routine.
+
+    Returns:
+        list[bytes]: sha256 digests.
+    """
+    prefix = algorithm.encode("utf-8") + b"\0"
+    tolerance_bytes = np.asarray(tolerances, dtype="<f8").tobytes()
+    keys = []
+    for i, wkb in enumerate(shapely.to_wkb(geoms)):
+        digest = hashlib.sha256(prefix)
+        digest.update(tolerance_bytes[i * 8 : i * 8 + 8])
+        digest.update(wkb)
+        keys.append(digest.digest())
+    return keys
+
+
+def open_simplify_cache() -> SimplifyCache | None:
+    """
+    Open the simplify cache configured in config.yaml (``simplify_cache``).
+
+    Returns:
+        SimplifyCache | None: The cache, or None if disabled.
+    """
+    settings = load_pipeline_config().get("simplify_cache") or {}
+    if not settings.get("enabled", True):
+        logger.info("Simplify cache disabled in config.yaml")
+        return None
+
+    max_mb = settings.get("max_mb", DEFAULT_CACHE_MAX_MB)
+    path = get_cache_dir() / "simplify.sqlite"
+    logger.debug(f"Using simplify cache at {path} (max {max_mb} MB)")
+    return SimplifyCache(path, max_bytes=int(max_mb * 1_048_576))
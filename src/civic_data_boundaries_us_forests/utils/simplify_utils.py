@@ -0,0 +1,195 @@
+"""
+civic_data_boundaries_us_forests.utils.simplify_utils
+
+Vectorized geometry simplification for the export stage.
+
+Modes:
+- fixed:    one tolerance for every geometry (previous behavior).
+- area:     tolerance scales with each geometry's linear size,
+            sqrt(area / median area), so small districts keep detail
+            and very large units are simplified harder.
+- vertices: tolerance is chosen per geometry so that its vertex count
+            approaches a target, bounding per-file size.
+
+All work runs on whole arrays with shapely 2 ufuncs
+(get_num_coordinates, area, length, simplify). An optional
+SimplifyCache skips geometries simplified by an earlier run.
+
+MIT License — maintained by Civic Interconnect
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import shapely
+from civic_lib_core import log_utils
+
+from civic_data_boundaries_us_forests.utils.config_utils import SIMPLIFY_MODES
+from civic_data_boundaries_us_forests.utils.simplify_cache import SimplifyCache
+
+__all__ = [
+    "SIMPLIFY_MODES",
+    "SimplifyStats",
+    "adaptive_tolerances",
+    "simplify_geometries",
+]
+
+logger = log_utils.logger
+
+# Tolerance doublings tried per geometry in "vertices" mode.
+_MAX_VERTEX_PASSES = 8
+
+# Cache namespace; results can change between GEOS releases.
+_ALGORITHM = f"simplify-preserve-topology/geos-{shapely.geos_version_string}"
+
+
+@dataclass(frozen=True)
+class SimplifyStats:
+    """
+    Vertex counts before and after simplification.
+    """
+
+    mode: str
+    features: int
+    vertices_before: int
+    vertices_after: int
+
+    @property
+    def ratio(self) -> float:
+        """
+        Fraction of vertices kept (1.0 means nothing was removed).
+        """
+        return self.vertices_after / self.vertices_before if self.vertices_before else 1.0
+
+
+def adaptive_tolerances(
+    geoms: np.ndarray,
+    tolerance: float,
+    mode: str,
+    target_vertices: int,
+    min_tolerance: float,
+    max_tolerance: float,
+) -> np.ndarray:
+    """
+    Compute an initial per-geometry tolerance array.
+
+    Args:
+        geoms (np.ndarray): Array of shapely geometries.
+        tolerance (float): Base tolerance in CRS units.
+        mode (str): One of SIMPLIFY_MODES.
+        target_vertices (int): Vertex budget per geometry ("vertices" mode).
+        min_tolerance (float): Lower bound for adaptive tolerances.
+        max_tolerance (float): Upper bound for adaptive tolerances.
+
+    Returns:
+        np.ndarray: Tolerance per geometry (float64).
+    """
+    if mode == "fixed":
+        return np.full(len(geoms), tolerance, dtype="float64")
+
+    if mode == "area":
+        areas = shapely.area(geoms)
+        positive = areas[areas > 0]
+        reference = float(np.median(positive)) if positive.size else 0.0
+        if reference <= 0:
+            return np.full(len(geoms), tolerance, dtype="float64")
+        scaled = tolerance * np.sqrt(areas / reference)
+        return np.clip(scaled, min_tolerance, max_tolerance)
+
+    if mode == "vertices":
+        counts = shapely.get_num_coordinates(geoms)
+        lengths = shapely.length(geoms)
+        # Start well below the spacing that would hit the target; passes double it.
+        start = lengths / (max(target_vertices, 1) * 4.0)
+        tolerances = np.clip(start, min_tolerance, max_tolerance)
+        return np.where(counts > target_vertices, tolerances, min_tolerance)
+
+    raise ValueError(f"Unknown simplify mode '{mode}'. Expected one of {SIMPLIFY_MODES}")
+
+
+def simplify_geometries(
+    geoms: np.ndarray,
+    tolerance: float,
+    mode: str = "fixed",
+    target_vertices: int = 500,
+    min_tolerance: float = 0.0001,
+    max_tolerance: float = 0.05,
+    cache: SimplifyCache | None = None,
+) -> tuple[np.ndarray, SimplifyStats]:
+    """
+    Simplify an array of geometries with fixed or adaptive tolerances.
+
+    Topology is preserved (no self-intersections are introduced).
+
+    Args:
+        geoms (np.ndarray): Array of shapely geometries.
+        tolerance (float): Base tolerance in CRS units.
+        mode (str): One of SIMPLIFY_MODES.
+        target_vertices (int): Vertex budget per geometry ("vertices" mode).
+        min_tolerance (float): Lower bound for adaptive tolerances.
+        max_tolerance (float): Upper bound for adaptive tolerances.
+        cache (SimplifyCache, optional): Cache of previously simplified geometries.
+
+    Returns:
+        tuple[np.ndarray, SimplifyStats]: Simplified geometries and vertex counts.
+    """
+    geoms = np.asarray(geoms, dtype=object)
+    before = shapely.get_num_coordinates(geoms)
+
+    tolerances = adaptive_tolerances(
+        geoms, tolerance, mode, target_vertices, min_tolerance, max_tolerance
+    )
+    simplified = _simplify(geoms, tolerances, cache)
+
+    if mode == "vertices":
+        simplified = _refine_to_vertex_target(
+            geoms, simplified, tolerances, target_vertices, max_tolerance, cache
+        )
+
+    after = shapely.get_num_coordinates(simplified)
+    stats = SimplifyStats(
+        mode=mode,
+        features=len(geoms),
+        vertices_before=int(before.sum()),
+        vertices_after=int(after.sum()),
+    )
+    logger.info(
+        f"Simplified {stats.features} geometries ({mode}): "
+        f"{stats.vertices_before} → {stats.vertices_after} vertices ({stats.ratio:.1%} kept)"
+    )
+    return simplified, stats
+
+
+def _refine_to_vertex_target(
+    geoms: np.ndarray,
+    simplified: np.ndarray,
+    tolerances: np.ndarray,
+    target_vertices: int,
+    max_tolerance: float,
+    cache: SimplifyCache | None,
+) -> np.ndarray:
+    """
+    Re-simplify only the geometries still over budget, doubling their tolerance each pass.
+    """
+    tolerances = tolerances.copy()
+    for _ in range(_MAX_VERTEX_PASSES):
+        counts = shapely.get_num_coordinates(simplified)
+        over = (counts > target_vertices) & (tolerances < max_tolerance)
+        if not over.any():
+            break
+        tolerances[over] = np.minimum(tolerances[over] * 2.0, max_tolerance)
+        simplified[over] = _simplify(geoms[over], tolerances[over], cache)
+    return simplified
+
+
+def _simplify(
+    geoms: np.ndarray,
+    tolerances: np.ndarray,
+    cache: SimplifyCache | None,
+) -> np.ndarray:
+    """
+    Topology-preserving simplify, through the cache when one is given.
+    """
+    if cache is None:
+        return shapely.simplify(geoms, tolerances, preserve_topology=True)
+    return cache.simplify(geoms, tolerances, algorithm=_ALGORITHM)
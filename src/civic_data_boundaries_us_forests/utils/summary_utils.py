@@ -0,0 +1,318 @@
+"""
+civic_data_boundaries_us_forests.utils.summary_utils
+
+Per-layer summary manifest written by `civic-usa index`.
+
+- Every GeoJSON file a layer owns in data-out/ is summarized once, in a
+  process pool: feature and vertex counts, raw and gzip byte sizes, and
+  geodesic areas on the WGS84 ellipsoid (pyproj.Geod, one call per ring
+  over whole coordinate arrays).
+- Per-layer totals add attribute distributions (numeric ranges, value
+  counts for categorical columns) and the simplification ratio recorded
+  by the last export or build.
+- Simplification stats are recorded per layer while exporting and kept
+  in data-cache/simplify-stats.json until the next index run.
+
+The manifest is written to data-out/summary.json through the output
+store, so an unchanged release leaves it untouched.
+
+MIT License — maintained by Civic Interconnect
+"""
+
+import gzip
+import json
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import shapely
+from civic_lib_core import log_utils
+from pyproj import Geod
+
+from civic_data_boundaries_us_forests.utils.config_utils import LayerConfig, layer_for_path
+from civic_data_boundaries_us_forests.utils.geometry_pool import read_geojson
+from civic_data_boundaries_us_forests.utils.get_paths import (
+    get_cache_dir,
+    get_data_out_dir,
+    get_repo_root,
+)
+from civic_data_boundaries_us_forests.utils.output_store import get_output_store
+from civic_data_boundaries_us_forests.utils.profile_utils import get_current_layer, profile_stage
+from civic_data_boundaries_us_forests.utils.simplify_utils import SimplifyStats
+
+__all__ = [
+    "DEFAULT_TOP_VALUES",
+    "SIMPLIFY_STATS_FILE",
+    "SUMMARY_FILE",
+    "geodesic_areas",
+    "record_simplify_stats",
+    "summarize_file",
+    "write_simplify_stats",
+    "write_summary",
+]
+
+logger = log_utils.logger
+
+SUMMARY_FILE = "summary.json"
+SIMPLIFY_STATS_FILE = "simplify-stats.json"
+DEFAULT_TOP_VALUES = 20
+
+_GEOD = Geod(ellps="WGS84")
+
+# Simplification stats of the current process, by layer name.
+_simplify_stats: dict[str, dict[str, int | str]] = {}
+
+
+def geodesic_areas(geoms: np.ndarray) -> np.ndarray:
+    """
+    Return the geodesic area of each geometry in square kilometers.
+
+    Polygons are oriented first (exterior counter-clockwise), so every
+    part and hole contributes with the right sign regardless of source
+    winding order.
+
+    Args:
+        geoms (np.ndarray): Shapely geometries with lon/lat coordinates.
+
+    Returns:
+        np.ndarray: Areas in km² (0.0 for non-polygonal or missing geometries).
+    """
+    geoms = np.asarray(geoms, dtype=object)
+    areas = np.zeros(len(geoms), dtype="float64")
+    polygonal = np.flatnonzero(np.isin(shapely.get_type_id(geoms), (3, 6)))
+    if not polygonal.size:
+        return areas
+
+    oriented = shapely.orient_polygons(geoms[polygonal], exterior_cw=False)
+    for i, geom in zip(polygonal, oriented, strict=True):
+        area, _ = _GEOD.geometry_area_perimeter(geom)
+        areas[i] = area / 1e6
+    return areas
+
+
+def record_simplify_stats(stats: SimplifyStats, layer: str | None = None) -> None:
+    """
+    Add simplification stats to the running tally of a layer.
+
+    Args:
+        stats (SimplifyStats): Stats returned by simplify_geometries().
+        layer (str, optional): Layer name (default: the current profile layer).
+    """
+    layer = layer or get_current_layer()
+    if layer is None:
+        return
+    tally = _simplify_stats.setdefault(
+        layer, {"mode": stats.mode, "features": 0, "vertices_before": 0, "vertices_after": 0}
+    )
+    tally["features"] += stats.features
+    tally["vertices_before"] += stats.vertices_before
+    tally["vertices_after"] += stats.vertices_after
+
+
+def summarize_file(path: Path) -> tuple[dict, pd.DataFrame]:
+    """
+    Summarize one GeoJSON file.
+
+    Args:
+        path (Path): GeoJSON file in EPSG:4326.
+
+    Returns:
+        tuple[dict, pd.DataFrame]: File counts, sizes, and areas; and the
+            file's attribute table (without geometry).
+    """
+    data = path.read_bytes()
+    gdf = read_geojson(path)
+    geoms = np.asarray(gdf.geometry.values, dtype=object)
+    areas = geodesic_areas(geoms)
+    row = {
+        "features": len(gdf),
+        "vertices": int(shapely.get_num_coordinates(geoms).sum()),
+        "bytes": len(data),
+        "gzip_bytes": len(gzip.compress(data, compresslevel=9, mtime=0)),
+        "area_km2": round(float(areas.sum()), 3),
+    }
+    attributes = pd.DataFrame(gdf.drop(columns=gdf.geometry.name))
+    attributes["_area_km2"] = areas
+    return row, attributes
+
+
+def write_simplify_stats(path: Path | None = None) -> Path | None:
+    """
+    Merge this process's simplification stats into data-cache/simplify-stats.json.
+
+    Layers not simplified in this run keep their earlier entry.
+
+    Args:
+        path (Path, optional): Stats file (default: data-cache/simplify-stats.json).
+
+    Returns:
+        Path | None: The stats file, or None if nothing was recorded.
+    """
+    if not _simplify_stats:
+        return None
+    path = path or get_cache_dir() / SIMPLIFY_STATS_FILE
+    stats = {**_read_json(path), **_simplify_stats}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(stats, indent=2, sort_keys=True), encoding="utf-8")
+    _simplify_stats.clear()
+    return path
+
+
+def write_summary(
+    index: list[dict],
+    layers: list[LayerConfig],
+    out_dir: Path | None = None,
+    workers: int = 0,
+    top_values: int = DEFAULT_TOP_VALUES,
+) -> Path | None:
+    """
+    Summarize every layer's files and write summary.json.
+
+    Args:
+        index (list[dict]): Entries of the index being built.
+        layers (list[LayerConfig]): All configured layers (to attribute files).
+        out_dir (Path, optional): Output folder (default: data-out/).
+        workers (int): Worker processes (0 uses every CPU; 1 runs inline).
+        top_values (int): Most frequent values kept per categorical attribute.
+
+    Returns:
+        Path | None: The summary file, or None if no layer owns a file.
+    """
+    repo_root = get_repo_root()
+    files: list[tuple[str, str]] = []
+    for entry in index:
+        if entry.get("format") != "geojson" or not entry["path"].startswith("data-out/"):
+            continue
+        layer = layer_for_path(entry["path"].removeprefix("data-out/"), layers)
+        if layer is not None:
+            files.append((entry["path"], layer.name))
+    if not files:
+        return None
+    files.sort()
+
+    workers = workers or os.cpu_count() or 1
+    paths = [repo_root / path for path, _ in files]
+    with profile_stage("summary") as rec:
+        if workers == 1 or len(paths) == 1:
+            results = [summarize_file(p) for p in paths]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                chunksize = max(1, len(paths) // (workers * 4))
+                results = list(pool.map(summarize_file, paths, chunksize=chunksize))
+        rec.features += sum(row["features"] for row, _ in results)
+        rec.bytes_read += sum(row["bytes"] for row, _ in results)
+
+    simplification = _read_json(get_cache_dir() / SIMPLIFY_STATS_FILE)
+    by_layer: dict[str, list[tuple[str, dict, pd.DataFrame]]] = defaultdict(list)
+    for (path, layer_name), (row, attributes) in zip(files, results, strict=True):
+        by_layer[layer_name].append((path, row, attributes))
+
+    document = {
+        "area_units": "km2",
+        "ellipsoid": "WGS84",
+        "layers": {
+            name: _layer_summary(by_layer[name], simplification.get(name), top_values)
+            for name in sorted(by_layer)
+        },
+    }
+    path = (out_dir or get_data_out_dir()) / SUMMARY_FILE
+    data = json.dumps(document, indent=2).encode("utf-8")
+    get_output_store().write_bytes(path, data)
+    logger.info(
+        f"{SUMMARY_FILE} written to {path} ({len(files)} file(s), {len(by_layer)} layer(s))"
+    )
+    return path
+
+
+def _attribute_summary(values: pd.Series, top_values: int) -> dict:
+    """
+    Describe one attribute column: numeric range or categorical value counts.
+    """
+    present = values.dropna()
+    summary: dict = {"missing": int(len(values) - len(present))}
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        if len(present):
+            summary.update({
+                "type": "numeric",
+                "min": _plain(present.min()),
+                "max": _plain(present.max()),
+                "mean": round(float(present.mean()), 3),
+                "median": round(float(present.median()), 3),
+                "sum": round(float(present.sum()), 3),
+            })
+        else:
+            summary["type"] = "numeric"
+        return summary
+
+    counts = present.astype(str).value_counts()
+    summary.update({
+        "type": "categorical",
+        "distinct": len(counts),
+        "top": {str(k): int(v) for k, v in counts.head(top_values).items()},
+    })
+    return summary
+
+
+def _layer_summary(
+    files: list[tuple[str, dict, pd.DataFrame]],
+    simplification: dict | None,
+    top_values: int,
+) -> dict:
+    """
+    Combine per-file summaries of one layer.
+    """
+    attributes = pd.concat([frame for _, _, frame in files], ignore_index=True)
+    areas = attributes.pop("_area_km2").to_numpy()
+    total_bytes = sum(row["bytes"] for _, row, _ in files)
+    gzip_bytes = sum(row["gzip_bytes"] for _, row, _ in files)
+
+    if simplification:
+        before = simplification["vertices_before"]
+        simplification = {
+            **simplification,
+            "ratio": round(simplification["vertices_after"] / before, 4) if before else 1.0,
+        }
+
+    return {
+        "files": len(files),
+        "features": sum(row["features"] for _, row, _ in files),
+        "vertices": sum(row["vertices"] for _, row, _ in files),
+        "bytes": total_bytes,
+        "gzip_bytes": gzip_bytes,
+        "gzip_ratio": round(gzip_bytes / total_bytes, 4) if total_bytes else None,
+        "area_km2": {
+            "total": round(float(areas.sum()), 3),
+            "min": round(float(areas.min()), 3) if len(areas) else None,
+            "median": round(float(np.median(areas)), 3) if len(areas) else None,
+            "max": round(float(areas.max()), 3) if len(areas) else None,
+        },
+        "simplification": simplification,
+        "attributes": {
+            column: _attribute_summary(attributes[column], top_values)
+            for column in attributes.columns
+        },
+        "file_stats": {path: row for path, row, _ in sorted(files, key=lambda f: f[0])},
+    }
+
+
+def _plain(value):
+    """
+    Convert numpy scalars to plain Python numbers for JSON.
+    """
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _read_json(path: Path) -> dict:
+    """
+    Return parsed JSON from path, or {} if it is missing or unreadable.
+    """
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable {path.name}: {e}")
+        return {}
@@ -0,0 +1,273 @@
+"""
+civic_data_boundaries_us_forests.utils.validate_utils
+
+Vectorized geometry validation and repair.
+
+Checks every feature at once with shapely 2 array functions:
+- empty:           missing or empty geometries (dropped on repair)
+- invalid:         not OGC-valid (self-intersections, bad rings, ...)
+- orientation:     rings not following the RFC 7946 right-hand rule
+                   (exteriors counter-clockwise, holes clockwise)
+- repeated_points: consecutive duplicate vertices within a ring
+
+Polygon parts and rings are flattened into single arrays
+(get_parts / get_rings / get_coordinates with return_index), so the
+checks cost a handful of ufunc calls per file rather than a Python loop
+per feature. Repair touches only flagged features: make_valid for
+invalid ones, remove_repeated_points, then orient_polygons.
+
+MIT License — maintained by Civic Interconnect
+"""
+
+import json
+from collections import Counter
+from pathlib import Path
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import shapely
+from civic_lib_core import log_utils
+
+from civic_data_boundaries_us_forests.utils.config_utils import load_pipeline_config
+from civic_data_boundaries_us_forests.utils.export_utils import write_geojson
+from civic_data_boundaries_us_forests.utils.profile_utils import profile_stage
+
+__all__ = [
+    "ISSUES",
+    "VALIDATE_REPORT",
+    "find_issues",
+    "load_validate_settings",
+    "merge_validate_rows",
+    "repair_geometries",
+    "validate_file",
+    "validate_gdf",
+    "write_validate_report",
+]
+
+logger = log_utils.logger
+
+ISSUES = ("empty", "invalid", "orientation", "repeated_points")
+VALIDATE_REPORT = "validate.json"
+
+# Geometry type ids of Polygon and MultiPolygon.
+_POLYGONAL = (3, 6)
+
+
+def find_issues(geoms: np.ndarray) -> dict[str, np.ndarray]:
+    """
+    Flag geometry problems for every feature.
+
+    Args:
+        geoms (np.ndarray): Shapely geometries.
+
+    Returns:
+        dict[str, np.ndarray]: One boolean mask per name in ISSUES.
+    """
+    geoms = np.asarray(geoms, dtype=object)
+    empty = shapely.is_missing(geoms) | shapely.is_empty(geoms)
+    issues = {
+        "empty": empty,
+        "invalid": ~empty & ~shapely.is_valid(geoms),
+        "orientation": np.zeros(len(geoms), dtype=bool),
+        "repeated_points": np.zeros(len(geoms), dtype=bool),
+    }
+
+    polygonal = np.flatnonzero(~empty & np.isin(shapely.get_type_id(geoms), _POLYGONAL))
+    if not polygonal.size:
+        return issues
+
+    parts, part_owner = shapely.get_parts(geoms[polygonal], return_index=True)
+    rings, ring_part = shapely.get_rings(parts, return_index=True)
+
+    # get_rings lists each polygon's exterior first, then its holes.
+    exterior = np.r_[True, ring_part[1:] != ring_part[:-1]]
+    ccw = shapely.is_ccw(rings)
+    wrong_way = np.where(exterior, ~ccw, ccw)
+
+    coords, coord_ring = shapely.get_coordinates(rings, return_index=True)
+    repeated = np.all(coords[1:] == coords[:-1], axis=1) & (coord_ring[1:] == coord_ring[:-1])
+    repeated_ring = np.zeros(len(rings), dtype=bool)
+    repeated_ring[coord_ring[1:][repeated]] = True
+
+    for name, ring_flags in (("orientation", wrong_way), ("repeated_points", repeated_ring)):
+        part_flags = np.bincount(ring_part, weights=ring_flags, minlength=len(parts)) > 0
+        geom_flags = np.bincount(part_owner, weights=part_flags, minlength=len(polygonal)) > 0
+        issues[name][polygonal] = geom_flags
+
+    return issues
+
+
+def load_validate_settings() -> dict:
+    """
+    Return the ``validate`` section of config.yaml with defaults applied.
+
+    Returns:
+        dict: "enabled" (validate during build), "repair", and "workers".
+    """
+    settings = load_pipeline_config().get("validate") or {}
+    return {
+        "enabled": bool(settings.get("enabled", True)),
+        "repair": bool(settings.get("repair", True)),
+        "workers": int(settings.get("workers", 0)),
+    }
+
+
+def merge_validate_rows(rows: list[dict]) -> dict:
+    """
+    Combine the report rows of several windows of one source into one row.
+
+    Args:
+        rows (list[dict]): Rows from validate_gdf().
+
+    Returns:
+        dict: Summed counts and merged "invalid_reasons".
+    """
+    merged: dict = {}
+    reasons: Counter = Counter()
+    for row in rows:
+        for key, value in row.items():
+            if key == "invalid_reasons":
+                reasons.update(value)
+            else:
+                merged[key] = merged.get(key, 0) + value
+    merged["invalid_reasons"] = dict(sorted(reasons.items()))
+    return merged
+
+
+def repair_geometries(geoms: np.ndarray, issues: dict[str, np.ndarray]) -> np.ndarray:
+    """
+    Repair only the flagged geometries.
+
+    Invalid geometries go through make_valid (keeping polygonal output),
+    repeated vertices are removed, and flagged or repaired polygons are
+    re-oriented to the RFC 7946 right-hand rule. Empty geometries are
+    left as they are.
+
+    Args:
+        geoms (np.ndarray): Shapely geometries.
+        issues (dict[str, np.ndarray]): Masks from find_issues().
+
+    Returns:
+        np.ndarray: A repaired copy of geoms.
+    """
+    repaired = np.array(geoms, dtype=object)
+    keep = ~issues["empty"]
+
+    invalid = issues["invalid"] & keep
+    if invalid.any():
+        repaired[invalid] = shapely.make_valid(
+            repaired[invalid], method="structure", keep_collapsed=False
+        )
+
+    repeated = issues["repeated_points"] & keep
+    if repeated.any():
+        repaired[repeated] = shapely.remove_repeated_points(repaired[repeated])
+
+    orient = (issues["orientation"] | invalid) & keep
+    if orient.any():
+        repaired[orient] = shapely.orient_polygons(repaired[orient], exterior_cw=False)
+
+    return repaired
+
+
+def validate_file(path: Path, repair: bool = True) -> dict:
+    """
+    Validate one GeoJSON file and, if needed, rewrite it repaired.
+
+    Args:
+        path (Path): GeoJSON file.
+        repair (bool): Rewrite the file when any feature needs repair.
+
+    Returns:
+        dict: Report row (see validate_gdf), plus "path" and "rewritten".
+    """
+    gdf = gpd.read_file(path)
+    result, row = validate_gdf(gdf, repair=repair)
+    rewritten = repair and row["repaired"] + row["dropped"] > 0
+    if rewritten:
+        write_geojson(result, path)
+    return {"path": path.as_posix(), **row, "rewritten": rewritten}
+
+
+def validate_gdf(gdf: gpd.GeoDataFrame, repair: bool = True) -> tuple[gpd.GeoDataFrame, dict]:
+    """
+    Validate (and optionally repair) all features of a frame.
+
+    Args:
+        gdf (gpd.GeoDataFrame): Features to check.
+        repair (bool): Repair flagged features and drop empty ones.
+
+    Returns:
+        tuple[gpd.GeoDataFrame, dict]: The (repaired) frame and a report row:
+            feature count, one count per issue, "repaired", "dropped",
+            "still_invalid", and "invalid_reasons" (reason → count).
+    """
+    with profile_stage("validate") as rec:
+        geoms = np.asarray(gdf.geometry.values, dtype=object)
+        issues = find_issues(geoms)
+        reasons = Counter(
+            reason.split("[")[0]
+            for reason in shapely.is_valid_reason(geoms[issues["invalid"]]).tolist()
+        )
+        row = {
+            "features": len(gdf),
+            **{name: int(mask.sum()) for name, mask in issues.items()},
+            "repaired": 0,
+            "dropped": 0,
+            "still_invalid": int(issues["invalid"].sum()),
+            "invalid_reasons": dict(sorted(reasons.items())),
+        }
+        rec.features += len(gdf)
+
+        flagged = np.logical_or.reduce([issues[n] for n in ISSUES if n != "empty"])
+        if not repair or not (flagged.any() or issues["empty"].any()):
+            return gdf, row
+
+    with profile_stage("repair") as rec:
+        repaired = repair_geometries(geoms, issues)
+        drop = issues["empty"] | shapely.is_empty(repaired)
+        result = gdf.copy()
+        result["geometry"] = gpd.GeoSeries(repaired, index=gdf.index, crs=gdf.crs)
+        result = result[~drop]
+        row["repaired"] = int((flagged & ~drop).sum())
+        row["dropped"] = int(drop.sum())
+        row["still_invalid"] = int((~shapely.is_valid(repaired[flagged & ~drop])).sum())
+        rec.features += int(flagged.sum())
+
+    if row["dropped"]:
+        logger.warning(f"Dropped {row['dropped']} empty geometr(ies) during validation")
+    return result, row
+
+
+def write_validate_report(rows: list[dict], path: Path, repair: bool) -> Path:
+    """
+    Write the machine-readable validation report.
+
+    Args:
+        rows (list[dict]): One row per file (or per source, for build),
+            each with a "layer" key.
+        path (Path): Report file (e.g. data-reports/validate.json).
+        repair (bool): Whether repairs were applied.
+
+    Returns:
+        Path: The report file.
+    """
+    counts = ["features", *ISSUES, "repaired", "dropped", "still_invalid"]
+    frame = pd.DataFrame(rows, columns=["layer", *counts]) if rows else None
+
+    def totals(subset: pd.DataFrame | None) -> dict:
+        if subset is None or subset.empty:
+            return dict.fromkeys(counts, 0)
+        return {name: int(subset[name].sum()) for name in counts}
+
+    layers = {}
+    if frame is not None:
+        for name, group in frame.groupby(frame["layer"].fillna("other"), sort=True):
+            layers[str(name)] = totals(group)
+
+    report = {"repair": repair, "totals": totals(frame), "layers": layers, "files": rows}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    logger.info(f"Validation report written to {path}")
+    return path
@@ -0,0 +1,218 @@
+"""
+civic_data_boundaries_us_forests.utils.write_pipeline
+
+Producer/consumer pipeline that overlaps GeoJSON serialization with disk I/O.
+
+- The producer (the export loop) submits each output group and moves on
+  to the next one.
+- Serializer threads encode groups to FeatureCollection bytes.
+- One writer thread flushes finished buffers through the output store,
+  one sequential write per file (identical files are skipped).
+- A semaphore caps groups in flight (submitted but not yet written), so
+  submit() blocks when serializers or the disk fall behind and memory
+  stays bounded.
+
+Throughput (MB/s) and how busy the writer was are logged on close.
+
+Example:
+    with WritePipeline(geojson_bytes) as writer:
+        for stem, group in groups:
+            writer.submit(group, out_dir / f"{stem}.geojson")
+
+MIT License — maintained by Civic Interconnect
+"""
+
+import queue
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Self
+
+import geopandas as gpd
+from civic_lib_core import log_utils
+
+from civic_data_boundaries_us_forests.utils.config_utils import load_pipeline_config
+from civic_data_boundaries_us_forests.utils.output_store import get_output_store
+from civic_data_boundaries_us_forests.utils.profile_utils import get_current_layer, profile_stage
+
+__all__ = [
+    "DEFAULT_MAX_PENDING",
+    "DEFAULT_SERIALIZERS",
+    "WritePipeline",
+    "WriteStats",
+]
+
+logger = log_utils.logger
+
+DEFAULT_SERIALIZERS = 2
+DEFAULT_MAX_PENDING = 8
+
+_DONE = None
+
+
+@dataclass
+class WriteStats:
+    """
+    Totals for one WritePipeline.
+    """
+
+    files: int = 0
+    features: int = 0
+    bytes_serialized: int = 0
+    bytes_written: int = 0
+    write_s: float = 0.0
+    wall_s: float = 0.0
+
+    @property
+    def mb_per_s(self) -> float:
+        """
+        Serialized megabytes delivered per second of wall time.
+        """
+        return self.bytes_serialized / (1024 * 1024) / self.wall_s if self.wall_s else 0.0
+
+
+class WritePipeline:
+    """
+    Serialize output groups on worker threads and write them on a writer thread.
+
+    Args:
+        serialize (Callable): (features, name) -> file bytes, e.g. geojson_bytes.
+        serializers (int, optional): Serializer threads (default: write_pipeline.serializers).
+        max_pending (int, optional): Groups allowed in flight before submit()
+            blocks (default: write_pipeline.max_pending).
+        on_written (Callable, optional): Called by the writer thread with
+            each file once it is safely on disk (e.g. Checkpoint journaling).
+    """
+
+    def __init__(
+        self,
+        serialize: Callable[[gpd.GeoDataFrame, str], bytes],
+        serializers: int | None = None,
+        max_pending: int | None = None,
+        on_written: Callable[[Path], None] | None = None,
+    ) -> None:
+        settings = load_pipeline_config().get("write_pipeline") or {}
+        serializers = serializers or int(settings.get("serializers", DEFAULT_SERIALIZERS))
+        max_pending = max_pending or int(settings.get("max_pending", DEFAULT_MAX_PENDING))
+
+        self.stats = WriteStats()
+        self._serialize = serialize
+        self._on_written = on_written
+        self._slots = threading.BoundedSemaphore(max(max_pending, 1))
+        self._buffers: queue.Queue = queue.Queue(maxsize=max(max_pending, 1))
+        self._errors: list[Exception] = []
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+        self._closed = False
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(serializers, 1), thread_name_prefix="geojson-serialize"
+        )
+        self._writer = threading.Thread(target=self._write_loop, name="geojson-write", daemon=True)
+        self._writer.start()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close(raise_errors=exc_type is None)
+
+    def submit(self, gdf: gpd.GeoDataFrame, filepath: Path, **options) -> None:
+        """
+        Queue one group for serialization and writing.
+
+        Blocks while max_pending groups are already in flight.
+
+        Args:
+            gdf (gpd.GeoDataFrame): Features to write.
+            filepath (Path): Destination .geojson file.
+            **options: Keyword arguments for serialize, e.g. keep_crs=True.
+
+        Raises:
+            Exception: The first serializer or writer error, if one occurred.
+        """
+        self._raise_first_error()
+        self._slots.acquire()
+        layer = get_current_layer()
+        self._pool.submit(self._serialize_one, gdf, filepath, layer, options)
+
+    def close(self, raise_errors: bool = True) -> WriteStats:
+        """
+        Wait for every queued group to be written and stop the threads.
+
+        Args:
+            raise_errors (bool): Re-raise the first worker error.
+
+        Returns:
+            WriteStats: Totals, with MB/s over the pipeline's lifetime.
+        """
+        if not self._closed:
+            self._closed = True
+            self._pool.shutdown(wait=True)
+            self._buffers.put(_DONE)
+            self._writer.join()
+            self.stats.wall_s = time.perf_counter() - self._started
+            self._log_stats()
+        if raise_errors:
+            self._raise_first_error()
+        return self.stats
+
+    def _fail(self, error: Exception) -> None:
+        with self._lock:
+            self._errors.append(error)
+
+    def _log_stats(self) -> None:
+        stats = self.stats
+        if not stats.files:
+            return
+        busy = stats.write_s / stats.wall_s if stats.wall_s else 0.0
+        logger.info(
+            f"Write pipeline: {stats.files} file(s), "
+            f"{stats.bytes_serialized / (1024 * 1024):.1f} MB in {stats.wall_s:.2f}s "
+            f"({stats.mb_per_s:.1f} MB/s, writer busy {busy:.0%}, "
+            f"{stats.bytes_written / (1024 * 1024):.1f} MB changed on disk)"
+        )
+
+    def _raise_first_error(self) -> None:
+        with self._lock:
+            if self._errors:
+                raise self._errors[0]
+
+    def _serialize_one(
+        self, gdf: gpd.GeoDataFrame, filepath: Path, layer: str | None, options: dict
+    ) -> None:
+        try:
+            if self._errors:
+                raise RuntimeError("write pipeline stopped after an earlier error")
+            with profile_stage("serialize", layer=layer) as rec:
+                data = self._serialize(gdf, filepath.stem, **options)
+                rec.features += len(gdf)
+            self._buffers.put((filepath, data, len(gdf), layer))
+        except Exception as e:
+            self._fail(e)
+            self._slots.release()
+
+    def _write_loop(self) -> None:
+        store = get_output_store()
+        while (item := self._buffers.get()) is not _DONE:
+            filepath, data, features, layer = item
+            try:
+                if not self._errors:
+                    start = time.perf_counter()
+                    with profile_stage("write", layer=layer) as rec:
+                        if store.write_bytes(filepath, data):
+                            rec.bytes_written += len(data)
+                            self.stats.bytes_written += len(data)
+                        rec.features += features
+                    self.stats.write_s += time.perf_counter() - start
+                    self.stats.files += 1
+                    self.stats.features += features
+                    self.stats.bytes_serialized += len(data)
+                    if self._on_written is not None:
+                        self._on_written(filepath)
+            except Exception as e:
+                self._fail(e)
+            finally:
+                self._slots.release()
@@ -0,0 +1,351 @@
+"""
+civic_data_boundaries_us_forests.utils.zip_stream
+
+Extract zip members while the archive is still downloading.
+
+- StreamingZipExtractor parses local file headers from a byte stream,
+  inflates stored and deflate members incrementally, and verifies each
+  member's CRC-32 and size as its last byte arrives.
+- Only members with wanted suffixes (by default the shapefile parts
+  .shp/.shx/.dbf/.prj/.cpg) are written; others are skipped in-stream.
+- Each member is written to a .part file and renamed once verified.
+- verify_against_central_directory() cross-checks the results with the
+  archive's central directory once the download is complete.
+
+Anything the streaming parser cannot handle (encryption, unusual
+compression, stored members with trailing data descriptors) raises
+ZipStreamError so the caller can fall back to classic extraction.
+
+MIT License — maintained by Civic Interconnect
+"""
+
+import struct
+import zipfile
+import zlib
+from pathlib import Path, PurePosixPath
+
+from civic_lib_core import log_utils
+
+__all__ = [
+    "SHAPEFILE_SUFFIXES",
+    "StreamingZipExtractor",
+    "ZipStreamError",
+    "is_wanted_member",
+    "verify_against_central_directory",
+]
+
+logger = log_utils.logger
+
+SHAPEFILE_SUFFIXES = (".shp", ".shx", ".dbf", ".prj", ".cpg")
+
+_LOCAL_HEADER_SIG = b"PK\x03\x04"
+_CENTRAL_DIR_SIG = b"PK\x01\x02"
+_END_OF_CENTRAL_DIR_SIG = b"PK\x05\x06"
+_DATA_DESCRIPTOR_SIG = b"PK\x07\x08"
+_LOCAL_HEADER = struct.Struct("<4sHHHHHIIIHH")
+_ZIP64_MARKER = 0xFFFFFFFF
+_ZIP64_EXTRA_ID = 0x0001
+
+_FLAG_ENCRYPTED = 0x0001
+_FLAG_DATA_DESCRIPTOR = 0x0008
+
+
+class ZipStreamError(Exception):
+    """
+    The archive cannot be extracted in streaming mode (or failed verification).
+    """
+
+
+def is_wanted_member(name: str, suffixes: tuple[str, ...] = SHAPEFILE_SUFFIXES) -> bool:
+    """
+    Return True if a member name ends with one of the wanted suffixes.
+    """
+    return not name.endswith("/") and name.lower().endswith(suffixes)
+
+
+class _Member:
+    """
+    State for the member currently being read.
+    """
+
+    def __init__(self, name: str, method: int, flags: int, crc: int, csize: int, usize: int):
+        self.name = name
+        self.method = method
+        self.has_descriptor = bool(flags & _FLAG_DATA_DESCRIPTOR)
+        self.expected_crc = crc
+        self.expected_size = usize
+        self.remaining = None if self.has_descriptor else csize
+        self.inflater = zlib.decompressobj(-15) if method == zipfile.ZIP_DEFLATED else None
+        self.crc = 0
+        self.size = 0
+        self.zip64 = False
+        self.awaiting_descriptor = False
+        self.inflate = True
+        self.part: Path | None = None
+        self.handle = None
+
+
+class StreamingZipExtractor:
+    """
+    Incremental zip extractor fed with consecutive chunks of the archive.
+
+    Call feed() with each downloaded chunk in order, then close().
+    """
+
+    def __init__(
+        self,
+        extract_to: Path,
+        suffixes: tuple[str, ...] = SHAPEFILE_SUFFIXES,
+    ) -> None:
+        self.extract_to = extract_to
+        self.suffixes = suffixes
+        self.extracted: dict[str, int] = {}
+        self.skipped: list[str] = []
+        self._buffer = bytearray()
+        self._member: _Member | None = None
+        self._done = False
+
+    def feed(self, chunk: bytes) -> None:
+        """
+        Consume the next chunk of the archive.
+
+        Raises:
+            ZipStreamError: If the archive cannot be streamed or a member fails its CRC.
+        """
+        if self._done:
+            return
+        self._buffer += chunk
+        while not self._done and self._step():
+            pass
+
+    def close(self) -> None:
+        """
+        Finish extraction; the archive must have reached its central directory.
+
+        Raises:
+            ZipStreamError: If the stream ended inside a member.
+        """
+        if not self._done:
+            self.abort()
+            raise ZipStreamError("Archive ended before its central directory")
+
+    def abort(self) -> None:
+        """
+        Remove a partially written member, if any.
+        """
+        member = self._member
+        if member is not None and member.handle is not None:
+            member.handle.close()
+            member.part.unlink(missing_ok=True)
+        self._member = None
+
+    def _step(self) -> bool:
+        """
+        Make as much progress as the buffer allows. Returns True to keep looping.
+        """
+        if self._member is None:
+            return self._read_header()
+        return self._read_data()
+
+    def _read_header(self) -> bool:
+        if len(self._buffer) < 4:
+            return False
+        signature = bytes(self._buffer[:4])
+        if signature in (_CENTRAL_DIR_SIG, _END_OF_CENTRAL_DIR_SIG):
+            self._done = True
+            self._buffer.clear()
+            return False
+        if signature != _LOCAL_HEADER_SIG:
+            raise ZipStreamError(f"Unexpected record signature {signature!r}")
+        if len(self._buffer) < _LOCAL_HEADER.size:
+            return False
+
+        (_, _, flags, method, _, _, crc, csize, usize, name_len, extra_len) = (
+            _LOCAL_HEADER.unpack_from(self._buffer)
+        )
+        header_len = _LOCAL_HEADER.size + name_len + extra_len
+        if len(self._buffer) < header_len:
+            return False
+
+        raw_name = bytes(self._buffer[_LOCAL_HEADER.size : _LOCAL_HEADER.size + name_len])
+        extra = bytes(self._buffer[_LOCAL_HEADER.size + name_len : header_len])
+        del self._buffer[:header_len]
+
+        name = raw_name.decode("utf-8" if flags & 0x0800 else "cp437")
+        _check_supported(name, flags, method)
+        zip64 = _has_zip64_extra(extra)
+        if _ZIP64_MARKER in (csize, usize):
+            usize, csize = _zip64_sizes(extra, usize, csize)
+
+        member = _Member(name, method, flags, crc, csize, usize)
+        member.zip64 = zip64
+
+        # Unwanted members are skipped without inflating unless only the
+        # deflate stream can tell where they end.
+        member.inflate = is_wanted_member(name, self.suffixes) or member.has_descriptor
+        if is_wanted_member(name, self.suffixes):
+            target = self._target(name)
+            member.part = target.with_name(target.name + ".part")
+            member.part.parent.mkdir(parents=True, exist_ok=True)
+            member.handle = member.part.open("wb")
+        else:
+            self.skipped.append(name)
+        self._member = member
+        return True
+
+    def _read_data(self) -> bool:
+        member = self._member
+        if member.awaiting_descriptor:
+            return self._read_descriptor(member)
+
+        if member.remaining is not None:
+            take = min(member.remaining, len(self._buffer))
+            data = bytes(self._buffer[:take])
+            del self._buffer[:take]
+            member.remaining -= take
+            self._consume(member, data)
+            if member.remaining > 0:
+                return False
+            if member.inflater is not None and member.inflate:
+                self._emit(member, member.inflater.flush())
+            self._finish(member)
+            return True
+
+        # Data descriptor: only the deflate stream itself knows where it ends.
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        self._consume(member, data)
+        if not member.inflater.eof:
+            return False
+        self._buffer[:0] = member.inflater.unused_data
+        member.awaiting_descriptor = True
+        return True
+
+    def _read_descriptor(self, member: _Member) -> bool:
+        # Optional signature, CRC-32, then sizes (8 bytes each for Zip64 members).
+        offset = 4 if bytes(self._buffer[:4]) == _DATA_DESCRIPTOR_SIG else 0
+        layout = struct.Struct("<IQQ" if member.zip64 else "<III")
+        if len(self._buffer) < offset + layout.size:
+            return False
+        crc, _, usize = layout.unpack_from(self._buffer, offset)
+        del self._buffer[: offset + layout.size]
+        member.expected_crc = crc
+        member.expected_size = usize
+        self._finish(member)
+        return True
+
+    def _consume(self, member: _Member, data: bytes) -> None:
+        if not member.inflate:
+            return
+        if member.inflater is None:
+            self._emit(member, data)
+            return
+        if member.inflater.eof:
+            return
+        try:
+            self._emit(member, member.inflater.decompress(data))
+        except zlib.error as e:
+            self.abort()
+            raise ZipStreamError(f"Corrupt deflate data in {member.name}: {e}") from e
+
+    def _emit(self, member: _Member, data: bytes) -> None:
+        if not data:
+            return
+        member.crc = zlib.crc32(data, member.crc)
+        member.size += len(data)
+        if member.handle is not None:
+            member.handle.write(data)
+
+    def _finish(self, member: _Member) -> None:
+        bad = member.crc != member.expected_crc or member.size != member.expected_size
+        if member.inflate and bad:
+            self.abort()
+            raise ZipStreamError(
+                f"CRC/size mismatch in {member.name}: "
+                f"crc {member.crc:08x} != {member.expected_crc:08x} "
+                f"or size {member.size} != {member.expected_size}"
+            )
+        if member.handle is not None:
+            member.handle.close()
+            member.part.replace(self._target(member.name))
+            self.extracted[member.name] = member.crc
+            logger.debug(f"Extracted {member.name} ({member.size} bytes, CRC ok)")
+        self._member = None
+
+    def _target(self, name: str) -> Path:
+        """
+        Resolve a member name inside extract_to, refusing absolute or parent paths.
+        """
+        parts = PurePosixPath(name.replace("\\", "/")).parts
+        if not parts or parts[0] == "/" or ".." in parts or ":" in parts[0]:
+            raise ZipStreamError(f"Unsafe member path: {name}")
+        return self.extract_to.joinpath(*parts)
+
+
+def verify_against_central_directory(
+    zip_path: Path,
+    extracted: dict[str, int],
+    suffixes: tuple[str, ...] = SHAPEFILE_SUFFIXES,
+) -> None:
+    """
+    Check streamed results against the archive's central directory.
+
+    Args:
+        zip_path (Path): The fully downloaded archive.
+        extracted (dict[str, int]): Member name → CRC-32 from streaming.
+        suffixes (tuple[str, ...]): Wanted member suffixes.
+
+    Raises:
+        ZipStreamError: If a wanted member is missing or its CRC differs.
+    """
+    with zipfile.ZipFile(zip_path) as archive:
+        for info in archive.infolist():
+            if not is_wanted_member(info.filename, suffixes):
+                continue
+            if extracted.get(info.filename) != info.CRC:
+                raise ZipStreamError(
+                    f"{info.filename} missing or differs from the central directory"
+                )
+
+
+def _check_supported(name: str, flags: int, method: int) -> None:
+    """
+    Raise ZipStreamError for members the streaming parser cannot read.
+    """
+    if flags & _FLAG_ENCRYPTED:
+        raise ZipStreamError(f"Encrypted member not supported: {name}")
+    if method not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+        raise ZipStreamError(f"Compression method {method} not supported: {name}")
+    if flags & _FLAG_DATA_DESCRIPTOR and method == zipfile.ZIP_STORED:
+        raise ZipStreamError(f"Stored member with data descriptor not supported: {name}")
+
+
+def _has_zip64_extra(extra: bytes) -> bool:
+    """
+    Return True if the extra field block contains a Zip64 record.
+    """
+    pos = 0
+    while pos + 4 <= len(extra):
+        header_id, length = struct.unpack_from("<HH", extra, pos)
+        if header_id == _ZIP64_EXTRA_ID:
+            return True
+        pos += 4 + length
+    return False
+
+
+def _zip64_sizes(extra: bytes, usize: int, csize: int) -> tuple[int, int]:
+    """
+    Read 8-byte sizes from the Zip64 extended information extra field.
+    """
+    pos = 0
+    while pos + 4 <= len(extra):
+        header_id, length = struct.unpack_from("<HH", extra, pos)
+        if header_id == _ZIP64_EXTRA_ID:
+            values = list(struct.unpack_from(f"<{length // 8}Q", extra, pos + 4))
+            if usize == _ZIP64_MARKER and values:
+                usize = values.pop(0)
+            if csize == _ZIP64_MARKER and values:
+                csize = values.pop(0)
+            return usize, csize
+        pos += 4 + length
+    return usize, csize
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+src/civic_data_boundaries_us_forests/validate.py
+
+Validate and repair exported GeoJSONs in data-in-geojson/ before chunking.
+
+This step:
+- checks every feature for empty geometries, OGC validity, RFC 7946
+  ring orientation, and repeated vertices (see utils/validate_utils.py)
+- repairs only the flagged features (make_valid, remove_repeated_points,
+  orient_polygons) and rewrites only the files that changed
+- runs one file per task across a process pool
+- writes a machine-readable report to data-reports/validate.json
+
+Used by civic-usa CLI:
+    civic-usa export
+    civic-usa validate
+    civic-usa chunk
+
+`civic-usa build` applies the same checks in memory (validate.enabled).
+
+MIT License — maintained by Civic Interconnect
+"""
+
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+
+from civic_lib_core import log_utils
+
+from civic_data_boundaries_us_forests.utils.config_utils import (
+    layer_for_path,
+    load_all_layer_configs,
+)
+from civic_data_boundaries_us_forests.utils.get_paths import (
+    get_data_in_geojson_dir,
+    get_reports_dir,
+)
+from civic_data_boundaries_us_forests.utils.profile_utils import profile_stage
+from civic_data_boundaries_us_forests.utils.validate_utils import (
+    ISSUES,
+    VALIDATE_REPORT,
+    load_validate_settings,
+    validate_file,
+    write_validate_report,
+)
+
+__all__ = [
+    "main",
+    "validate_folder",
+]
+
+logger = log_utils.logger
+
+
+def validate_folder(folder: Path, repair: bool = True, workers: int = 0) -> list[dict]:
+    """
+    Validate every GeoJSON below a folder, one file per worker task.
+
+    Args:
+        folder (Path): Folder to scan (e.g. data-in-geojson/).
+        repair (bool): Rewrite files whose features need repair.
+        workers (int): Worker processes (0 uses every CPU; 1 runs inline).
+
+    Returns:
+        list[dict]: One report row per file, with its owning "layer".
+    """
+    files = sorted(folder.rglob("*.geojson"))
+    if not files:
+        logger.info(f"No GeoJSONs found in {folder}")
+        return []
+
+    workers = workers or os.cpu_count() or 1
+    check = partial(validate_file, repair=repair)
+    logger.info(f"Validating {len(files)} file(s) with {workers} worker(s)")
+
+    with profile_stage("validate") as rec:
+        if workers == 1 or len(files) == 1:
+            rows = [check(path) for path in files]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                chunksize = max(1, len(files) // (workers * 4))
+                rows = list(pool.map(check, files, chunksize=chunksize))
+        rec.features += sum(row["features"] for row in rows)
+
+    layers = load_all_layer_configs()
+    for path, row in zip(files, rows, strict=True):
+        relative = path.relative_to(folder).as_posix()
+        layer = layer_for_path(relative, layers, published=False)
+        row["path"] = f"{folder.name}/{relative}"
+        row["layer"] = layer.name if layer else None
+    return rows
+
+
+def main(repair: bool | None = None, workers: int | None = None) -> int:
+    """
+    CLI entry point for validating exported GeoJSONs.
+
+    Args:
+        repair (bool, optional): Repair flagged features (default: validate.repair).
+        workers (int, optional): Worker processes (default: validate.workers).
+
+    Returns:
+        int: Exit code (0 if successful, 1 if failed or geometries remain invalid).
+    """
+    try:
+        settings = load_validate_settings()
+        repair = settings["repair"] if repair is None else repair
+        workers = settings["workers"] if workers is None else workers
+
+        rows = validate_folder(get_data_in_geojson_dir(), repair=repair, workers=workers)
+        write_validate_report(rows, get_reports_dir() / VALIDATE_REPORT, repair=repair)
+
+        flagged = [r for r in rows if any(r[name] for name in ISSUES)]
+        rewritten = sum(r["rewritten"] for r in rows)
+        still_invalid = sum(r["still_invalid"] for r in rows)
+        logger.info(
+            f"Validated {len(rows)} file(s): {len(flagged)} with issues, "
+            f"{rewritten} rewritten, {still_invalid} feature(s) still invalid"
+        )
+        return 1 if still_invalid else 0
+
+    except Exception as e:
+        logger.error(f"Validation failed: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,34 @@
+import os
+
+from civic_data_boundaries_us_forests.cleanup import execute_plan, plan_data_in
+
+
+def _file(path, size, mtime):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_plan_keeps_recent_archives_within_budget(tmp_path):
+    mb = 1024 * 1024
+    old_zip = _file(tmp_path / "forests" / "old.zip", mb, 1_000)
+    new_zip = _file(tmp_path / "forests" / "districts" / "new.zip", mb, 2_000)
+    new_validators = _file(tmp_path / "forests" / "districts" / "new.zip.http.json", 10, 2_000)
+    # Revalidated (304) most recently, so it counts as the newest.
+    old_validators = _file(tmp_path / "forests" / "old.zip.http.json", 10, 3_000)
+    orphan = _file(tmp_path / "forests" / "gone.zip.http.json", 10, 3_000)
+    shp = _file(tmp_path / "forests" / "old" / "old.shp", 100, 1_000)
+    partial = _file(tmp_path / "forests" / "new.zip.part", 5, 1_000)
+    readme = _file(tmp_path / "forests" / "README.txt", 5, 1_000)
+
+    plan = plan_data_in(tmp_path, archive_budget_mb=1.5)
+
+    assert {i.path for i in plan.keep} == {old_zip, old_validators}
+    assert {i.path for i in plan.delete} == {new_zip, new_validators, orphan, shp.parent, partial}
+    assert plan.bytes_freed == mb + 10 + 10 + 100 + 5
+    assert old_zip.exists() and shp.exists()  # planning deletes nothing
+
+    assert execute_plan(plan) == 0
+    assert old_zip.exists() and old_validators.exists() and readme.exists()
+    assert not new_zip.exists() and not shp.parent.exists() and not partial.exists()
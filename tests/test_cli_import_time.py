@@ -0,0 +1,51 @@
+import os
+import subprocess
+import sys
+
+# Cumulative import time allowed for the CLI module, in microseconds.
+IMPORT_BUDGET_US = 500_000
+
+HEAVY_MODULES = {
+    "civic_lib_geo",
+    "geopandas",
+    "pandas",
+    "pyogrio",
+    "pyproj",
+    "requests",
+    "shapely",
+}
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """
+    Import a module in a fresh interpreter with -X importtime.
+
+    Returns:
+        dict[str, int]: Cumulative microseconds per imported module.
+    """
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(p for p in sys.path if p)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = (
+            part.strip() for part in line.removeprefix("import time:").split("|")
+        )
+        if cumulative.isdigit():
+            times[name] = int(cumulative)
+    return times
+
+
+def test_cli_import_skips_heavy_dependencies():
+    times = _import_times("civic_data_boundaries_us_forests.cli.cli")
+
+    loaded = {name.split(".")[0] for name in times}
+    assert not loaded & HEAVY_MODULES
+    assert times["civic_data_boundaries_us_forests.cli.cli"] < IMPORT_BUDGET_US
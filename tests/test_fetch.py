@@ -0,0 +1,39 @@
+import json
+
+from civic_data_boundaries_us_forests import fetch
+
+
+class _Response:
+    def __init__(self, status_code, body=b"", headers=None):
+        self.status_code = status_code
+        self.body = body
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(self.status_code)
+
+    def iter_content(self, chunk_size):
+        yield self.body
+
+    def close(self):
+        pass
+
+
+def test_kept_zip_is_revalidated_with_a_conditional_get(tmp_path, monkeypatch):
+    requests_made = []
+    responses = [_Response(200, b"zip-v1", {"ETag": '"v1"'}), _Response(304)]
+
+    def fake_get(url, stream, timeout, headers):
+        requests_made.append(headers)
+        return responses.pop(0)
+
+    monkeypatch.setattr(fetch.requests, "get", fake_get)
+    dest = tmp_path / "S_USA.AdministrativeForest.zip"
+
+    assert fetch.download_file("https://example.test/a.zip", dest)
+    assert json.loads((tmp_path / f"{dest.name}.http.json").read_text())["etag"] == '"v1"'
+
+    assert fetch.download_file("https://example.test/a.zip", dest)
+    assert requests_made == [{}, {"If-None-Match": '"v1"'}]
+    assert dest.read_bytes() == b"zip-v1"
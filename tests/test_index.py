@@ -0,0 +1,72 @@
+import json
+
+import geopandas as gpd
+from shapely.geometry import Point, box
+
+from civic_data_boundaries_us_forests.index import (
+    build_index_main,
+    compute_bbox,
+    index_geojsons_in_folder,
+)
+from civic_data_boundaries_us_forests.utils.config_utils import LayerConfig, clear_config_cache
+from civic_data_boundaries_us_forests.utils.shard_utils import shard_key
+
+
+def test_label_files_are_attributed_to_their_layer(tmp_path):
+    layers = [
+        LayerConfig(name="us-forests", output_dir="forests", id_field="ID"),
+        LayerConfig(name="us-forest-districts", output_dir="forests/districts"),
+    ]
+    (tmp_path / "forests" / "a").mkdir(parents=True)
+    (tmp_path / "labels").mkdir()
+    gpd.GeoDataFrame({"ID": ["F1"]}, geometry=[box(0, 0, 1, 1)], crs="EPSG:4326").to_file(
+        tmp_path / "forests" / "a" / "a.geojson", driver="GeoJSON"
+    )
+    for layer in layers:
+        gpd.GeoDataFrame({"ID": ["F1"]}, geometry=[Point(0.5, 0.5)], crs="EPSG:4326").to_file(
+            tmp_path / "labels" / f"{layer.name}.geojson", driver="GeoJSON"
+        )
+
+    entries = {e["path"]: e for e in index_geojsons_in_folder(tmp_path, "data-out", layers=layers)}
+
+    boundaries = entries["data-out/forests/a/a.geojson"]
+    assert (boundaries["layer"], boundaries["kind"]) == ("us-forests", "boundaries")
+    labels = entries["data-out/labels/us-forests.geojson"]
+    assert (labels["layer"], labels["kind"], labels["id_field"]) == ("us-forests", "labels", "ID")
+    districts = entries["data-out/labels/us-forest-districts.geojson"]
+    assert (districts["layer"], districts["kind"]) == ("us-forest-districts", "labels")
+    assert shard_key(labels) == ("EPSG:4326", "us-forests", "all")
+
+
+def test_compute_bbox(tmp_path):
+    path = tmp_path / "a.geojson"
+    gpd.GeoDataFrame(geometry=[box(1, 2, 3, 4)], crs="EPSG:4326").to_file(path, driver="GeoJSON")
+
+    assert compute_bbox(path) == [1.0, 2.0, 3.0, 4.0]
+    assert compute_bbox(tmp_path / "missing.geojson") is None
+
+
+def test_index_json_is_compact_and_changes_use_the_shards(tmp_path, monkeypatch):
+    (tmp_path / "data-config").mkdir()
+    (tmp_path / "data-config" / "test.yaml").write_text(
+        "layers:\n  - name: us-forests\n    output_dir: forests\n", encoding="utf-8"
+    )
+    (tmp_path / "config.yaml").write_text("summary:\n  enabled: false\n", encoding="utf-8")
+    (tmp_path / "data-out" / "forests").mkdir(parents=True)
+    gpd.GeoDataFrame({"ID": ["F1"]}, geometry=[box(0, 0, 1, 1)], crs="EPSG:4326").to_file(
+        tmp_path / "data-out" / "forests" / "a.geojson", driver="GeoJSON"
+    )
+    monkeypatch.setenv("CIVIC_USA_REPO_ROOT", str(tmp_path))
+    clear_config_cache()
+
+    assert build_index_main() == 0
+    assert build_index_main() == 0
+    clear_config_cache()
+
+    text = (tmp_path / "data-out" / "index.json").read_text(encoding="utf-8")
+    assert json.loads(text) == [
+        {"path": "data-out/forests/a.geojson", "bbox": [0.0, 0.0, 1.0, 1.0], "size_mb": 0.0}
+    ]
+    assert text == json.dumps(json.loads(text), separators=(",", ":"))
+    changes = json.loads((tmp_path / "data-out" / "changes.json").read_text(encoding="utf-8"))
+    assert changes["summary"]["files_unchanged"] == 1
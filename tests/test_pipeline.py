@@ -0,0 +1,148 @@
+import json
+
+import geopandas as gpd
+import pytest
+from shapely.geometry import box
+
+from civic_data_boundaries_us_forests import chunk, export, pipeline
+from civic_data_boundaries_us_forests.utils.checkpoint import Checkpoint
+from civic_data_boundaries_us_forests.utils.config_utils import (
+    clear_config_cache,
+    load_all_layer_configs,
+)
+
+CONFIG = """
+layer_defaults:
+  chunk_max_features: 3
+  simplify_tolerance: 0.0
+validate:
+  enabled: false
+simplify_cache:
+  enabled: false
+chunk:
+  workers: 1
+geometry_pool:
+  enabled: {pool}
+"""
+
+LAYER = """
+layers:
+  - name: test-forests
+    output_dir: forests
+    split_by: NAME
+    id_field: ID
+"""
+
+
+@pytest.fixture
+def make_repo(tmp_path, monkeypatch):
+    def make(name: str, pool: bool, group_sizes: dict[str, int]):
+        root = tmp_path / name
+        (root / "data-config").mkdir(parents=True)
+        (root / "data-config" / "test.yaml").write_text(LAYER, encoding="utf-8")
+        (root / "config.yaml").write_text(CONFIG.format(pool=str(pool).lower()), encoding="utf-8")
+        names = [group for group, size in group_sizes.items() for _ in range(size)]
+        gdf = gpd.GeoDataFrame(
+            {"NAME": names, "ID": [f"F{i}" for i in range(len(names))]},
+            geometry=[box(i, 0, i + 0.5, 0.5) for i in range(len(names))],
+            crs="EPSG:4326",
+        )
+        (root / "data-in" / "forests").mkdir(parents=True)
+        gdf.to_file(root / "data-in" / "forests" / "source.shp")
+        monkeypatch.setenv("CIVIC_USA_REPO_ROOT", str(root))
+        clear_config_cache()
+        return root
+
+    yield make
+    clear_config_cache()
+
+
+def _tree(root):
+    return {
+        p.relative_to(root).as_posix(): p.read_bytes()
+        for p in sorted((root / "data-out").rglob("*"))
+        if p.is_file() and "data-reports" not in p.parts
+    }
+
+
+@pytest.mark.parametrize(
+    ("pool", "group_sizes", "big"),
+    [
+        # Without the pool, chunk copies small files and splits big ones.
+        (False, {"Alpha Forest": 2, "Beta Forest": 1, "Gamma Forest": 7}, "gamma_forest"),
+        # With the pool both routes rewrite every group.
+        (True, {"Alpha Forest": 2, "Beta Forest": 7}, "beta_forest"),
+    ],
+)
+def test_build_matches_export_then_chunk(make_repo, pool, group_sizes, big):
+    staged = make_repo("staged", pool, group_sizes)
+    assert export.main() == 0
+    assert chunk.main(workers=1) == 0
+    staged_tree = _tree(staged)
+
+    fused = make_repo("fused", pool, group_sizes)
+    assert pipeline.main() == 0
+
+    assert _tree(fused) == staged_tree
+    chunked = f"data-out/forests/{big}/{big}_chunked.geojson"
+    assert [p for p in staged_tree if p.startswith(chunked)] == [
+        f"{chunked}/{big}_{n:03d}.geojson" for n in (1, 2, 3)
+    ]
+    labels = json.loads(staged_tree["data-out/labels/test-forests.geojson"])
+    assert {f["properties"]["source"] for f in labels["features"]} <= staged_tree.keys()
+
+
+def test_resumed_build_skips_journaled_groups(make_repo, tmp_path):
+    root = make_repo("resume", False, {"Alpha Forest": 2, "Beta Forest": 1})
+    (layer,) = load_all_layer_configs()
+    journal = tmp_path / "build.jsonl"
+
+    interrupted = Checkpoint(journal)
+    pipeline.build_layer(layer, checkpoint=interrupted)
+    interrupted.close(completed=False)
+
+    alpha = root / "data-out" / "forests" / "alpha_forest" / "alpha_forest.geojson"
+    beta = root / "data-out" / "forests" / "beta_forest" / "beta_forest.geojson"
+    alpha.write_text("journaled, so left alone", encoding="utf-8")
+    expected_beta = beta.read_bytes()
+    beta.unlink()
+
+    resumed = Checkpoint(journal, resume=True)
+    pipeline.build_layer(layer, checkpoint=resumed)
+    resumed.close(completed=True)
+
+    assert alpha.read_text(encoding="utf-8") == "journaled, so left alone"
+    assert beta.read_bytes() == expected_beta
+    assert resumed.resumed == 1
+
+
+@pytest.mark.parametrize("pool", [False, True])
+def test_memory_budget_build_matches_whole_build(make_repo, pool):
+    group_sizes = {"Alpha Forest": 2, "Beta Forest": 7, "Gamma Forest": 1}
+    extra = "\nweb_mercator:\n  enabled: true\nvalidate:\n  enabled: true\n"
+    bundles = "    bundle_by: NAME\n    nationwide: true\n"
+
+    def build(name, budget=""):
+        root = make_repo(name, pool, group_sizes)
+        config = root / "config.yaml"
+        config.write_text(
+            config.read_text(encoding="utf-8").replace("validate:\n  enabled: false\n", "") + extra,
+            encoding="utf-8",
+        )
+        (root / "data-config" / "test.yaml").write_text(LAYER + bundles + budget, encoding="utf-8")
+        clear_config_cache()
+        assert pipeline.main() == 0
+        return {
+            p.relative_to(root).as_posix(): p.read_bytes()
+            for p in sorted(root.rglob("*"))
+            if p.is_file() and p.parts[len(root.parts)].startswith("data-out")
+        }
+
+    whole = build("whole")
+    # A tiny budget reads one feature per window, so groups span windows.
+    windowed = build("windowed", "    memory_budget_mb: 0.000001\n")
+
+    assert windowed == whole
+    assert "data-out/bundles/forests/nationwide.geojsons" in whole
+    assert any(p.startswith("data-out-3857/forests/beta_forest/beta_forest_chunked") for p in whole)
+    assert not [p for p in windowed if p.rsplit("/", 1)[-1].startswith(".")]
@@ -0,0 +1,132 @@
+import asyncio
+import gzip
+import json
+
+import geopandas as gpd
+import pytest
+from shapely.geometry import box
+
+from civic_data_boundaries_us_forests import serve
+from civic_data_boundaries_us_forests.serve import DataServer, parse_range
+
+
+def test_parse_range():
+    assert parse_range("bytes=0-9", 100) == (0, 9)
+    assert parse_range("bytes=90-", 100) == (90, 99)
+    assert parse_range("bytes=-10", 100) == (90, 99)
+    assert parse_range("bytes=0-1,5-6", 100) is None
+    with pytest.raises(ValueError):
+        parse_range("bytes=100-", 100)
+
+
+def test_range_etag_and_gzip_sidecar(tmp_path):
+    (tmp_path / "a.geojson").write_bytes(b"0123456789")
+    (tmp_path / "a.geojson.gz").write_bytes(gzip.compress(b"0123456789"))
+    server = DataServer(tmp_path)
+
+    async def get(path, headers=""):
+        tcp = await asyncio.start_server(server.handle, "127.0.0.1", 0)
+        port = tcp.sockets[0].getsockname()[1]
+        async with tcp:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            request = f"GET {path} HTTP/1.1\r\nConnection: close\r\n{headers}\r\n"
+            writer.write(request.encode())
+            response = await reader.read()
+            writer.close()
+        return response
+
+    ranged = asyncio.run(get("/a.geojson", "Range: bytes=2-4\r\n"))
+    assert ranged.startswith(b"HTTP/1.1 206") and ranged.endswith(b"\r\n\r\n234")
+    etag = next(line.split(b": ")[1] for line in ranged.split(b"\r\n") if line.startswith(b"ETag"))
+    assert asyncio.run(get("/a.geojson", f"If-None-Match: {etag.decode()}\r\n")).startswith(
+        b"HTTP/1.1 304"
+    )
+    assert b"Content-Encoding: gzip" in asyncio.run(
+        get("/a.geojson", "Accept-Encoding: br, gzip\r\n")
+    )
+    assert asyncio.run(get("/../../etc/passwd")).startswith(b"HTTP/1.1 404")
+
+
+def _exchange(server, request: bytes) -> bytes:
+    async def run():
+        tcp = await asyncio.start_server(server.handle, "127.0.0.1", 0)
+        port = tcp.sockets[0].getsockname()[1]
+        async with tcp:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(request)
+            response = await reader.read()
+            writer.close()
+        return response
+
+    return asyncio.run(run())
+
+
+def _dechunk(body: bytes) -> tuple[bytes, bool]:
+    """
+    Decode a chunked body; return (payload, saw the terminating chunk).
+    """
+    payload = b""
+    while body:
+        size_line, _, body = body.partition(b"\r\n")
+        size = int(size_line, 16)
+        if size == 0:
+            return payload, body == b"\r\n"
+        payload, body = payload + body[:size], body[size + 2 :]
+    return payload, False
+
+
+def test_gzip_refused_with_zero_q(tmp_path):
+    (tmp_path / "a.geojson").write_bytes(b"0123456789")
+    (tmp_path / "a.geojson.gz").write_bytes(gzip.compress(b"0123456789"))
+    server = DataServer(tmp_path)
+    for refused in ("gzip;q=0", "gzip; q=0.0", "gzip;q=0.000, identity"):
+        request = (
+            f"GET /a.geojson HTTP/1.1\r\nConnection: close\r\nAccept-Encoding: {refused}\r\n\r\n"
+        )
+        response = _exchange(server, request.encode())
+        assert b"Content-Encoding" not in response
+        assert response.endswith(b"0123456789")
+
+
+def test_query_streams_chunked_geojson_seq(tmp_path):
+    path = tmp_path / "forests" / "west.geojson"
+    path.parent.mkdir()
+    gdf = gpd.GeoDataFrame(
+        {"NAME": ["in", "out"]}, geometry=[box(0, 0, 2, 2), box(5, 5, 6, 6)], crs="EPSG:4326"
+    )
+    gdf.to_file(path, driver="GeoJSON")
+    index = [{"path": "data-out/forests/west.geojson", "bbox": list(gdf.total_bounds)}]
+    (tmp_path / "index.json").write_text(json.dumps(index))
+    server = DataServer(tmp_path)
+
+    response = _exchange(server, b"GET /query?bbox=1,1,3,3 HTTP/1.1\r\nConnection: close\r\n\r\n")
+    head, _, body = response.partition(b"\r\n\r\n")
+    assert head.startswith(b"HTTP/1.1 200")
+    assert b"Transfer-Encoding: chunked" in head
+    payload, complete = _dechunk(body)
+    assert complete
+    records = payload.split(b"\x1e")[1:]
+    assert [json.loads(r)["properties"]["NAME"] for r in records] == ["in"]
+
+    # HEAD sends headers only, so the next response on the connection starts clean.
+    keep_alive = (
+        b"HEAD /query?bbox=1,1,3,3 HTTP/1.1\r\n\r\n"
+        b"GET /query?bbox=1,1,3,3 HTTP/1.1\r\nConnection: close\r\n\r\n"
+    )
+    first, _, rest = _exchange(server, keep_alive).partition(b"\r\n\r\n")
+    assert first.startswith(b"HTTP/1.1 200") and rest.startswith(b"HTTP/1.1 200")
+
+
+def test_query_error_after_headers_truncates_instead_of_500(tmp_path, monkeypatch):
+    (tmp_path / "index.json").write_text("[]")
+    server = DataServer(tmp_path)
+
+    def failing(*args, **kwargs):
+        raise OSError("disk gone")
+        yield
+
+    monkeypatch.setattr(serve, "query_bbox", failing)
+    response = _exchange(server, b"GET /query?bbox=0,0,1,1 HTTP/1.1\r\n\r\n")
+    assert response.startswith(b"HTTP/1.1 200")
+    assert b"500" not in response
+    assert _dechunk(response.partition(b"\r\n\r\n")[2]) == (b"", False)
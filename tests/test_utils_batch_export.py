@@ -0,0 +1,60 @@
+import json
+
+import geopandas as gpd
+from shapely.geometry import Point
+
+from civic_data_boundaries_us_forests.utils.batch_export import (
+    FeatureCollectionWriter,
+    batch_size_for,
+    export_split_geojson_batched,
+)
+from civic_data_boundaries_us_forests.utils.export_utils import (
+    export_split_geojson,
+    shapefile_size,
+)
+
+
+def test_streamed_collection_matches_single_dump(tmp_path):
+    features = [
+        {
+            "type": "Feature",
+            "properties": {"n": i},
+            "geometry": {"type": "Point", "coordinates": [i, 0.5]},
+        }
+        for i in range(5)
+    ]
+    dest = tmp_path / "a.geojson"
+
+    writer = FeatureCollectionWriter(dest, "a")
+    writer.append(features[:2])
+    writer.append(features[2:])
+    writer.finish()
+
+    expected = {"type": "FeatureCollection", "name": "a", "features": features}
+    assert dest.read_text(encoding="utf-8") == json.dumps(expected, indent=2)
+    assert not (tmp_path / "a.geojson.part").exists()
+
+
+def test_batched_export_matches_in_memory_export(tmp_path):
+    names = ["Alpha", "Beta", "Alpha", "Alpha", "Beta", "Gamma", "Alpha", "Beta", "Gamma"]
+    gdf = gpd.GeoDataFrame(
+        {"NAME": names, "ID": [f"F{i}" for i in range(len(names))]},
+        geometry=[Point(i, 0).buffer(0.4, quad_segs=16) for i in range(len(names))],
+        crs="EPSG:4326",
+    )
+    shp_path = tmp_path / "source.shp"
+    gdf.to_file(shp_path)
+
+    # Budget for roughly two features per window, so groups straddle windows.
+    budget_mb = 2.5 * shapefile_size(shp_path) / len(names) * 6.0 / 1_048_576
+    assert 1 < batch_size_for(shp_path, budget_mb) < len(names) // 2
+
+    export_split_geojson(shp_path, tmp_path / "whole", split_by="NAME", simplify_tolerance=0.05)
+    export_split_geojson_batched(
+        shp_path, tmp_path / "batched", budget_mb, split_by="NAME", simplify_tolerance=0.05
+    )
+
+    whole = {p.name: p.read_bytes() for p in sorted((tmp_path / "whole").iterdir())}
+    batched = {p.name: p.read_bytes() for p in sorted((tmp_path / "batched").iterdir())}
+    assert sorted(whole) == ["alpha.geojson", "beta.geojson", "gamma.geojson"]
+    assert batched == whole
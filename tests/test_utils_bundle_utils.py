@@ -0,0 +1,18 @@
+import geopandas as gpd
+import shapely
+
+from civic_data_boundaries_us_forests.utils.bundle_utils import geojson_seq_bytes
+
+
+def test_geojson_seq_is_rs_framed_one_feature_per_record():
+    gdf = gpd.GeoDataFrame(
+        {"REGION": ["01", "02"]},
+        geometry=[shapely.box(0, 0, 1, 1), shapely.box(1, 1, 2, 2)],
+        crs="EPSG:4326",
+    )
+
+    records = geojson_seq_bytes(gdf).split(b"\x1e")
+
+    assert records[0] == b""
+    assert len(records) == 3
+    assert all(r.endswith(b"\n") and b"\n" not in r[:-1] for r in records[1:])
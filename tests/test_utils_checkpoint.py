@@ -0,0 +1,96 @@
+import geopandas as gpd
+from shapely.geometry import box
+
+from civic_data_boundaries_us_forests.utils.checkpoint import Checkpoint
+from civic_data_boundaries_us_forests.utils.chunk_utils import ChunkTask, run_chunk_tasks
+from civic_data_boundaries_us_forests.utils.export_utils import write_geojson
+from civic_data_boundaries_us_forests.utils.output_store import (
+    get_output_store,
+    remove_temp_files,
+    temp_path,
+)
+
+
+def test_journal_survives_interruption_and_is_removed_on_success(tmp_path):
+    journal = tmp_path / "export.jsonl"
+    out = tmp_path / "a.geojson"
+    out.write_text("{}", encoding="utf-8")
+
+    first = Checkpoint(journal)
+    first.mark_written(out, source="1:1")
+    first.close(completed=False)
+    with journal.open("a", encoding="utf-8") as f:
+        f.write('{"unit": "torn')
+
+    resumed = Checkpoint(journal, resume=True)
+    assert resumed.is_written(out, source="1:1")
+    assert not resumed.is_written(out, source="2:2")
+    assert not resumed.all_written([out, tmp_path / "b.geojson"], source="1:1")
+    assert resumed.resumed == 1
+    resumed.close(completed=True)
+    assert not journal.exists()
+
+    fresh = Checkpoint(journal)
+    assert not fresh.is_written(out, source="1:1")
+    fresh.close(completed=True)
+
+
+def test_write_bytes_is_atomic_and_partials_are_swept(tmp_path):
+    dest = tmp_path / "out" / "a.geojson"
+    get_output_store().write_bytes(dest, b"new")
+    assert dest.read_bytes() == b"new"
+    assert [p.name for p in dest.parent.iterdir()] == ["a.geojson"]
+
+    temp_path(dest).write_bytes(b"partial")
+    (dest.parent / "b.geojson.part").write_bytes(b"partial")
+    assert remove_temp_files(tmp_path) == 2
+    assert [p.name for p in dest.parent.iterdir()] == ["a.geojson"]
+
+
+def test_resumed_chunking_only_runs_unfinished_tasks(tmp_path):
+    tasks = []
+    for name in ("done", "todo"):
+        source = tmp_path / "in" / f"{name}.geojson"
+        source.parent.mkdir(exist_ok=True)
+        gdf = gpd.GeoDataFrame({"NAME": [name]}, geometry=[box(0, 0, 1, 1)], crs="EPSG:4326")
+        write_geojson(gdf, source)
+        tasks.append(ChunkTask("test", source, tmp_path / "out", 5, source.stat().st_size))
+
+    journal = tmp_path / "chunk.jsonl"
+    interrupted = Checkpoint(journal)
+    run_chunk_tasks(tasks[:1], workers=1, checkpoint=interrupted)
+    interrupted.close(completed=False)
+
+    resumed = Checkpoint(journal, resume=True)
+    rows = run_chunk_tasks(tasks, workers=1, checkpoint=resumed)
+    resumed.close(completed=True)
+
+    assert [row["path"] for row in rows] == [tasks[1].source.as_posix()]
+    assert sorted(p.name for p in (tmp_path / "out").iterdir()) == ["done.geojson", "todo.geojson"]
+
+
+def test_resumed_chunking_reruns_tasks_with_missing_outputs(tmp_path):
+    source = tmp_path / "in" / "big.geojson"
+    source.parent.mkdir()
+    gdf = gpd.GeoDataFrame(
+        {"NAME": [str(i) for i in range(5)]},
+        geometry=[box(i, 0, i + 1, 1) for i in range(5)],
+        crs="EPSG:4326",
+    )
+    write_geojson(gdf, source)
+    task = ChunkTask("test", source, tmp_path / "out", 2, source.stat().st_size)
+
+    journal = tmp_path / "chunk.jsonl"
+    interrupted = Checkpoint(journal)
+    run_chunk_tasks([task], workers=1, checkpoint=interrupted)
+    interrupted.close(completed=False)
+    parts = sorted((tmp_path / "out" / "big_chunked.geojson").iterdir())
+    assert len(parts) == 3
+    parts[-1].unlink()
+
+    resumed = Checkpoint(journal, resume=True)
+    rows = run_chunk_tasks([task], workers=1, checkpoint=resumed)
+    resumed.close(completed=True)
+
+    assert [row["path"] for row in rows] == [source.as_posix()]
+    assert parts[-1].exists()
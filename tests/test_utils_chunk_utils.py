@@ -0,0 +1,54 @@
+import geopandas as gpd
+from shapely.geometry import box
+
+from civic_data_boundaries_us_forests.utils.chunk_utils import ChunkTask, run_chunk_tasks
+from civic_data_boundaries_us_forests.utils.export_utils import write_geojson
+from civic_data_boundaries_us_forests.utils.profile_utils import enable_profiling
+
+
+def _tasks(tmp_path, out_name):
+    sources = tmp_path / "in"
+    sources.mkdir(exist_ok=True)
+    tasks = []
+    for name, count in (("small", 2), ("large", 7), ("medium", 4)):
+        path = sources / f"{name}.geojson"
+        if not path.exists():
+            gdf = gpd.GeoDataFrame(
+                {"NAME": [f"{name}-{i}" for i in range(count)]},
+                geometry=[box(i, 0, i + 1, 1) for i in range(count)],
+                crs="EPSG:4326",
+            )
+            write_geojson(gdf, path)
+        out = tmp_path / out_name / name
+        tasks.append(ChunkTask("test", path, out, 3, path.stat().st_size))
+    return tasks
+
+
+def _tree(root):
+    return {p.relative_to(root).as_posix(): p.read_bytes() for p in root.rglob("*") if p.is_file()}
+
+
+def test_parallel_chunking_matches_serial(tmp_path):
+    serial = run_chunk_tasks(_tasks(tmp_path, "serial"), workers=1)
+    parallel = run_chunk_tasks(_tasks(tmp_path, "parallel"), workers=2)
+
+    assert _tree(tmp_path / "serial") == _tree(tmp_path / "parallel")
+    assert len(list((tmp_path / "parallel" / "large" / "large_chunked.geojson").iterdir())) == 3
+    assert [row["path"] for row in parallel] == [row["path"] for row in serial]
+    assert [row["path"] for row in parallel] == sorted(row["path"] for row in parallel)
+    assert all(row["seconds"] >= 0 for row in parallel)
+
+
+def test_worker_profiles_are_merged(tmp_path):
+    profiler = enable_profiling()
+    try:
+        run_chunk_tasks(_tasks(tmp_path, "profiled"), workers=2)
+        records = dict(profiler.records)
+    finally:
+        profiler.enabled = False
+        profiler.reset()
+
+    assert records[("chunk", "test")].calls >= 1
+    assert records[("count", "test")].calls == 3
+    # The pool itself is timed under its own name, not added to the workers' "chunk".
+    assert records[("chunk-pool", None)].calls == 1
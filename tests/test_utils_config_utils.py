@@ -0,0 +1,49 @@
+import pytest
+
+from civic_data_boundaries_us_forests.utils.config_utils import layer_for_path, parse_layer_config
+
+
+def test_layer_overrides_defaults():
+    defaults = {"chunk_max_features": 500, "simplify_tolerance": 0.01}
+    raw = {"name": "a", "output_dir": "a", "chunk_max_features": 50}
+
+    layer = parse_layer_config(raw, defaults, "a.yaml")
+
+    assert layer.chunk_max_features == 50
+    assert layer.simplify_tolerance == pytest.approx(0.01)
+
+
+def test_invalid_layer_raises():
+    with pytest.raises(ValueError):
+        parse_layer_config({"name": "a"}, {}, "a.yaml")
+
+    with pytest.raises(ValueError):
+        parse_layer_config(
+            {"name": "a", "output_dir": "a", "chunk_max_features": "x"}, {}, "a.yaml"
+        )
+
+    with pytest.raises(TypeError):
+        parse_layer_config(["a"], {}, "a.yaml")
+
+
+def test_layer_for_path_uses_publish_dir():
+    forests = parse_layer_config(
+        {"name": "us-forests", "output_dir": "forests", "publish_dir": "national-forests"},
+        {},
+        "a.yaml",
+    )
+    districts = parse_layer_config(
+        {
+            "name": "us-forest-districts",
+            "output_dir": "forests/districts",
+            "publish_dir": "forests",
+        },
+        {},
+        "b.yaml",
+    )
+    layers = [forests, districts]
+
+    assert layer_for_path("forests/bly/bly.geojson", layers) is districts
+    assert layer_for_path("national-forests/ochoco/ochoco.geojson", layers) is forests
+    assert layer_for_path("forests/districts/bly.geojson", layers, published=False) is districts
+    assert layer_for_path("forests/ochoco.geojson", layers, published=False) is forests
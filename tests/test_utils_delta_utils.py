@@ -0,0 +1,31 @@
+import geopandas as gpd
+import shapely
+
+from civic_data_boundaries_us_forests.utils.delta_utils import diff_releases, feature_hashes
+
+
+def test_feature_hashes_ignore_vertex_order_but_see_attributes():
+    ring = shapely.box(0, 0, 1, 1)
+    a = gpd.GeoDataFrame({"ID": ["x"], "NAME": ["A"]}, geometry=[ring])
+    b = gpd.GeoDataFrame({"ID": ["x"], "NAME": ["A"]}, geometry=[ring.reverse()])
+    c = gpd.GeoDataFrame({"ID": ["x"], "NAME": ["B"]}, geometry=[ring])
+
+    assert feature_hashes(a, "ID") == feature_hashes(b, "ID")
+    assert feature_hashes(a, "ID") != feature_hashes(c, "ID")
+
+
+def test_diff_releases_reports_files_and_features():
+    previous = [{"path": "p/a", "sha256": "1"}, {"path": "p/b", "sha256": "2"}]
+    current = [{"path": "p/a", "sha256": "9"}, {"path": "p/c", "sha256": "3"}]
+    previous_features = {"p/a": {"f1": "g:a", "f2": "g:a"}}
+    features = {"p/a": {"f1": "g:z", "f3": "g:a"}}
+
+    changes = diff_releases(previous, current, previous_features, features)
+
+    assert changes["files"] == {"added": ["p/c"], "removed": ["p/b"], "modified": ["p/a"]}
+    assert changes["features"]["p/a"] == {"added": ["f3"], "removed": ["f2"], "modified": ["f1"]}
+
+
+def test_feature_hashes_without_attributes():
+    gdf = gpd.GeoDataFrame(geometry=[shapely.box(0, 0, 1, 1), shapely.box(1, 1, 2, 2)])
+    assert list(feature_hashes(gdf)) == ["#0", "#1"]
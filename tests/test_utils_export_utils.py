@@ -0,0 +1,14 @@
+import json
+
+from civic_data_boundaries_us_forests.utils.export_utils import remove_crs_field
+
+
+def test_remove_crs_field(tmp_path):
+    path = tmp_path / "a.geojson"
+    crs = {"type": "name", "properties": {"name": "urn:ogc:def:crs:OGC:1.3:CRS84"}}
+    path.write_text(json.dumps({"type": "FeatureCollection", "crs": crs, "features": []}))
+
+    remove_crs_field(path)
+
+    assert json.loads(path.read_text()) == {"type": "FeatureCollection", "features": []}
+    assert not list(tmp_path.glob("*.tmp"))
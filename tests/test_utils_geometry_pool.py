@@ -0,0 +1,58 @@
+import geopandas as gpd
+import pytest
+import shapely
+from shapely.geometry import Polygon, box
+
+from civic_data_boundaries_us_forests.utils.export_utils import write_geojson
+from civic_data_boundaries_us_forests.utils.geometry_pool import (
+    GEOMETRY_REF,
+    GeometryPool,
+    geometry_keys,
+    read_geojson,
+)
+
+
+def test_keys_match_equivalent_geometries():
+    square = box(0, 0, 1, 1)
+    shifted_start = Polygon([(1, 1), (0, 1), (0, 0), (1, 0)])
+    nudged = box(0, 0, 1 + 1e-9, 1)
+    other = box(0, 0, 2, 1)
+
+    keys = geometry_keys([square, shifted_start, nudged, other, Polygon(), None])
+
+    assert keys[0] == keys[1] == keys[2]
+    assert keys[3] != keys[0]
+    assert keys[4:] == [None, None]
+
+
+def test_pool_stores_duplicates_once_and_read_resolves(tmp_path):
+    pool_dir = tmp_path / "data-out" / "geometry-pool"
+    pool = GeometryPool(pool_dir)
+    shared = box(0, 0, 1, 1)
+    forests = gpd.GeoDataFrame(
+        {"NAME": ["grassland", "forest"]}, geometry=[shared, box(2, 2, 3, 3)], crs="EPSG:4326"
+    )
+    districts = gpd.GeoDataFrame({"NAME": ["district"]}, geometry=[shared], crs="EPSG:4326")
+
+    paths = []
+    for name, gdf in (("forests", forests), ("districts", districts)):
+        path = tmp_path / "data-out" / name / f"{name}.geojson"
+        path.parent.mkdir(parents=True)
+        write_geojson(pool.externalize(gdf), path)
+        paths.append(path)
+
+    assert len(list(pool_dir.rglob("*.json"))) == 2
+    assert pool.report()["duplicates"] == 1
+    assert pool.dedupe_ratio == pytest.approx(1.5)
+
+    on_disk = gpd.read_file(paths[0])
+    assert on_disk.geometry.isna().all()
+    assert on_disk[GEOMETRY_REF].notna().all()
+
+    resolved = read_geojson(paths[0])
+    assert GEOMETRY_REF not in resolved.columns
+    assert shapely.equals(resolved.geometry.values, forests.geometry.values).all()
+    assert shapely.is_ccw(shapely.get_exterior_ring(resolved.geometry.values)).all()
+
+    pool.keys.discard(on_disk[GEOMETRY_REF].iloc[1])
+    assert pool.prune() == 1
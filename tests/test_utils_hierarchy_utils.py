@@ -0,0 +1,28 @@
+import geopandas as gpd
+from shapely.geometry import box
+
+from civic_data_boundaries_us_forests.utils.hierarchy_utils import Hierarchy, compute_link
+
+
+def test_compute_link_and_lookups():
+    forests = gpd.GeoDataFrame(
+        {"ADMINFORES": ["F1", "F2"]}, geometry=[box(0, 0, 2, 2), box(2, 0, 4, 2)], crs="EPSG:4326"
+    )
+    districts = gpd.GeoDataFrame(
+        {"RANGERDIST": ["D1", "D2", "D3"]},
+        # D2 straddles both forests; D3 only touches F2's edge.
+        geometry=[box(0, 0, 1, 1), box(1, 0, 3.5, 1), box(4, 0, 5, 1)],
+        crs="EPSG:4326",
+    )
+
+    rows = compute_link(districts, forests, "RANGERDIST", "ADMINFORES")
+    assert [row[:2] for row in rows] == [["D1", "F1"], ["D2", "F2"], ["D2", "F1"]]
+    assert rows[0][2] > 0.999
+
+    hierarchy = Hierarchy({"links": [{"child_layer": "d", "parent_layer": "f", "rows": rows}]})
+    assert sorted(hierarchy.children("F1")) == ["D1", "D2"]
+    assert sorted(hierarchy.parents("D2")) == ["F1", "F2"]
+    assert hierarchy.parent("D1") == "F1"
+    assert hierarchy.parent("D3") is None
+    assert hierarchy.parent("D2") == "F2"
+    assert 0.55 < hierarchy.share("D2", "F2") < 0.65
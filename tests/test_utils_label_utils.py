@@ -0,0 +1,33 @@
+import json
+
+import geopandas as gpd
+from shapely.geometry import Point, Polygon, box
+
+from civic_data_boundaries_us_forests.utils.config_utils import LayerConfig
+from civic_data_boundaries_us_forests.utils.label_utils import LabelCollector
+
+
+def test_labels_sit_inside_and_link_to_chunk_files(tmp_path):
+    u_shape = Polygon([(0, 0), (3, 0), (3, 3), (2, 3), (2, 1), (1, 1), (1, 3), (0, 3)])
+    gdf = gpd.GeoDataFrame(
+        {"FORESTNAME": ["U", "B", "C"], "REGION": ["01", "01", "02"], "OTHER": [1, 2, 3]},
+        geometry=[u_shape, box(5, 5, 6, 6), box(7, 7, 8, 8)],
+        crs="EPSG:4326",
+    )
+    layer = LayerConfig(
+        name="us-forests", output_dir="forests", split_by="FORESTNAME", chunk_max_features=2
+    )
+
+    labels = LabelCollector(layer)
+    labels.add(gdf.iloc[:2], "big")
+    labels.add(gdf.iloc[2:], "big")
+    features = json.loads(labels.write(tmp_path).read_text())["features"]
+
+    assert u_shape.contains(Point(features[0]["geometry"]["coordinates"]))
+    assert set(features[0]["properties"]) == {"FORESTNAME", "REGION", "bbox", "source"}
+    assert features[0]["properties"]["bbox"] == [0.0, 0.0, 3.0, 3.0]
+    assert [f["properties"]["source"] for f in features] == [
+        "data-out/forests/big/big_chunked.geojson/big_001.geojson",
+        "data-out/forests/big/big_chunked.geojson/big_001.geojson",
+        "data-out/forests/big/big_chunked.geojson/big_002.geojson",
+    ]
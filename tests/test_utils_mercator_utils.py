@@ -0,0 +1,51 @@
+import geopandas as gpd
+import pyogrio
+import shapely
+from shapely.geometry import box
+
+from civic_data_boundaries_us_forests.utils.config_utils import LayerConfig
+from civic_data_boundaries_us_forests.utils.export_utils import geojson_bytes
+from civic_data_boundaries_us_forests.utils.get_paths import MERCATOR_DIR_NAME, REPO_ROOT_ENV_VAR
+from civic_data_boundaries_us_forests.utils.mercator_utils import (
+    MercatorSettings,
+    to_web_mercator,
+    write_mercator_group,
+)
+from civic_data_boundaries_us_forests.utils.write_pipeline import WritePipeline
+
+
+def test_to_web_mercator_matches_pyproj_on_a_metric_grid():
+    gdf = gpd.GeoDataFrame(
+        {"NAME": ["a", "polar"]},
+        geometry=[box(-100.1234, 40.5, -99.9, 41.25), box(10, 84, 11, 89)],
+        crs="EPSG:4326",
+    )
+
+    projected = to_web_mercator(gdf, MercatorSettings(simplify_tolerance_m=0, precision_m=1))
+
+    assert projected.crs == "EPSG:3857"
+    assert projected["NAME"].tolist() == ["a", "polar"]
+    expected = gdf.iloc[[0]].to_crs("EPSG:3857").geometry.iloc[0]
+    assert shapely.hausdorff_distance(projected.geometry.iloc[0], expected) <= 1.0
+    coords = shapely.get_coordinates(projected.geometry.values)
+    assert (coords == coords.round()).all()
+    assert coords[:, 1].max() < 20_048_967
+
+
+def test_mercator_files_declare_their_crs(tmp_path, monkeypatch):
+    monkeypatch.setenv(REPO_ROOT_ENV_VAR, str(tmp_path))
+    layer = LayerConfig(name="us-forests", output_dir="forests", chunk_max_features=1)
+    gdf = gpd.GeoDataFrame(
+        {"NAME": ["a", "b"]}, geometry=[box(0, 0, 1, 1), box(2, 2, 3, 3)], crs="EPSG:4326"
+    )
+    projected = to_web_mercator(gdf, MercatorSettings(simplify_tolerance_m=0, precision_m=1))
+
+    with WritePipeline(geojson_bytes) as writer:
+        write_mercator_group(projected.iloc[:1], "single", layer, writer=writer)
+    write_mercator_group(projected, "split", layer)
+
+    written = sorted(p for p in (tmp_path / MERCATOR_DIR_NAME).rglob("*.geojson") if p.is_file())
+    assert len(written) == 3
+    for path in written:
+        assert pyogrio.read_info(path)["crs"] == "EPSG:3857"
+        assert gpd.read_file(path).crs == "EPSG:3857"
@@ -0,0 +1,27 @@
+from civic_data_boundaries_us_forests.utils.output_store import OutputStore
+
+
+def test_identical_write_is_skipped(tmp_path):
+    store = OutputStore()
+    dest = tmp_path / "a.geojson"
+
+    assert store.write_bytes(dest, b"{}")
+    mtime = dest.stat().st_mtime_ns
+    assert not store.write_bytes(dest, b"{}")
+    assert dest.stat().st_mtime_ns == mtime
+    assert store.write_bytes(dest, b"[]")
+
+    assert (store.stats.written, store.stats.skipped) == (2, 1)
+
+
+def test_copy_links_and_never_mutates_source(tmp_path):
+    store = OutputStore()
+    src = tmp_path / "src.geojson"
+    dest = tmp_path / "out" / "src.geojson"
+    src.write_bytes(b"{}")
+
+    assert store.copy_file(src, dest) in {"reflinked", "hardlinked", "copied"}
+    assert store.copy_file(src, dest) == "skipped"
+
+    store.write_bytes(dest, b"[]")
+    assert src.read_bytes() == b"{}"
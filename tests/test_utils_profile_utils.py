@@ -0,0 +1,73 @@
+from civic_data_boundaries_us_forests.utils.profile_utils import (
+    Profiler,
+    StageRecord,
+    profile_layer,
+)
+
+
+def _profiler():
+    profiler = Profiler()
+    profiler.enabled = True
+    profiler.reset()
+    return profiler
+
+
+def test_stage_calls_aggregate_per_stage_and_layer():
+    profiler = _profiler()
+    for size in (10, 20):
+        with profiler.stage("read") as rec:
+            rec.bytes_read += size
+            rec.features += 1
+    with profile_layer("us-forests"), profiler.stage("read") as rec:
+        rec.bytes_read += 5
+    with profile_layer("us-forests"), profiler.stage("write", layer="explicit"):
+        pass
+
+    read = profiler.records[("read", None)]
+    assert (read.calls, read.bytes_read, read.features) == (2, 30, 2)
+    assert read.wall_s >= 0 and read.peak_rss_growth_mb >= 0
+    assert profiler.records[("read", "us-forests")].bytes_read == 5
+    assert ("write", "explicit") in profiler.records
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = Profiler()
+    with profiler.stage("read") as rec:
+        rec.bytes_read += 1
+    assert profiler.records == {}
+
+
+def test_merge_adds_worker_records():
+    profiler = _profiler()
+    with profile_layer("us-forests"), profiler.stage("chunk") as rec:
+        rec.features += 1
+    worker = StageRecord("chunk", "us-forests", calls=3, wall_s=1.5, features=7)
+    profiler.merge([worker])
+
+    chunk = profiler.records[("chunk", "us-forests")]
+    assert (chunk.calls, chunk.features) == (4, 8)
+    assert chunk.wall_s >= 1.5
+
+
+def test_trace_shape():
+    profiler = _profiler()
+    with profile_layer("b"), profiler.stage("write"):
+        pass
+    with profile_layer("a"), profiler.stage("read"):
+        pass
+
+    trace = profiler.to_trace(command="export")
+    assert trace["command"] == "export"
+    assert {"started_at", "python", "platform", "peak_rss_mb"} <= trace.keys()
+    assert [(s["layer"], s["stage"]) for s in trace["stages"]] == [("a", "read"), ("b", "write")]
+    assert set(trace["stages"][0]) == {
+        "stage",
+        "layer",
+        "calls",
+        "wall_s",
+        "cpu_s",
+        "peak_rss_growth_mb",
+        "bytes_read",
+        "bytes_written",
+        "features",
+    }
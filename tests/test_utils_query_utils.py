@@ -0,0 +1,33 @@
+import json
+
+import geopandas as gpd
+from shapely.geometry import box
+
+from civic_data_boundaries_us_forests.utils.config_utils import LayerConfig
+from civic_data_boundaries_us_forests.utils.query_utils import candidate_files, query_bbox
+
+
+def _write(root, name, geoms):
+    path = root / "forests" / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    gdf = gpd.GeoDataFrame({"NAME": [f"{name}-{i}" for i in range(len(geoms))]}, geometry=geoms)
+    gdf.set_crs("EPSG:4326").to_file(path, driver="GeoJSON")
+    return {"path": f"data-out/forests/{name}", "format": "geojson", "bbox": list(gdf.total_bounds)}
+
+
+def test_query_prunes_files_and_clips(tmp_path):
+    index = [
+        _write(tmp_path, "west.geojson", [box(0, 0, 2, 2), box(3, 3, 4, 4)]),
+        _write(tmp_path, "east.geojson", [box(10, 0, 12, 2)]),
+    ]
+    (tmp_path / "index.json").write_text(json.dumps(index))
+
+    layers = [LayerConfig(name="us-forests", output_dir="forests")]
+    candidates = candidate_files((1, 1, 2.5, 2.5), root=tmp_path, all_layers=layers)
+    assert candidates == [(tmp_path / "forests" / "west.geojson", "us-forests")]
+
+    batches = list(
+        query_bbox((1, 1, 2.5, 2.5), clip=True, batch_size=1, root=tmp_path, all_layers=layers)
+    )
+    assert [b["NAME"].tolist() for b in batches] == [["west.geojson-0"]]
+    assert batches[0].geometry.iloc[0].bounds == (1.0, 1.0, 2.0, 2.0)
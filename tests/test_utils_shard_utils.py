@@ -0,0 +1,39 @@
+import json
+
+from civic_data_boundaries_us_forests.utils.query_utils import ShardedIndex
+from civic_data_boundaries_us_forests.utils.shard_utils import write_index_shards
+
+
+def _entry(path, layer, region, bbox, crs="EPSG:4326"):
+    return {"path": path, "crs": crs, "layer": layer, "region": region, "bbox": bbox, "features": 1}
+
+
+def test_shards_load_only_what_the_viewport_touches(tmp_path):
+    index = [
+        _entry("data-out/forests/a.geojson", "us-forests", "01", [0, 0, 1, 1]),
+        _entry("data-out/forests/b.geojson", "us-forests", "01", [2, 2, 3, 3]),
+        _entry("data-out/forests/c.geojson", "us-forests", "02", [10, 10, 11, 11]),
+        _entry("data-out/labels/us-forests.geojson", None, None, [0, 0, 11, 11]),
+        _entry(
+            "data-out-3857/forests/a.geojson", "us-forests", "01", [0, 0, 1e5, 1e5], "EPSG:3857"
+        ),
+    ]
+    stale = tmp_path / "index" / "epsg-4326" / "removed-layer" / "all.json"
+    stale.parent.mkdir(parents=True)
+    stale.write_text("[]")
+
+    root = json.loads(write_index_shards(index, tmp_path).read_text())
+
+    assert [(r["crs"], r["layer"], r["region"]) for r in root["shards"]] == [
+        ("EPSG:3857", "us-forests", "01"),
+        ("EPSG:4326", "other", "all"),
+        ("EPSG:4326", "us-forests", "01"),
+        ("EPSG:4326", "us-forests", "02"),
+    ]
+    assert root["shards"][2]["bbox"] == [0, 0, 3, 3]
+    assert not stale.exists()
+
+    sharded = ShardedIndex.load(tmp_path / "index")
+    entries = sharded.entries((0.5, 0.5, 0.6, 0.6), layers=["us-forests"])
+    assert [e["path"] for e in entries] == ["data-out/forests/a.geojson"]
+    assert list(sharded._loaded) == ["epsg-4326/us-forests/01.json"]
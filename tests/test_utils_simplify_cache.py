@@ -0,0 +1,54 @@
+import itertools
+
+import numpy as np
+import shapely
+
+from civic_data_boundaries_us_forests.utils import simplify_cache
+from civic_data_boundaries_us_forests.utils.simplify_cache import SimplifyCache, cache_keys
+from civic_data_boundaries_us_forests.utils.simplify_utils import simplify_geometries
+
+
+def _circles(count: int) -> np.ndarray:
+    radii = np.linspace(1.0, 2.0, count)
+    return shapely.buffer(
+        shapely.points(np.arange(count) * 10.0, np.zeros(count)), radii, quad_segs=64
+    )
+
+
+def test_keys_change_with_tolerance_and_algorithm():
+    geoms = _circles(1)
+    base = cache_keys(geoms, [0.01], "simplify-v1")
+    assert cache_keys(geoms, [0.01], "simplify-v1") == base
+    assert cache_keys(geoms, [0.02], "simplify-v1") != base
+    assert cache_keys(geoms, [0.01], "simplify-v2") != base
+
+
+def test_hit_returns_identical_geometry_and_mode_change_misses(tmp_path):
+    cache = SimplifyCache(tmp_path / "simplify.sqlite", max_bytes=1 << 20)
+    geoms = _circles(3)
+
+    first, _ = simplify_geometries(geoms, 0.05, cache=cache)
+    assert (cache.hits, cache.misses) == (0, 3)
+    again, _ = simplify_geometries(geoms, 0.05, cache=cache)
+    assert (cache.hits, cache.misses) == (3, 3)
+    assert shapely.to_wkb(again).tolist() == shapely.to_wkb(first).tolist()
+
+    simplify_geometries(geoms, 0.05, mode="area", cache=cache)
+    assert cache.misses > 3
+    cache.close()
+
+
+def test_eviction_drops_least_recently_used_within_budget(tmp_path, monkeypatch):
+    clock = itertools.count(1)
+    monkeypatch.setattr(simplify_cache.time, "time", lambda: float(next(clock)))
+    cache = SimplifyCache(tmp_path / "simplify.sqlite", max_bytes=1 << 20)
+    items = [(bytes([i]) * 32, b"x" * 100) for i in range(4)]
+    for item in items:
+        cache.put_many([item])
+    cache.get_many([items[0][0]])  # oldest entry becomes most recently used
+
+    cache.max_bytes = 2 * 132
+    assert cache.evict() == 2
+    assert cache.total_bytes() <= cache.max_bytes
+    assert set(cache.get_many([key for key, _ in items])) == {items[0][0], items[3][0]}
+    cache.close()
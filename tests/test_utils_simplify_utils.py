@@ -0,0 +1,29 @@
+import numpy as np
+import shapely
+
+from civic_data_boundaries_us_forests.utils.simplify_utils import simplify_geometries
+
+
+def _circles(radii: list[float]) -> np.ndarray:
+    return shapely.buffer(
+        shapely.points(np.zeros(len(radii)), np.zeros(len(radii))), radii, quad_segs=64
+    )
+
+
+def test_vertex_mode_bounds_vertex_count():
+    geoms = _circles([0.1, 1.0, 5.0])
+
+    simplified, stats = simplify_geometries(geoms, 0.01, mode="vertices", target_vertices=100)
+
+    assert shapely.get_num_coordinates(simplified).max() <= 100
+    assert stats.vertices_after < stats.vertices_before
+    assert shapely.is_valid(simplified).all()
+
+
+def test_area_mode_keeps_small_geometries_detailed():
+    geoms = _circles([0.05, 5.0])
+
+    fixed, _ = simplify_geometries(geoms, 0.01, mode="fixed")
+    adaptive, _ = simplify_geometries(geoms, 0.01, mode="area", min_tolerance=0.0)
+
+    assert shapely.get_num_coordinates(adaptive[0]) >= shapely.get_num_coordinates(fixed[0])
@@ -0,0 +1,55 @@
+import json
+
+import geopandas as gpd
+import numpy as np
+import pytest
+from shapely.geometry import Polygon, box
+
+from civic_data_boundaries_us_forests.utils import summary_utils
+from civic_data_boundaries_us_forests.utils.config_utils import LayerConfig
+from civic_data_boundaries_us_forests.utils.simplify_utils import SimplifyStats
+
+
+def test_geodesic_areas_ignore_winding_order():
+    square = box(-100.0, 40.0, -99.0, 41.0)
+    clockwise = Polygon(list(square.exterior.coords)[::-1])
+    with_hole = square.difference(box(-99.8, 40.2, -99.2, 40.8))
+
+    areas = summary_utils.geodesic_areas(np.array([square, clockwise, with_hole, None]))
+
+    assert 9_300 < areas[0] < 9_500  # about 84 km x 111 km at 40.5° N
+    assert areas[1] == areas[0]
+    assert 0 < areas[2] < areas[0]
+    assert areas[3] == pytest.approx(0.0)
+
+
+def test_write_summary_aggregates_per_layer(tmp_path, monkeypatch):
+    monkeypatch.setattr(summary_utils, "get_repo_root", lambda: tmp_path)
+    monkeypatch.setattr(summary_utils, "get_cache_dir", lambda: tmp_path / "data-cache")
+    layer = LayerConfig(name="us-forests", output_dir="forests", split_by="FORESTNAME")
+    forests = tmp_path / "data-out" / "forests"
+    forests.mkdir(parents=True)
+    for name, region, geom in [("a", "01", box(0, 0, 1, 1)), ("b", "02", box(2, 2, 3, 3))]:
+        gdf = gpd.GeoDataFrame(
+            {"FORESTNAME": [name], "REGION": [region], "GIS_ACRES": [10.0]},
+            geometry=[geom],
+            crs="EPSG:4326",
+        )
+        gdf.to_file(forests / f"{name}.geojson", driver="GeoJSON")
+
+    summary_utils.record_simplify_stats(SimplifyStats("fixed", 2, 40, 10), layer="us-forests")
+    summary_utils.write_simplify_stats()
+    index = [
+        {"path": "data-out/forests/a.geojson", "format": "geojson"},
+        {"path": "data-out/forests/b.geojson", "format": "geojson"},
+        {"path": "data-out/labels/us-forests.geojson", "format": "geojson"},
+    ]
+    path = summary_utils.write_summary(index, [layer], tmp_path, workers=1)
+
+    summary = json.loads(path.read_text())["layers"]["us-forests"]
+    assert (summary["files"], summary["features"], summary["vertices"]) == (2, 2, 10)
+    assert 0 < summary["gzip_bytes"] < summary["bytes"]
+    assert summary["area_km2"]["total"] > 0
+    assert summary["simplification"]["ratio"] == pytest.approx(0.25)
+    assert summary["attributes"]["REGION"]["top"] == {"01": 1, "02": 1}
+    assert summary["attributes"]["GIS_ACRES"]["sum"] == pytest.approx(20.0)
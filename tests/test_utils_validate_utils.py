@@ -0,0 +1,45 @@
+import geopandas as gpd
+import numpy as np
+import shapely
+from shapely.geometry import Polygon, box
+
+from civic_data_boundaries_us_forests.utils.validate_utils import find_issues, validate_gdf
+
+
+def test_find_issues_flags_each_problem():
+    ok = box(0, 0, 1, 1)  # shapely's box is counter-clockwise
+    clockwise = Polygon([(0, 0), (0, 1), (1, 1), (1, 0)])
+    bowtie = Polygon([(0, 0), (1, 1), (1, 0), (0, 1)])
+    repeated = Polygon([(0, 0), (1, 0), (1, 0), (1, 1), (0, 1)])
+    empty = Polygon()
+
+    issues = find_issues(np.array([ok, clockwise, bowtie, repeated, empty, None]))
+
+    assert issues["orientation"].tolist() == [False, True, False, False, False, False]
+    assert issues["invalid"].tolist() == [False, False, True, False, False, False]
+    assert issues["repeated_points"].tolist() == [False, False, False, True, False, False]
+    assert issues["empty"].tolist() == [False, False, False, False, True, True]
+
+
+def test_validate_gdf_repairs_only_flagged_features():
+    ok = box(0, 0, 1, 1)
+    clockwise = Polygon([(2, 2), (2, 3), (3, 3), (3, 2)])
+    bowtie = Polygon([(0, 0), (1, 1), (1, 0), (0, 1)])
+    gdf = gpd.GeoDataFrame(
+        {"NAME": ["ok", "cw", "bowtie", "empty"]},
+        geometry=[ok, clockwise, bowtie, Polygon()],
+        crs="EPSG:4326",
+    )
+
+    result, row = validate_gdf(gdf)
+
+    assert result["NAME"].tolist() == ["ok", "cw", "bowtie"]
+    assert result.geometry.iloc[0] is ok
+    assert shapely.is_valid(result.geometry.values).all()
+    assert not find_issues(result.geometry.values)["orientation"].any()
+    assert (row["repaired"], row["dropped"], row["still_invalid"]) == (2, 1, 0)
+    assert row["invalid_reasons"] == {"Self-intersection": 1}
+
+    unchanged, check_only = validate_gdf(gdf, repair=False)
+    assert unchanged is gdf
+    assert check_only["invalid"] == 1 and check_only["repaired"] == 0
@@ -0,0 +1,63 @@
+import threading
+import time
+
+import geopandas as gpd
+import pytest
+from shapely.geometry import box
+
+from civic_data_boundaries_us_forests.utils.export_utils import geojson_bytes
+from civic_data_boundaries_us_forests.utils.write_pipeline import WritePipeline
+
+
+def _groups(count):
+    return [
+        gpd.GeoDataFrame({"NAME": [f"g{i}"]}, geometry=[box(i, 0, i + 1, 1)], crs="EPSG:4326")
+        for i in range(count)
+    ]
+
+
+def test_pipeline_writes_same_bytes_as_serializer(tmp_path):
+    groups = _groups(5)
+    with WritePipeline(geojson_bytes, serializers=2, max_pending=2) as writer:
+        for i, gdf in enumerate(groups):
+            writer.submit(gdf, tmp_path / f"g{i}.geojson")
+
+    for i, gdf in enumerate(groups):
+        assert (tmp_path / f"g{i}.geojson").read_bytes() == geojson_bytes(gdf, f"g{i}")
+    assert (writer.stats.files, writer.stats.features) == (5, 5)
+    assert writer.stats.mb_per_s > 0
+
+
+def test_submit_blocks_at_max_pending(tmp_path):
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def slow_serialize(gdf, name):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        return b"{}"
+
+    with WritePipeline(slow_serialize, serializers=4, max_pending=2) as writer:
+        for i, gdf in enumerate(_groups(8)):
+            writer.submit(gdf, tmp_path / f"g{i}.geojson")
+
+    assert peak <= 2
+    assert writer.stats.files == 8
+
+
+def test_serializer_error_is_raised_on_close(tmp_path):
+    def broken(gdf, name):
+        raise ValueError(f"cannot encode {name}")
+
+    writer = WritePipeline(broken, serializers=1, max_pending=1)
+    writer.submit(_groups(1)[0], tmp_path / "g0.geojson")
+    with pytest.raises(ValueError, match="cannot encode g0"):
+        writer.close()
+
+    assert not (tmp_path / "g0.geojson").exists()
@@ -0,0 +1,57 @@
+import io
+import zipfile
+
+import pytest
+
+from civic_data_boundaries_us_forests.utils.zip_stream import (
+    StreamingZipExtractor,
+    ZipStreamError,
+)
+
+MEMBERS = {"x.shp": b"shape" * 5000, "x.dbf": b"table" * 3000, "x.shp.xml": b"<metadata/>"}
+
+
+class _Unseekable(io.RawIOBase):
+    """Forces zipfile to write data descriptors, like a streamed server archive."""
+
+    def __init__(self) -> None:
+        self.buffer = io.BytesIO()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        return self.buffer.write(b)
+
+
+def _feed(archive: bytes, extractor: StreamingZipExtractor, step: int = 777) -> None:
+    for start in range(0, len(archive), step):
+        extractor.feed(archive[start : start + step])
+    extractor.close()
+
+
+def test_streams_wanted_members_with_data_descriptors(tmp_path):
+    sink = _Unseekable()
+    with zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in MEMBERS.items():
+            archive.writestr(name, data)
+
+    extractor = StreamingZipExtractor(tmp_path)
+    _feed(sink.buffer.getvalue(), extractor)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["x.dbf", "x.shp"]
+    assert (tmp_path / "x.shp").read_bytes() == MEMBERS["x.shp"]
+    assert extractor.skipped == ["x.shp.xml"]
+
+
+def test_corrupt_member_fails_crc_and_leaves_no_file(tmp_path):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as archive:
+        archive.writestr("x.shp", MEMBERS["x.shp"])
+    corrupt = bytearray(buffer.getvalue())
+    corrupt[100] ^= 0xFF
+
+    with pytest.raises(ZipStreamError):
+        _feed(bytes(corrupt), StreamingZipExtractor(tmp_path))
+
+    assert list(tmp_path.iterdir()) == []